@@ -1,7 +1,12 @@
 
-import time
 import sys
 
+# Relógio global do jogo (pausas podem ser aceleradas ou puladas)
+try:
+    from utils.relogio import dormir
+except ImportError:
+    from time import sleep as dormir
+
 # Tentar importar utils para cores
 try:
     from utils.terminal_kali import C
@@ -16,14 +21,30 @@ except ImportError:
         ROXO = '\033[95m'
         RESET = '\033[0m'
 
+from utils.layout import layout
+from utils.tela import tela
+from utils.sessao_io import sessao_atual, na_sessao
+
+# Diário de eventos do save (compras e histórico de transações)
+try:
+    from utils.diario import diario_de
+except ImportError:
+    diario_de = None
+
 class BitcoinSystem:
-    def __init__(self, menu_interface):
+    def __init__(self, menu_interface, io=None):
         """
         Inicializa o sistema de Bitcoin e Mercado.
         :param menu_interface: Instância da classe IntroMenu (para acessar métodos de UI e Save)
+        :param io: Sessão de E/S (padrão: a do menu)
         """
         self.menu = menu_interface
-        self.term_width = getattr(menu_interface, 'term_width', 100)
+        self.io = io or getattr(menu_interface, 'io', None) or sessao_atual()
+
+    @property
+    def term_width(self):
+        # Lido do menu a cada uso para acompanhar redimensionamentos
+        return getattr(self.menu, 'term_width', 100)
 
     def _limpar_tela(self):
         if hasattr(self.menu, '_limpar_tela'):
@@ -33,34 +54,50 @@ class BitcoinSystem:
 
     def _mostrar_erro(self, msg):
         print(f"\n{' ' * ((self.term_width - 30) // 2)}{C.VERMELHO}{msg}{C.RESET}")
-        time.sleep(1.5)
+        dormir(1.5)
 
+    def _quadro_carteira(self, btc):
+        """Monta as linhas da tela da carteira"""
+        caixa = layout.centralizar_bloco([
+            "╔══════════════════════════════════════╗",
+            "║        CARTEIRA & MERCADO            ║",
+            "╚══════════════════════════════════════╝",
+        ])
+        quadro = [""] + [f"{C.AMARELO}{linha}" for linha in caixa]
+        quadro[-1] += C.RESET
+        
+        # Valor fictício do BTC para imersão
+        valor_usd = btc * 45000  
+        
+        margem = layout.margem(40)
+        quadro += [
+            "",
+            f"{margem}{C.CIANO}Saldo: {C.VERDE}{btc:.6f} BTC",
+            f"{margem}{C.CIANO}Valor est.: {C.VERDE}US$ {valor_usd:.2f}{C.RESET}",
+            "",
+            f"{margem}{C.CINZA}{'─' * 36}{C.RESET}",
+            "",
+        ]
+        
+        # Opções
+        quadro += layout.centralizar_bloco([
+            f"{C.BRANCO}[1] {C.CINZA}Transferir Bitcoin",
+            f"{C.BRANCO}[2] {C.ROXO}ACESSAR MERCADO NEGRO (Darknet)",
+            f"{C.BRANCO}[3] {C.CINZA}Ver Histórico",
+            f"{C.BRANCO}[0] {C.CINZA}Voltar{C.RESET}",
+        ])
+        return quadro
+
+    @na_sessao
     def mostrar_carteira(self, dados_jogador, arquivo_save):
         """Mostra a carteira de Bitcoin e Mercado Negro"""
         while True:
-            self._limpar_tela()
-            
-            print(f"\n{' ' * ((self.term_width - 40) // 2)}{C.AMARELO}╔══════════════════════════════════════╗")
-            print(f"{' ' * ((self.term_width - 40) // 2)}{C.AMARELO}║        CARTEIRA & MERCADO            ║")
-            print(f"{' ' * ((self.term_width - 40) // 2)}{C.AMARELO}╚══════════════════════════════════════╝{C.RESET}\n")
-            
             btc = dados_jogador.get('bitcoin_wallet', 0.005)
-            # Valor fictício do BTC para imersão
-            valor_usd = btc * 45000  
-            
-            print(f"{' ' * ((self.term_width - 40) // 2)}{C.CIANO}Saldo: {C.VERDE}{btc:.6f} BTC")
-            print(f"{' ' * ((self.term_width - 40) // 2)}{C.CIANO}Valor est.: {C.VERDE}US$ {valor_usd:.2f}{C.RESET}")
-            
-            print(f"\n{' ' * ((self.term_width - 40) // 2)}{C.CINZA}{'─' * 36}{C.RESET}")
-            
-            # Opções
-            print(f"\n{' ' * ((self.term_width - 35) // 2)}{C.BRANCO}[1] {C.CINZA}Transferir Bitcoin")
-            print(f"{' ' * ((self.term_width - 35) // 2)}{C.BRANCO}[2] {C.ROXO}ACESSAR MERCADO NEGRO (Darknet)")
-            print(f"{' ' * ((self.term_width - 35) // 2)}{C.BRANCO}[3] {C.CINZA}Ver Histórico")
-            print(f"{' ' * ((self.term_width - 35) // 2)}{C.BRANCO}[0] {C.CINZA}Voltar{C.RESET}")
+            # Quadro em cache por saldo e tamanho do terminal
+            tela.renderizar(layout.quadro(('carteira', btc), lambda: self._quadro_carteira(btc)))
             
             try:
-                escolha = input(f"\n{' ' * ((self.term_width - 20) // 2)}{C.BRANCO}> {C.RESET}").strip()
+                escolha = self.io.ler(f"\n{' ' * ((self.term_width - 20) // 2)}{C.BRANCO}> {C.RESET}").strip()
             except (KeyboardInterrupt, EOFError):
                 break
             
@@ -69,10 +106,11 @@ class BitcoinSystem:
             elif escolha == "2":
                 self.mercado_negro(dados_jogador, arquivo_save)
             elif escolha == "3":
-                self.ver_historico(dados_jogador)
+                self.ver_historico(dados_jogador, arquivo_save)
             elif escolha == "0":
                 break
 
+    @na_sessao
     def mercado_negro(self, dados_jogador, arquivo_save):
         """Implementação do Mercado Negro"""
         # Itens disponíveis
@@ -105,7 +143,7 @@ class BitcoinSystem:
             print(f"\n{' ' * ((self.term_width - 35) // 2)}{C.BRANCO}[0] {C.CINZA}Voltar{C.RESET}")
             
             try:
-                escolha = input(f"\n{' ' * ((self.term_width - 20) // 2)}{C.BRANCO}COMPRAR > {C.RESET}").strip()
+                escolha = self.io.ler(f"\n{' ' * ((self.term_width - 20) // 2)}{C.BRANCO}COMPRAR > {C.RESET}").strip()
             except (KeyboardInterrupt, EOFError):
                 break
             
@@ -127,7 +165,7 @@ class BitcoinSystem:
                     if saldo >= item['custo']:
                         # Comprar
                         print(f"\n{' ' * ((self.term_width - 40) // 2)}{C.AMARELO}Processando transação na Blockchain...{C.RESET}")
-                        time.sleep(1.5)
+                        dormir(1.5)
                         
                         dados_jogador['bitcoin_wallet'] = saldo - item['custo']
                         dados_jogador.setdefault('inventory', []).append(item['id'])
@@ -136,12 +174,22 @@ class BitcoinSystem:
                         if "Privacidade" in item['nome']:
                             dados_jogador['privacy_level'] = min(100, dados_jogador.get('privacy_level', 50) + 10)
                             
-                        # Salvar através do menu principal
-                        if hasattr(self.menu, '_salvar_jogo'):
+                        # Compra vai para o diário (append); snapshot só quando acumular
+                        if diario_de is not None and arquivo_save:
+                            diario = diario_de(arquivo_save)
+                            diario.registrar('compra', {
+                                'bitcoin_wallet': dados_jogador['bitcoin_wallet'],
+                                'inventory': dados_jogador['inventory'],
+                                'privacy_level': dados_jogador.get('privacy_level', 50),
+                            }, item=item['id'], custo=item['custo'])
+                            if diario.precisa_compactar:
+                                self.menu._salvar_jogo(dados_jogador, arquivo_save)
+                        elif hasattr(self.menu, '_salvar_jogo'):
+                            # Salvar através do menu principal
                             self.menu._salvar_jogo(dados_jogador, arquivo_save)
                         
                         print(f"\n{' ' * ((self.term_width - 40) // 2)}{C.VERDE}COMPRA REALIZADA COM SUCESSO!{C.RESET}")
-                        time.sleep(1)
+                        dormir(1)
                     else:
                         self._mostrar_erro("Saldo insuficiente!")
                 else:
@@ -152,10 +200,15 @@ class BitcoinSystem:
     def transferir_bitcoin(self, dados_jogador, arquivo_save):
         """Simula transferência de Bitcoin"""
         print(f"\n{' ' * ((self.term_width - 40) // 2)}{C.VERDE}Funcionalidade em desenvolvimento...{C.RESET}")
-        time.sleep(1.5)
+        dormir(1.5)
     
-    def ver_historico(self, dados_jogador):
+    def ver_historico(self, dados_jogador, arquivo_save=None):
         """Mostra histórico de transações"""
         print(f"\n{' ' * ((self.term_width - 40) // 2)}{C.VERDE}Histórico de transações:{C.RESET}")
-        print(f"{' ' * ((self.term_width - 50) // 2)}{C.CINZA}Nenhuma transação encontrada.{C.RESET}")
-        input(f"\n{' ' * ((self.term_width - 25) // 2)}{C.CINZA}[ENTER PARA VOLTAR]{C.RESET}")
+        compras = list(diario_de(arquivo_save).historico('compra')) if (diario_de and arquivo_save) else []
+        if not compras:
+            print(f"{' ' * ((self.term_width - 50) // 2)}{C.CINZA}Nenhuma transação encontrada.{C.RESET}")
+        for compra in compras:
+            print(f"{' ' * ((self.term_width - 50) // 2)}{C.CINZA}{compra['quando'][:16].replace('T', ' ')}  "
+                  f"{C.BRANCO}{compra['item']:<14} {C.VERMELHO}-{compra['custo']:.4f} BTC{C.RESET}")
+        self.io.ler(f"\n{' ' * ((self.term_width - 25) // 2)}{C.CINZA}[ENTER PARA VOLTAR]{C.RESET}")
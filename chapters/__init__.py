@@ -16,6 +16,7 @@ Capítulos Disponíveis:
 import os
 import sys
 import importlib
+import threading
 import json
 from pathlib import Path
 from datetime import datetime
@@ -40,26 +41,141 @@ except ImportError:
         RESET = '\033[0m'
 
 
+# ========== REGISTRO DE CAPÍTULOS ==========
+
+class RegistroCapitulos:
+    """
+    Descobre os arquivos chapter_*.py uma vez e guarda os módulos já
+    importados. Um capítulo só é reimportado quando o mtime do arquivo
+    muda (edição durante o jogo); repetir ou continuar um capítulo não
+    executa o módulo de novo. A pasta só é relida quando o mtime dela
+    muda (capítulo novo adicionado).
+    """
+    
+    def __init__(self, diretorio=None, pacote=__name__):
+        self.diretorio = diretorio or os.path.dirname(os.path.abspath(__file__))
+        self.pacote = pacote
+        self._mtime_pasta = None
+        self._capitulos = {}
+        self._modulos = {}
+        self._trava = threading.RLock()
+    
+    def _descobrir(self):
+        try:
+            mtime = os.stat(self.diretorio).st_mtime_ns
+        except OSError:
+            self._mtime_pasta, self._capitulos = None, {}
+            return self._capitulos
+        if mtime != self._mtime_pasta:
+            capitulos = {}
+            for arquivo in os.listdir(self.diretorio):
+                if not (arquivo.startswith('chapter_') and arquivo.endswith('.py')):
+                    continue
+                nome = arquivo[:-3]  # Remove .py
+                try:
+                    numero = int(nome.split('_')[1])
+                except (IndexError, ValueError):
+                    continue
+                capitulos[numero] = {
+                    'arquivo': os.path.join(self.diretorio, arquivo),
+                    'numero': numero,
+                    'nome': nome
+                }
+            self._capitulos = capitulos
+            self._mtime_pasta = mtime
+        return self._capitulos
+    
+    def capitulos(self):
+        """Capítulos disponíveis ({'arquivo', 'numero', 'nome'}), em ordem"""
+        with self._trava:
+            return [self._descobrir()[numero] for numero in sorted(self._descobrir())]
+    
+    def existe(self, numero):
+        with self._trava:
+            return numero in self._descobrir()
+    
+    def _em_cache(self, numero):
+        """Módulo em cache ainda válido (mesmo mtime), ou None"""
+        em_cache = self._modulos.get(numero)
+        capitulo = self._descobrir().get(numero)
+        if em_cache is None or capitulo is None:
+            return None
+        try:
+            if os.stat(capitulo['arquivo']).st_mtime_ns == em_cache[0]:
+                return em_cache[1]
+        except OSError:
+            pass
+        return None
+    
+    def carregar(self, numero):
+        """
+        Módulo do capítulo, importado na primeira vez e reaproveitado
+        enquanto o arquivo não mudar. Lança ImportError se não existir.
+        """
+        with self._trava:
+            capitulo = self._descobrir().get(numero)
+            if capitulo is None:
+                raise ImportError(f"chapter_{numero:02d} não encontrado em {self.diretorio}")
+            mtime = os.stat(capitulo['arquivo']).st_mtime_ns
+            
+            em_cache = self._modulos.get(numero)
+            if em_cache is not None and em_cache[0] == mtime:
+                return em_cache[1]
+            
+            if em_cache is None:
+                modulo = importlib.import_module(f"{self.pacote}.{capitulo['nome']}")
+            else:
+                # Arquivo editado: reimporta (o .pyc velho é descartado pelo mtime)
+                importlib.invalidate_caches()
+                modulo = importlib.reload(em_cache[1])
+            self._modulos[numero] = (mtime, modulo)
+            return modulo
+    
+    def precarregar(self, numero):
+        """
+        Importa o capítulo numa thread em segundo plano, enquanto o
+        anterior ainda está em jogo. Retorna a thread (ou None se o
+        capítulo não existe ou já está em cache).
+        """
+        with self._trava:
+            if not self.existe(numero) or self._em_cache(numero) is not None:
+                return None
+        thread = threading.Thread(target=self._precarregar, args=(numero,),
+                                  name=f"precarga-capitulo-{numero}", daemon=True)
+        thread.start()
+        return thread
+    
+    def _precarregar(self, numero):
+        try:
+            self.carregar(numero)
+        except Exception:
+            # O erro aparece de novo (e é mostrado) quando o capítulo for aberto
+            pass
+    
+    def esquecer(self, numero=None):
+        """Descarta o módulo em cache (todos, sem número)"""
+        with self._trava:
+            if numero is None:
+                self._modulos.clear()
+                self._mtime_pasta = None
+            else:
+                self._modulos.pop(numero, None)
+
+
+# Registro compartilhado (menu principal e funções abaixo)
+registro_capitulos = RegistroCapitulos()
+
+
 # ========== FUNÇÕES UTILITÁRIAS ==========
 
 def listar_capitulos():
     """Lista todos os capítulos disponíveis no pacote."""
-    capitulos = []
-    
-    # Procura por arquivos chapter_*.py no diretório
-    diretorio = os.path.dirname(__file__)
-    for arquivo in os.listdir(diretorio):
-        if arquivo.startswith('chapter_') and arquivo.endswith('.py'):
-            nome = arquivo[:-3]  # Remove .py
-            numero = int(nome.split('_')[1])
-            capitulos.append((numero, nome))
-    
-    return sorted(capitulos, key=lambda x: x[0])
+    return [(capitulo['numero'], capitulo['nome']) for capitulo in registro_capitulos.capitulos()]
 
 
 def carregar_capitulo(numero):
     """
-    Carrega um capítulo específico dinamicamente.
+    Carrega um capítulo específico (do cache do registro, se não mudou).
     
     Args:
         numero: Número do capítulo (ex: 1 para chapter_01)
@@ -67,18 +183,14 @@ def carregar_capitulo(numero):
     Returns:
         Módulo do capítulo ou None se não encontrado
     """
-    nome_capitulo = f'chapter_{numero:02d}'
-    
     try:
-        # Tentar importar o capítulo
-        modulo = importlib.import_module(f'.{nome_capitulo}', package=__name__)
-        return modulo
+        return registro_capitulos.carregar(numero)
     except ImportError as e:
         print(f"{C.VERMELHO}[!] Capítulo {numero} não encontrado: {e}{C.RESET}")
         return None
 
 
-def executar_capitulo(numero, dados_jogador, arquivo_save):
+def executar_capitulo(numero, dados_jogador, arquivo_save, io=None):
     """
     Executa um capítulo específico.
     
@@ -86,6 +198,7 @@ def executar_capitulo(numero, dados_jogador, arquivo_save):
         numero: Número do capítulo
         dados_jogador: Dicionário com dados do personagem
         arquivo_save: Caminho do arquivo de save
+        io: Sessão de E/S do jogador (padrão: stdin/stdout)
     
     Returns:
         Dicionário com dados atualizados do jogador ou None se erro
@@ -100,7 +213,7 @@ def executar_capitulo(numero, dados_jogador, arquivo_save):
         return None
     
     try:
-        resultado = modulo.iniciar(dados_jogador, arquivo_save)
+        resultado = modulo.iniciar(dados_jogador, arquivo_save, io=io)
         return resultado
     except Exception as e:
         print(f"{C.VERMELHO}[!] Erro ao executar capítulo {numero}: {e}{C.RESET}")
@@ -232,6 +345,8 @@ def validar_capitulos():
 
 # Exportar funções principais
 __all__ = [
+    'RegistroCapitulos',
+    'registro_capitulos',
     'listar_capitulos',
     'carregar_capitulo',
     'executar_capitulo',
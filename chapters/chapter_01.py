@@ -12,13 +12,29 @@ Decisão Crítica: Preservar ou destruir as evidências?
 
 import os
 import sys
-import time
 import random
 import json
 import shutil
+import threading
 from datetime import datetime
 from pathlib import Path
 
+# Relógio global do jogo (pausas podem ser aceleradas ou puladas)
+try:
+    from utils.relogio import dormir
+except ImportError:
+    from time import sleep as dormir
+
+# Serviço de saves (gravação atômica) e diário de eventos do jogador
+try:
+    from utils.saves import servico_saves
+    from utils.diario import diario_de
+    from utils.autosave import autosave
+except ImportError:
+    servico_saves = None
+    diario_de = None
+    autosave = None
+
 # Importar dependências
 try:
     from utils.terminal_kali import C
@@ -40,7 +56,11 @@ except ImportError:
 class GameState:
     """Gerencia o estado durante o capítulo"""
     
-    def __init__(self, dados_jogador):
+    def __init__(self, dados_jogador, diario=None):
+        # Dados de fora do capítulo (inventário, carteira...) voltam intactos no to_dict
+        self.dados_base = dict(dados_jogador)
+        self.diario = diario
+        
         self.player_name = dados_jogador.get('player_name', 'Neo')
         self.codinome = dados_jogador.get('codiname', 'SHADOW_00')
         self.bitcoin_wallet = dados_jogador.get('bitcoin_wallet', 0.005)
@@ -68,6 +88,7 @@ class GameState:
         """Registra uma falha e aplica penalidade"""
         self.erros += 1
         self.privacy_level = max(0, self.privacy_level - penalidade)
+        self._registrar_evento('falha', {'privacy_level': self.privacy_level}, penalidade=penalidade)
         
         if self.erros >= self.max_erros:
             self.game_over = True
@@ -76,10 +97,27 @@ class GameState:
         """Registra sucesso e aplica bônus"""
         self.score += bonus
         self.privacy_level = min(100, self.privacy_level + (bonus // 2))
+        self._registrar_evento('sucesso', {'score': self.score, 'privacy_level': self.privacy_level}, bonus=bonus)
+    
+    def _registrar_evento(self, tipo, definir, **info):
+        """Anota o evento no diário do save (append; o snapshot fica para a compactação)"""
+        if self.diario is None:
+            return
+        try:
+            self.diario.registrar(tipo, definir, capitulo=1, **info)
+            if self.diario.precisa_compactar:
+                salvar_save(self.diario.arquivo_save, self.to_dict())
+        except OSError:
+            pass
     
     def to_dict(self):
         """Converte para dicionário para salvar"""
         return {
+            **self.dados_base,
+            'bitcoin_wallet': self.bitcoin_wallet,
+            'privacy_level': self.privacy_level,
+            'reputation': self.reputation,
+            'score': self.score,
             'player_name': self.player_name,
             'codiname': self.codinome,
             'capitulo_1_resultado': self.decisao_final,
@@ -94,7 +132,7 @@ class GameState:
 
 def limpar_tela():
     """Limpa a tela do terminal"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    tela.limpar()
 
 
 def obter_largura_terminal():
@@ -108,6 +146,14 @@ def obter_largura_terminal():
 
 # Usar a função padronizada de digitação do utils
 from utils.terminal_kali import digitar as _digitar_padrao
+from utils.tela import tela
+
+# Sessão de E/S do jogador: o `iniciar` aceita io=SessaoIO
+from utils.sessao_io import com_sessao, sessao_atual, sessao_padrao
+from utils.roda_temporizadores import agendar
+
+# Missões declaradas como dados (etapas + regras), interpretadas por um único motor
+from utils.missoes import Missao, Etapa, Regra, SUCESSO, FALHA, MENU, comando
 
 def digitar(texto, delay=0.01, cor=C.BRANCO, fim="\n"):
     """Wrapper compatível que encaminha para `utils.terminal_kali.digitar`."""
@@ -117,19 +163,19 @@ def digitar(texto, delay=0.01, cor=C.BRANCO, fim="\n"):
 def sucesso(mensagem):
     """Mostra mensagem de sucesso"""
     print(f"{C.VERDE}[✓] {mensagem}{C.RESET}")
-    time.sleep(0.5)
+    dormir(0.5)
 
 
 def erro(mensagem):
     """Mostra mensagem de erro"""
     print(f"{C.VERMELHO}[!] {mensagem}{C.RESET}")
-    time.sleep(0.5)
+    dormir(0.5)
 
 
 def aviso(mensagem):
     """Mostra mensagem de aviso"""
     print(f"{C.AMARELO}[*] {mensagem}{C.RESET}")
-    time.sleep(0.3)
+    dormir(0.3)
 
 
 def prompt_kali(codinome):
@@ -154,8 +200,8 @@ def header_kali_v2():
     print(f"{C.VERDE}{'═' * largura}{C.RESET}\n")
 
 
-def exibir_proximidade(estagio):
-    """Exibe visualmente o quão perto Juliana está"""
+def texto_proximidade(estagio):
+    """Quadro de proximidade de Juliana (texto, para exibir ou mandar à sessão)"""
     estagios = [
         "[ ○○○○○○○○○ ]   Juliana ainda dorme...",
         "[ ●○○○○○○○○ ]   Juliana está mexendo na cama...",
@@ -169,8 +215,12 @@ def exibir_proximidade(estagio):
     idx = min(estagio, len(estagios) - 1)
     cor = C.VERMELHO if estagio >= 5 else (C.AMARELO if estagio >= 3 else C.CINZA)
     
-    print(f"\n{cor}{C.NEGRITO}PROXIMIDADE DE JULIANA:{C.RESET}")
-    print(f"{cor}{estagios[idx]}{C.RESET}\n")
+    return f"\n{cor}{C.NEGRITO}PROXIMIDADE DE JULIANA:{C.RESET}\n{cor}{estagios[idx]}{C.RESET}\n"
+
+
+def exibir_proximidade(estagio):
+    """Exibe visualmente o quão perto Juliana está"""
+    print(texto_proximidade(estagio))
 
 
 def mostrar_arquivos_descobertos():
@@ -179,86 +229,246 @@ def mostrar_arquivos_descobertos():
     print(f"{C.VERMELHO}.conversa_hotel_nobile.pdf{C.RESET} | {C.VERMELHO}.fotos_reserva_dupla.zip{C.RESET}")
     print(f"{C.VERMELHO}─────────────────────────────────────────────────────{C.RESET}")
     print()
-    time.sleep(2)
+    dormir(2)
     
     print(f"{C.NEGRITO}{C.VERMELHO}* MALDIÇÃO... O RANGER DA CAMA... JULIANA ACORDOU! *{C.RESET}")
-    time.sleep(1.5)
+    dormir(1.5)
     
     digitar(f"\n{C.BRANCO}Juliana: '...Amor? Ainda acordado? O que você está fazendo?'{C.RESET}", cor=C.BRANCO, delay=0.05)
-    time.sleep(1)
+    dormir(1)
+
+
+# ========== SAVE ==========
+
+def salvar_save(arquivo_save, dados, confirmar=False):
+    """
+    Grava o save como snapshot do diário, em segundo plano (ou direto, se
+    indisponível). Com `confirmar`, espera a gravação e relança o erro dela,
+    para só então dizer ao jogador que o progresso foi salvo.
+    """
+    if autosave is not None:
+        autosave.agendar(arquivo_save, dados)
+        if confirmar:
+            autosave.descarregar(arquivo_save, esperar=True)
+        return
+    Path(arquivo_save).parent.mkdir(parents=True, exist_ok=True)
+    with open(arquivo_save, 'w', encoding='utf-8') as f:
+        json.dump(dados, f, indent=2, ensure_ascii=False)
 
 
 # ========== SISTEMA DE PROMPTS ==========
 
+# Segundos (tempo real, na escala do relógio) até Juliana avançar um estágio sozinha
+PRAZO_ESTAGIO = 12
+
+
+def _voltar_ao_menu(state, arquivo_save):
+    print(f"\n{C.AMARELO}[*] Salvando checkpoint e retornando ao menu...{C.RESET}")
+    if arquivo_save:
+        try:
+            salvar_save(arquivo_save, state.to_dict(), confirmar=True)
+            print(f"{C.VERDE}[✓] Progresso salvo!{C.RESET}")
+        except Exception as e:
+            print(f"{C.VERMELHO}[!] Erro ao salvar: {e}{C.RESET}")
+    dormir(0.5)
+    state.saindo_para_menu = True
+    return MENU
+
+
+def _consultar_manual(state):
+    try:
+        from manual_hacking import exibir_banner
+        exibir_banner()
+    except:
+        print(f"{C.CINZA}Manual não disponível{C.RESET}")
+    print(f"\n{C.AMARELO}[*] VOCÊ PERDEU TEMPO CONSULTANDO O MANUAL!{C.RESET}")
+    state.erros += 1
+    if state.game_over:
+        return FALHA
+    return "MANUAL"
+
+
+def _conexao_interrompida(state, excecao):
+    if isinstance(excecao, KeyboardInterrupt):
+        print(f"\n{C.VERMELHO}[!] CONEXÃO INTERROMPIDA{C.RESET}")
+        state.game_over = True
+    return FALHA
+
+
+def _anotar_comando(ctx):
+    ctx.state.comandos_digitados.append(ctx.cmd)
+
+
+def _comando_incorreto(ctx):
+    if ctx.esgotado:
+        return None
+    erro(f"Comando incorreto. ({ctx.erros}/{ctx.etapa.tentativas})")
+    print(f"{C.VERMELHO}[!] Ela ouviu o barulho do teclado e se levantou da cama!{C.RESET}")
+    dormir(0.3)
+
+
+def missao_comando(cmd_expect, pensamento, fatigue=5, arquivo_save=None, max_tentativas=3):
+    """Missão de um comando só: acertar `cmd_expect` em até `max_tentativas`"""
+    def globais(cmd, state):
+        # Comando para voltar ao menu
+        if cmd.lower() == 'menu':
+            return _voltar_ao_menu(state, arquivo_save)
+        # Comando para acessar manual
+        if cmd.lower() in ['manual', 'help', '?']:
+            return _consultar_manual(state)
+        return None
+
+    return Missao("COMANDO", [
+        Etapa("comando", [
+            Regra(comando(cmd_expect), saida=lambda ctx: sucesso("Comando executado com sucesso!"), pontos=10, ir=SUCESSO),
+        ], erro=Regra(efeito=_anotar_comando, saida=_comando_incorreto, penalidade=fatigue, tentativa=True),
+           tentativas=max_tentativas,
+           esgotou=Regra(saida=lambda ctx: erro("Muitas tentativas erradas!"), ir=FALHA),
+           antes=lambda ctx: print(f"\n{C.CINZA}# DICA: {pensamento}{C.RESET}")),
+    ], prompt=lambda state: prompt_kali(state.codinome), globais=globais,
+       ao_interromper=_conexao_interrompida)
+
+
 def prompt_until(cmd_expect, pensamento, state, fatigue=5, arquivo_save=None):
     """Solicita um comando específico até acertar. Digite 'menu' para voltar ao menu salvando."""
-    tentativas = 0
-    max_tentativas = 3
+    return missao_comando(cmd_expect, pensamento, fatigue, arquivo_save).executar(state) == SUCESSO
+
+
+class Pressao:
+    """
+    Juliana se aproximando em tempo real: cada estágio vence num prazo
+    agendado na roda de temporizadores (laço único, compartilhado por
+    todas as sessões). Quando vence, o aviso vai direto para a sessão do
+    jogador, mesmo com ele no meio da digitação; comandos errados e o
+    manual adiantam os estágios e reiniciam o prazo.
+    """
     
-    while True:
-        print(f"\n{C.CINZA}# DICA: {pensamento}{C.RESET}")
-        
+    def __init__(self, estagio, limite, prompt, io=None, prazo=None):
+        self.estagio = estagio
+        self.limite = limite
+        self.prompt = prompt
+        self.io = io if io is not None else sessao_atual()
+        self.prazo = prazo if prazo is not None else PRAZO_ESTAGIO
+        self._lock = threading.Lock()
+        self._temporizador = None
+        self._encerrada = False
+    
+    @property
+    def esgotou(self):
+        return self.estagio >= self.limite
+    
+    def iniciar(self):
+        with self._lock:
+            self._agendar()
+    
+    def _agendar(self):
+        if self._temporizador is not None:
+            self._temporizador.cancelar()
+            self._temporizador = None
+        if not self.esgotou and not self._encerrada:
+            self._temporizador = agendar(self.prazo, self._prazo_vencido)
+    
+    def avancar(self, passos=1):
+        """Adianta `passos` estágios (thread do jogo) e reinicia o prazo"""
+        with self._lock:
+            self.estagio = min(self.limite, self.estagio + passos)
+            self._agendar()
+    
+    def encerrar(self):
+        with self._lock:
+            self._encerrada = True
+            self._agendar()
+    
+    def _prazo_vencido(self):
+        """Roda no laço dos temporizadores: avança um estágio e avisa o jogador"""
+        with self._lock:
+            if self._encerrada:
+                return
+            self.estagio += 1
+            estagio = self.estagio
+            self._agendar()
+        aviso = "\n" + texto_proximidade(estagio) + "\n"
+        if estagio >= self.limite:
+            aviso += f"{C.VERMELHO}{C.NEGRITO}[!] TARDE DEMAIS...{C.RESET} {C.CINZA}(ENTER){C.RESET}"
+        else:
+            aviso += self.prompt + self._digitado()
+        self.io.write(aviso)
+        self.io.flush()
+    
+    def _digitado(self):
+        """O que o jogador já digitou no terminal local (readline), para reexibir"""
+        if self.io is not sessao_padrao:
+            return ""
         try:
-            cmd = input(prompt_kali(state.codinome)).strip()
-        except KeyboardInterrupt:
-            print(f"\n{C.VERMELHO}[!] CONEXÃO INTERROMPIDA{C.RESET}")
-            state.game_over = True
-            return False
-        except EOFError:
-            return False
+            import readline
+            return readline.get_line_buffer()
+        except (ImportError, AttributeError):
+            return ""
+
+
+def missao_sob_pressao(cmd_expect, pressao, arquivo_save=None):
+    """
+    Missão de um comando só contra o relógio: `pressao` avança com cada
+    erro e com o manual, e a missão termina em FALHA quando ela esgota.
+    """
+    def globais(cmd, state):
+        # O prazo venceu enquanto digitava: ela já está atrás de você
+        if pressao.esgotou:
+            return FALHA
         
         # Comando para voltar ao menu
         if cmd.lower() == 'menu':
-            print(f"\n{C.AMARELO}[*] Salvando checkpoint e retornando ao menu...{C.RESET}")
-            if arquivo_save:
-                try:
-                    Path("saves").mkdir(exist_ok=True)
-                    with open(arquivo_save, 'w', encoding='utf-8') as f:
-                        json.dump(state.to_dict(), f, indent=2, ensure_ascii=False)
-                    print(f"{C.VERDE}[✓] Progresso salvo!{C.RESET}")
-                except Exception as e:
-                    print(f"{C.VERMELHO}[!] Erro ao salvar: {e}{C.RESET}")
-            time.sleep(0.5)
-            state.saindo_para_menu = True
-            return False
+            pressao.encerrar()
+            return _voltar_ao_menu(state, arquivo_save)
         
-        # Comando para acessar manual
-        if cmd.lower() in ['manual', 'help', '?']:
+        # Manual
+        if cmd.lower() in ['manual', 'help']:
             try:
                 from manual_hacking import exibir_banner
                 exibir_banner()
-            except:
-                print(f"{C.CINZA}Manual não disponível{C.RESET}")
-            print(f"\n{C.AMARELO}[*] VOCÊ PERDEU TEMPO CONSULTANDO O MANUAL!{C.RESET}")
+            except ImportError:
+                pass
+            print(f"{C.VERMELHO}[!] VOCÊ PERDEU TEMPO COM O MANUAL!{C.RESET}")
+            pressao.avancar(2)
             state.erros += 1
-            if state.game_over:
-                return False
-            continue
-        
-        # Validar comando
-        if cmd == cmd_expect:
-            sucesso("Comando executado com sucesso!")
-            state.registrar_sucesso(10)
-            return True
-        else:
-            tentativas += 1
-            state.registrar_falha(fatigue)
-            state.comandos_digitados.append(cmd)
-            
-            if tentativas >= max_tentativas:
-                erro("Muitas tentativas erradas!")
-                return False
-            
-            erro(f"Comando incorreto. ({tentativas}/{max_tentativas})")
-            print(f"{C.VERMELHO}[!] Ela ouviu o barulho do teclado e se levantou da cama!{C.RESET}")
-            time.sleep(0.3)
+            return FALHA if pressao.esgotou else "MANUAL"
+        return None
+    
+    def alvo(ctx):
+        exibir_proximidade(pressao.estagio)
+        print(f"{C.VERDE}# COMANDO ALVO: {C.CIANO}{cmd_expect}{C.RESET}")
+    
+    def acertou(ctx):
+        pressao.encerrar()
+    
+    def ela_ouviu(ctx):
+        _anotar_comando(ctx)
+        pressao.avancar(1)
+        return FALHA if pressao.esgotou else None
+    
+    def interrompido(state, excecao):
+        state.game_over = True
+        return FALHA
+    
+    return Missao("PRESSAO", [
+        Etapa("pressao", [
+            Regra(comando(cmd_expect), efeito=acertou, saida=lambda ctx: sucesso("OPERAÇÃO BEM-SUCEDIDA!"),
+                  pontos=15, ir=SUCESSO),
+        ], erro=Regra(efeito=ela_ouviu, saida=f"{C.VERMELHO}{C.NEGRITO}[!] COMANDO INVÁLIDO! ELA OUVIU!{C.RESET}",
+                      penalidade=5, pausa=0.5),
+           antes=alvo, sugerir=False),
+    ], prompt=pressao.prompt, globais=globais, ao_interromper=interrompido)
 
 
 def prompt_sob_pressao(cmd_expect, state, escolha_nome, fase_inicial=0, arquivo_save=None):
-    """Desafio sob pressão temporal. Digite 'menu' para voltar ao menu."""
-    estagio_atual = fase_inicial
+    """
+    Desafio sob pressão temporal: os estágios avançam sozinhos a cada
+    PRAZO_ESTAGIO segundos (e com cada erro). Digite 'menu' para voltar ao menu.
+    Retorna "SUCESSO", "MENU", "TIMEOUT" ou "GAMEOVER" (conexão interrompida).
+    """
     limite_estagios = 6
-    tentativas = 0
+    prompt = f"{C.VERMELHO}>>> {C.RESET}" + prompt_kali(state.codinome)
+    pressao = Pressao(fase_inicial, limite_estagios, prompt)
     
     print(f"\n{C.NEGRITO}{C.BRANCO}{'═' * 60}{C.RESET}")
     print(f"{C.NEGRITO}{C.BRANCO}{'ALERTA: ELA ESTÁ VINDO!':^60}{C.RESET}")
@@ -266,63 +476,20 @@ def prompt_sob_pressao(cmd_expect, state, escolha_nome, fase_inicial=0, arquivo_
     print(f"{C.CINZA}Tarefa: {escolha_nome}{C.RESET}")
     print(f"{C.CINZA}(digite 'menu' para retornar ao menu de jogo){C.RESET}")
     
-    while estagio_atual < limite_estagios:
-        exibir_proximidade(estagio_atual)
-        print(f"{C.VERDE}# COMANDO ALVO: {C.CIANO}{cmd_expect}{C.RESET}")
-        
-        try:
-            cmd = input(f"{C.VERMELHO}>>> {C.RESET}" + prompt_kali(state.codinome)).strip()
-        except (KeyboardInterrupt, EOFError):
-            state.game_over = True
-            return "GAMEOVER"
-        
-        # Comando para voltar ao menu
-        if cmd.lower() == 'menu':
-            print(f"\n{C.AMARELO}[*] Salvando checkpoint e retornando ao menu...{C.RESET}")
-            if arquivo_save:
-                try:
-                    Path("saves").mkdir(exist_ok=True)
-                    with open(arquivo_save, 'w', encoding='utf-8') as f:
-                        json.dump(state.to_dict(), f, indent=2, ensure_ascii=False)
-                    print(f"{C.VERDE}[✓] Progresso salvo!{C.RESET}")
-                except Exception as e:
-                    print(f"{C.VERMELHO}[!] Erro ao salvar: {e}{C.RESET}")
-            time.sleep(0.5)
-            state.saindo_para_menu = True
-            return "MENU"
-        
-        # Manual
-        if cmd.lower() in ['manual', 'help']:
-            try:
-                from manual_hacking import exibir_banner
-                exibir_banner()
-            except:
-                pass
-            print(f"{C.VERMELHO}[!] VOCÊ PERDEU TEMPO COM O MANUAL!{C.RESET}")
-            estagio_atual += 2
-            state.erros += 1
-            continue
-        
-        # Comando correto
-        if cmd == cmd_expect:
-            sucesso("OPERAÇÃO BEM-SUCEDIDA!")
-            state.registrar_sucesso(15)
-            return "SUCESSO"
-        
-        # Comando errado
-        tentativas += 1
-        estagio_atual += 1
-        state.registrar_falha(5)
-        state.comandos_digitados.append(cmd)
-        
-        print(f"{C.VERMELHO}{C.NEGRITO}[!] COMANDO INVÁLIDO! ELA OUVIU!{C.RESET}")
-        time.sleep(0.5)
+    pressao.iniciar()
+    try:
+        resultado = missao_sob_pressao(cmd_expect, pressao, arquivo_save).executar(state)
+    finally:
+        pressao.encerrar()
     
-    return "TIMEOUT"
+    if resultado == FALHA:
+        return "TIMEOUT" if pressao.esgotou else "GAMEOVER"
+    return resultado
 
 
 # ========== CENA PRINCIPAL ==========
 
+@com_sessao
 def iniciar(dados_jogador, arquivo_save):
     """
     Função principal do Capítulo 1
@@ -335,30 +502,31 @@ def iniciar(dados_jogador, arquivo_save):
         Dicionário com dados atualizados do jogador
     """
     
-    # Inicializar estado
-    state = GameState(dados_jogador)
+    # Inicializar estado (eventos vão para o diário do save)
+    diario = diario_de(arquivo_save) if (diario_de is not None and arquivo_save) else None
+    state = GameState(dados_jogador, diario)
     
     # ========== ABERTURA ==========
     
     header_kali_v2() 
     
     print()
-    time.sleep(0.5)
+    dormir(0.5)
     
     digitar(f"{C.CIANO}O café esfriou há horas. O silêncio é quebrado apenas pelo cooler do PC...{C.RESET}", 
             delay=0.08, cor=C.CIANO)
-    time.sleep(1)
+    dormir(1)
     
     digitar(f"{C.CIANO}Juliana dorme ao meu lado. Ela tem andado muito distante ultimamente.{C.RESET}", 
             delay=0.08, cor=C.CIANO)
-    time.sleep(1)
+    dormir(1)
 
     digitar(f"{C.CIANO}Eu não deveria fazer isso, mas a minha desconfiança me leva a isso...{C.RESET}", 
             delay=0.08, cor=C.CIANO)
-    time.sleep(1)
+    dormir(1)
     
     print(f"\n{C.CINZA}{'─' * 73}{C.RESET}")
-    time.sleep(0.8)
+    dormir(0.8)
     
     # ========== PARTE 1: INVESTIGAÇÃO ==========
     
@@ -376,7 +544,7 @@ def iniciar(dados_jogador, arquivo_save):
             return state.to_dict()
         return state.to_dict()
     
-    time.sleep(0.5)
+    dormir(0.5)
     
     # Entrar na pasta Private
     if not prompt_until(
@@ -389,7 +557,7 @@ def iniciar(dados_jogador, arquivo_save):
             return state.to_dict()
         return state.to_dict()
     
-    time.sleep(0.3)
+    dormir(0.3)
     
     # Listar arquivos ocultos
     if not prompt_until(
@@ -402,18 +570,18 @@ def iniciar(dados_jogador, arquivo_save):
             return state.to_dict()
         return state.to_dict()
     
-    time.sleep(1)
+    dormir(1)
     
     # ========== DESCOBERTA ==========
     
     mostrar_arquivos_descobertos()
     
-    time.sleep(1.2)
+    dormir(1.2)
     
     digitar(f"{C.VERMELHO}DROGA! Ela está vindo em direção à mesa! RÁPIDO!{C.RESET}", 
             delay=0.08, cor=C.VERMELHO)
     
-    time.sleep(1)
+    dormir(1)
     
     # ========== DECISÃO SOB PRESSÃO ==========
     
@@ -442,7 +610,7 @@ def iniciar(dados_jogador, arquivo_save):
         state.decisao_final = "exfiltrar"
         
         print(f"{C.AMARELO}[*] MODO ESCOLHIDO: EXFILTRAÇÃO{C.RESET}\n")
-        time.sleep(0.3)
+        dormir(0.3)
         
         resultado = prompt_sob_pressao(
             "scp .conversa_hotel_nobile.pdf exfil@drop:~/",
@@ -457,19 +625,19 @@ def iniciar(dados_jogador, arquivo_save):
         
         if resultado == "SUCESSO":
             sucesso("Arquivo transferido com sucesso!")
-            time.sleep(0.5)
+            dormir(0.5)
             
             digitar(f"\n{C.CIANO}Você fecha o notebook no exato segundo em que ela toca no seu ombro.{C.RESET}", 
                     delay=0.05, cor=C.CIANO)
-            time.sleep(0.8)
+            dormir(0.8)
             
             digitar(f"{C.BRANCO}Juliana: 'Vem dormir, amor... você trabalha demais.'{C.RESET}", 
                     delay=0.05, cor=C.BRANCO)
-            time.sleep(0.8)
+            dormir(0.8)
             
             digitar(f"{C.CIANO}Ela não tem ideia. As provas estão seguras. Agora começa o verdadeiro jogo.{C.RESET}", 
                     delay=0.05, cor=C.CIANO)
-            time.sleep(1)
+            dormir(1)
             
             state.capitulo_concluido = True
             state.operacao_sucesso = True
@@ -477,7 +645,7 @@ def iniciar(dados_jogador, arquivo_save):
             
         elif resultado == "TIMEOUT":
             print(f"\n{C.VERMELHO}Tarde demais... Você ouve a maçaneta virando lentamente atrás de você.{C.RESET}")
-            time.sleep(1.5)
+            dormir(1.5)
             
             limpar_tela()
             header_kali_v2()
@@ -486,19 +654,19 @@ def iniciar(dados_jogador, arquivo_save):
             print(f"{C.VERMELHO}{C.NEGRITO}{'   VOCÊ FOI DESCOBERTO':^60}{C.RESET}")
             print(f"{C.VERMELHO}{C.NEGRITO}{'═' * 60}{C.RESET}")
             
-            time.sleep(0.5)
+            dormir(0.5)
             
             digitar(f"\n{C.BRANCO}Juliana olha o monitor. Seus olhos ficam vermelhos.{C.RESET}", 
                     delay=0.05, cor=C.BRANCO)
-            time.sleep(0.8)
+            dormir(0.8)
             
             digitar(f"{C.BRANCO}Juliana: 'Então é isso que você faz enquanto eu durmo? VOCÊ INVADIU MEU COMPUTADOR?'{C.RESET}", 
                     delay=0.05, cor=C.BRANCO)
-            time.sleep(1)
+            dormir(1)
             
             digitar(f"{C.VERMELHO}A relação acabou naquela noite.{C.RESET}", 
                     delay=0.05, cor=C.VERMELHO)
-            time.sleep(1)
+            dormir(1)
             
             state.registrar_falha(100)
     
@@ -507,7 +675,7 @@ def iniciar(dados_jogador, arquivo_save):
         state.decisao_final = "destruir"
         
         print(f"{C.AMARELO}[*] MODO ESCOLHIDO: DESTRUIÇÃO{C.RESET}\n")
-        time.sleep(0.3)
+        dormir(0.3)
         
         resultado = prompt_sob_pressao(
             "rm -rf *",
@@ -522,23 +690,23 @@ def iniciar(dados_jogador, arquivo_save):
         
         if resultado == "SUCESSO":
             sucesso("Sistema de arquivos limpo!")
-            time.sleep(0.5)
+            dormir(0.5)
             
             digitar(f"\n{C.CIANO}Você fecha o notebook no exato segundo em que ela toca no seu ombro.{C.RESET}", 
                     delay=0.05, cor=C.CIANO)
-            time.sleep(0.8)
+            dormir(0.8)
             
             digitar(f"{C.BRANCO}Juliana: 'Vem dormir, amor... você trabalha demais.'{C.RESET}", 
                     delay=0.05, cor=C.BRANCO)
-            time.sleep(0.8)
+            dormir(0.8)
             
             digitar(f"{C.CINZA}Ela não suspeita de nada. As evidências se foram. Mas agora você sabe a verdade.{C.RESET}", 
                     delay=0.05, cor=C.CINZA)
-            time.sleep(1)
+            dormir(1)
             
             digitar(f"{C.VERMELHO}E essa verdade nunca sairá de você.{C.RESET}", 
                     delay=0.05, cor=C.VERMELHO)
-            time.sleep(1)
+            dormir(1)
             
             state.capitulo_concluido = True
             state.operacao_sucesso = True
@@ -546,7 +714,7 @@ def iniciar(dados_jogador, arquivo_save):
         
         elif resultado == "TIMEOUT":
             print(f"\n{C.VERMELHO}Tarde demais... A porta abre atrás de você.{C.RESET}")
-            time.sleep(1.5)
+            dormir(1.5)
             
             limpar_tela()
             header_kali_v2()
@@ -555,19 +723,19 @@ def iniciar(dados_jogador, arquivo_save):
             print(f"{C.VERMELHO}{C.NEGRITO}{'   CAPTURADO EM FLAGRANTE':^60}{C.RESET}")
             print(f"{C.VERMELHO}{C.NEGRITO}{'═' * 60}{C.RESET}")
             
-            time.sleep(0.5)
+            dormir(0.5)
             
             digitar(f"\n{C.BRANCO}Juliana vê o terminal aberto. Seus olhos explodem em lágrimas.{C.RESET}", 
                     delay=0.05, cor=C.BRANCO)
-            time.sleep(0.8)
+            dormir(0.8)
             
             digitar(f"{C.BRANCO}Juliana: 'Você estava deletando tudo? Meu Deus... por quanto tempo?'{C.RESET}", 
                     delay=0.05, cor=C.BRANCO)
-            time.sleep(1)
+            dormir(1)
             
             digitar(f"{C.VERMELHO}A ira dela é pior que qualquer acusação.{C.RESET}", 
                     delay=0.05, cor=C.VERMELHO)
-            time.sleep(1)
+            dormir(1)
             
             state.registrar_falha(100)
     
@@ -581,11 +749,8 @@ def iniciar(dados_jogador, arquivo_save):
     
     # Salvar progresso
     try:
-        Path("saves").mkdir(exist_ok=True)
-        
         if arquivo_save:
-            with open(arquivo_save, 'w', encoding='utf-8') as f:
-                json.dump(dados_atualizados, f, indent=2, ensure_ascii=False)
+            salvar_save(arquivo_save, dados_atualizados)
     except Exception as e:
         print(f"{C.VERMELHO}[!] Erro ao salvar: {e}{C.RESET}")
     
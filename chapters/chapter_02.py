@@ -10,13 +10,18 @@ Habilidade: zip2john, steghide
 
 import os
 import sys
-import time
 import random
 import json
 import shutil
 from datetime import datetime
 from pathlib import Path
 
+# Relógio global do jogo (pausas podem ser aceleradas ou puladas)
+try:
+    from utils.relogio import dormir
+except ImportError:
+    from time import sleep as dormir
+
 # Tentativa de importar utils
 try:
     from utils.terminal_kali import C, digitar, fim_digitar, limpa_tela
@@ -36,11 +41,23 @@ except ImportError:
         
     def digitar(texto, delay=0.03, cor=C.BRANCO, fim="\n"):
         print(f"{cor}{texto}{C.RESET}", end=fim)
-        time.sleep(len(texto) * delay)
+        dormir(len(texto) * delay)
 
     def limpa_tela():
-        os.system('cls' if os.name == 'nt' else 'clear')
+        print('\033[H\033[2J\033[3J', end='', flush=True)
+
+
+# Limpeza de tela em processo, compartilhada com o menu (sem subprocesso `clear`)
+try:
+    from utils.tela import limpar_tela as limpa_tela
+except ImportError:
+    pass
+
+# Sessão de E/S do jogador: o `iniciar` aceita io=SessaoIO
+from utils.sessao_io import com_sessao
 
+# Missões declaradas como dados (etapas + regras), interpretadas por um único motor
+from utils.missoes import Missao, Etapa, Regra, SUCESSO, exato, comando, comeca, contem
 
 # ========== ESTADO DO JOGO ==========
 
@@ -71,7 +88,14 @@ class GameStateChapter2:
 
     def to_dict(self):
         # Retorna dados atualizados para o main loop
-            'capitulo_1_resultado': self.capit1_resultado,
+        return {
+            'player_name': self.player_name,
+            'codiname': self.codinome,
+            'privacy_level': self.privacy_level,
+            'reputation': self.reputation,
+            'score': self.score,
+            'inventory': self.inventory,
+            'capitulo_1_resultado': self.cap1_resultado,
             'last_seen': datetime.now().isoformat(),
             'saindo_para_menu': self.saindo_para_menu,
             'completed': getattr(self, 'capitulo_concluido', True) # Assumindo true se chegou aqui sem sair
@@ -121,31 +145,31 @@ def check_comandos_globais(cmd, state, arquivo_save):
 def pensamento(texto):
     """Exibe um pensamento do personagem (texto azul/ciano com itálico se possível)"""
     print(f"\n{C.CIANO}{C.NEGRITO}>> {texto}{C.RESET}")
-    time.sleep(1.5)
+    dormir(1.5)
 
 def narracao(texto, delay=0.04):
     """Exibe texto narrativo"""
     digitar(texto, delay=delay, cor=C.BRANCO)
-    time.sleep(0.5)
+    dormir(0.5)
 
 def drama_pause(segundos=1):
-    time.sleep(segundos)
+    dormir(segundos)
 
 # ========== SIMULAÇÕES TÉCNICAS ==========
 
 def simular_john(target):
     print(f"\n{C.CINZA}[*] Iniciando John The Ripper jumbo-1...{C.RESET}")
-    time.sleep(1)
+    dormir(1)
     print(f"{C.CINZA}[*] Loaded 1 password hash ({target}){C.RESET}")
     print(f"{C.CINZA}[*] Will run 8 OpenMP threads{C.RESET}")
-    time.sleep(2)
+    dormir(2)
     
     print(f"\n{C.AMARELO}Proceeding with wordlist: /usr/share/wordlists/rockyou.txt{C.RESET}")
     chars = ["|", "/", "-", "\\"]
     for i in range(20):
         sys.stdout.write(f"\r{C.BRANCO}Cracking... {chars[i % 4]} {i*5}%{C.RESET}")
         sys.stdout.flush()
-        time.sleep(0.2)
+        dormir(0.2)
     
     senha = "nobile123"
     print(f"\n\n{C.VERDE}[+] Session completed. Password found: {C.NEGRITO}{senha}{C.RESET}")
@@ -153,7 +177,7 @@ def simular_john(target):
 
 def simular_steghide_extract(arquivo, senha):
     print(f"\n{C.CINZA}[*] Tentando extrair dados de {arquivo}...{C.RESET}")
-    time.sleep(1)
+    dormir(1)
     
     if senha == "rex":
         print(f"{C.VERDE}[+] Wrote extracted data to 'backup_link.txt'.{C.RESET}")
@@ -208,52 +232,8 @@ def rota_exfiltracao(state, arquivo_save):
     print(f"\n{C.AMARELO}MISSÃO: Quebrar a criptografia do arquivo ZIP.{C.RESET}")
     print(f"{C.CINZA}DICA: Use 'zip2john' para extrair o hash da senha, depois use 'john' para quebrá-la.{C.RESET}\n")
     
-    # Parte 1: zip2john
-    while True:
-        try:
-            cmd = input(prompt_kali(state.codinome)).strip()
-        except (KeyboardInterrupt, EOFError):
-            state.saindo_para_menu = True
-            return False
-
-        # Check global commands
-        status_global = check_comandos_globais(cmd, state, arquivo_save)
-        if status_global == "MENU": return False
-        if status_global == "MANUAL": continue
-        
-        if cmd == "ls":
-            print("fotos_reserva_dupla.zip   wordlist.txt")
-        elif "zip2john" in cmd and "fotos_reserva_dupla.zip" in cmd:
-            if ">" in cmd:
-                print(f"{C.VERDE}[+] Hash extraído com sucesso!{C.RESET}")
-                break
-            else:
-                print(f"{C.AMARELO}Dica: Redirecione a saída para um arquivo (ex: > hash.txt){C.RESET}")
-        else:
-            print(f"{C.VERMELHO}Comando não reconhecido ou incorreto para esta etapa.{C.RESET}")
-            state.registrar_falha(2)
-
-    pensamento("O hash... a impressão digital da senha. Agora é força bruta.")
-    pensamento("Não importa o quão complexa seja a mentira, a verdade é apenas uma sequência de caracteres.")
-    
-    # Parte 2: John
-    while True:
-        try:
-            cmd = input(prompt_kali(state.codinome)).strip()
-        except (KeyboardInterrupt, EOFError):
-            state.saindo_para_menu = True
-            return False
-            
-        status_global = check_comandos_globais(cmd, state, arquivo_save)
-        if status_global == "MENU": return False
-        if status_global == "MANUAL": continue
-        
-        if cmd.startswith("john"):
-            simular_john("zip")
-            break
-        else:
-            print(f"{C.VERMELHO}Use o comando 'john' seguido do arquivo de hash.{C.RESET}")
-            state.registrar_falha(2)
+    if MISSAO_EXFILTRACAO.executar(state) != SUCESSO:
+        return False
 
     drama_pause(1)
     narracao("\n'nobile123'.")
@@ -293,52 +273,9 @@ def rota_destruicao(state, arquivo_save):
     print(f"\n{C.AMARELO}MISSÃO: Extrair dados ocultos da imagem.{C.RESET}")
     print(f"{C.CINZA}DICA: Use 'steghide info' para verificar e 'steghide extract' para extrair.{C.RESET}\n")
 
-    # Parte 1: Info
-    while True:
-        try:
-            cmd = input(prompt_kali(state.codinome)).strip()
-        except (KeyboardInterrupt, EOFError):
-            state.saindo_para_menu = True
-            return False
-            
-        status_global = check_comandos_globais(cmd, state, arquivo_save)
-        if status_global == "MENU": return False
-        if status_global == "MANUAL": continue
-        
-        if "steghide info" in cmd and "perfil_social.jpg" in cmd:
-            print(f"{C.CINZA}[*] Probing 'perfil_social.jpg'...{C.RESET}")
-            time.sleep(1)
-            print(f"{C.VERDE}[+] Found embedded data: 'backup_link.txt'{C.RESET}")
-            break
-        elif cmd == "ls":
-            print("perfil_social.jpg")
-        else:
-            print(f"{C.VERMELHO}Verifique o arquivo com 'steghide info'.{C.RESET}")
-
-    pensamento("Eu sabia. Ela sempre foi paranoica com backups. Onde há fumaça digital...")
-    pensamento("Preciso de uma senha. Algo que ela nunca esqueceria. O nome daquele maldito cachorro.")
+    if MISSAO_DESTRUICAO.executar(state) != SUCESSO:
+        return False
 
-    # Parte 2: Extract
-    while True:
-        try:
-            cmd = input(prompt_kali(state.codinome)).strip()
-        except (KeyboardInterrupt, EOFError):
-            state.saindo_para_menu = True
-            return False
-            
-        status_global = check_comandos_globais(cmd, state, arquivo_save)
-        if status_global == "MENU": return False
-        if status_global == "MANUAL": continue
-        
-        if "steghide extract" in cmd:
-            senha = input(f"{C.AMARELO}Enter passphrase: {C.RESET}")
-            if simular_steghide_extract("perfil_social.jpg", senha):
-                break
-            else:
-                state.registrar_falha(3)
-        else:
-            print(f"{C.VERMELHO}Use 'steghide extract -sf perfil_social.jpg'.{C.RESET}")
-            
     drama_pause(1)
     narracao("\nUm arquivo de texto se extrai das entranhas digitais da imagem.")
     print(f"\n{C.BRANCO}CONTENT: cloud-backup.secure/recover?id=juliana_reserva_nobile{C.RESET}")
@@ -350,6 +287,65 @@ def rota_destruicao(state, arquivo_save):
     digitar(f"\n{C.VERDE}>> Nova habilidade desbloqueada: ESTEGANOGRAFIA <<{C.RESET}", delay=0.05)
     return True
 
+# ========== MISSÕES DAS ROTAS ==========
+
+def _globais(cmd, state):
+    return check_comandos_globais(cmd, state, None)
+
+def _pensar_no_hash(state):
+    pensamento("O hash... a impressão digital da senha. Agora é força bruta.")
+    pensamento("Não importa o quão complexa seja a mentira, a verdade é apenas uma sequência de caracteres.")
+
+def _pensar_na_senha(state):
+    pensamento("Eu sabia. Ela sempre foi paranoica com backups. Onde há fumaça digital...")
+    pensamento("Preciso de uma senha. Algo que ela nunca esqueceria. O nome daquele maldito cachorro.")
+
+def _quebrar_hash(ctx):
+    simular_john("zip")
+
+def _ler_passphrase(ctx):
+    if "steghide extract" in ctx.cmd:
+        ctx.dados['senha'] = ctx.ler(f"{C.AMARELO}Enter passphrase: {C.RESET}")
+
+def _extrair(ctx):
+    if not simular_steghide_extract("perfil_social.jpg", ctx.dados.pop('senha', '')):
+        ctx.state.registrar_falha(3)
+        return None
+    return SUCESSO
+
+def _probe_steghide(ctx):
+    print(f"{C.CINZA}[*] Probing 'perfil_social.jpg'...{C.RESET}")
+    dormir(1)
+    return f"{C.VERDE}[+] Found embedded data: 'backup_link.txt'{C.RESET}"
+
+def _prompt(state):
+    return prompt_kali(state.codinome)
+
+MISSAO_EXFILTRACAO = Missao("EXFILTRAÇÃO", [
+    Etapa("zip2john", [
+        Regra(exato("ls"), saida="fotos_reserva_dupla.zip   wordlist.txt"),
+        Regra(comando("zip2john fotos_reserva_dupla.zip > *"),
+              saida=f"{C.VERDE}[+] Hash extraído com sucesso!{C.RESET}", ir="john"),
+        Regra(contem("zip2john", "fotos_reserva_dupla.zip"),
+              saida=f"{C.AMARELO}Dica: Redirecione a saída para um arquivo (ex: > hash.txt){C.RESET}"),
+    ], erro=Regra(saida=f"{C.VERMELHO}Comando não reconhecido ou incorreto para esta etapa.{C.RESET}", penalidade=2)),
+    Etapa("john", [
+        Regra(comeca("john"), efeito=_quebrar_hash, ir=SUCESSO),
+    ], erro=Regra(saida=f"{C.VERMELHO}Use o comando 'john' seguido do arquivo de hash.{C.RESET}", penalidade=2),
+       entrada=_pensar_no_hash),
+], prompt=_prompt, globais=_globais)
+
+MISSAO_DESTRUICAO = Missao("ESTEGANOGRAFIA", [
+    Etapa("info", [
+        Regra(contem("steghide info", "perfil_social.jpg"), saida=_probe_steghide, ir="extract"),
+        Regra(exato("ls"), saida="perfil_social.jpg"),
+    ], erro=Regra(saida=f"{C.VERMELHO}Verifique o arquivo com 'steghide info'.{C.RESET}")),
+    Etapa("extract", [
+        Regra(contem("steghide extract"), efeito=_extrair),
+    ], erro=Regra(saida=f"{C.VERMELHO}Use 'steghide extract -sf perfil_social.jpg'.{C.RESET}"),
+       entrada=_pensar_na_senha, depois_de_ler=_ler_passphrase),
+], prompt=_prompt, globais=_globais)
+
 def cena_final(state):
     drama_pause(2)
     header_kali_v2()
@@ -377,11 +373,12 @@ def cena_final(state):
     
     digitar(f"\n{C.VERDE}CAPÍTULO 2 CONCLUÍDO.{C.RESET}")
     state.registrar_sucesso(100)
-    time.sleep(3)
+    dormir(3)
 
 
 # ========== MAIN ==========
 
+@com_sessao
 def iniciar(dados_jogador, arquivo_save=None):
     # Inicializa estado
     state = GameStateChapter2(dados_jogador)
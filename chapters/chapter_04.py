@@ -6,11 +6,16 @@ Foco em narrativa, suspense e criptografia.
 
 import os
 import sys
-import time
 import random
 from datetime import datetime
 import shutil
 
+# Relógio global do jogo (pausas podem ser aceleradas ou puladas)
+try:
+    from utils.relogio import dormir
+except ImportError:
+    from time import sleep as dormir
+
 # Importação de Utils (Fallbacks se necessário)
 try:
     from utils.terminal_kali import C, digitar, limpa_tela, header_kali_v2
@@ -31,12 +36,31 @@ except ImportError:
     def digitar(texto, delay=0.04, cor=C.BRANCO, fim="\n"):
         for char in texto:
             print(f"{cor}{char}{C.RESET}", end='', flush=True)
-            time.sleep(delay)
+            dormir(delay)
         print(end=fim)
 
     def limpa_tela():
-        os.system('cls' if os.name == 'nt' else 'clear')
+        print('\033[H\033[2J\033[3J', end='', flush=True)
+
+
+# Limpeza de tela em processo, compartilhada com o menu (sem subprocesso `clear`)
+try:
+    from utils.tela import limpar_tela as limpa_tela
+except ImportError:
+    pass
+
+# Detecção de terminal (pipes/CI recebem a versão sem animação)
+try:
+    from utils.capacidades import interativo
+except ImportError:
+    def interativo():
+        return sys.stdout.isatty()
 
+# Sessão de E/S do jogador: o `iniciar` aceita io=SessaoIO
+from utils.sessao_io import com_sessao
+
+# Missões declaradas como dados (etapas + regras), interpretadas por um único motor
+from utils.missoes import Missao, Etapa, Regra, SUCESSO, comeca, algum, e_, funcao
 
 # ========== ESTADO DO CAPÍTULO ==========
 
@@ -56,16 +80,11 @@ class GameStateChapter4:
         return {
             'player_name': self.player_name,
             'codiname': self.codinome,
-            'bitcoin_wallet': self.bitcoin,
-            'privacy_level': self.privacy,
-            'inventory': self.inventory,
-            'completed': getattr(self, 'capitulo_concluido', False),
-            'saindo_para_menu': self.saindo_para_menu
-        }
             'bitcoin_wallet': self.bitcoin,
             'privacy_level': self.privacy,
             'inventory': self.inventory,
             'paranoia_level': self.paranoia, # Persiste? Talvez para consequencias futuras
+            'completed': getattr(self, 'capitulo_concluido', False),
             'last_seen': datetime.now().isoformat(),
             'saindo_para_menu': self.saindo_para_menu
         }
@@ -75,12 +94,12 @@ class GameStateChapter4:
 def narrar_pensamento(texto):
     """Exibe um pensamento interno do personagem (cinemático)"""
     print(f"\n{C.CINZA}{C.IT}( {texto} ){C.RESET}")
-    time.sleep(2)
+    dormir(2)
 
 def narrar_ambiente(texto):
     """Exibe descrição do ambiente"""
     print(f"\n{C.AZUL}▒ {texto}{C.RESET}")
-    time.sleep(1.5)
+    dormir(1.5)
 
 def prompt_hacker(codinome):
     return f"{C.VERMELHO}┌──({C.BRANCO}{codinome}@darkbox{C.VERMELHO})-[{C.BRANCO}~/encrypted{C.VERMELHO}]\n└─$ {C.RESET}"
@@ -131,58 +150,50 @@ def puzzle_descriptografia(state):
     print(f"{C.CINZA}Dica: O arquivo termina com .enc (Encriptado). Geralmente usamos 'gpg'.{C.RESET}")
     print(f"{C.CINZA}{C.IT}   (Pensamento: GPG... GNU Privacy Guard. Se eu tiver a chave simétrica, o comando é 'gpg -d arquivo'. Mas qual é a senha? A mensagem dizia 'ano de fundação'.){C.RESET}\n")
     
-    tentativas = 3
-    
-    while tentativas > 0:
-        try:
-            cmd = input(prompt_hacker(state.codinome)).strip()
-        except:
-            state.saindo_para_menu = True
-            return "MENU"
-            
-        status = check_comandos_globais(cmd, state)
-        if status == "MENU": return "MENU"
-        if status == "MANUAL": continue
-        
-        # PENSAMENTO NARRATIVO DINÂMICO
-        if tentativas == 3:
-             narrar_pensamento("Tente 'dec gpg <chave>'. Preciso pensar... O grande crash cibernético de 2077? Não, muito óbvio.")
-        
+    return MISSAO_DESCRIPTOGRAFIA.executar(state)
+
+# A CHAVE É "2033": o ano do "Grande Apagão" na lore do Root Evolution
+CHAVE_BLACK_BOX = "2033"
+
+def _pensar_antes_de_errar(ctx):
+    # PENSAMENTO NARRATIVO DINÂMICO (até a primeira chave errada)
+    if ctx.erros == 0:
+        narrar_pensamento("Tente 'dec gpg <chave>'. Preciso pensar... O grande crash cibernético de 2077? Não, muito óbvio.")
+
+def _chave_aceita(ctx):
+    print(f"\n{C.VERDE}[!] CHAVE ACEITA. INICIANDO DECRIPTOGRAFIA...{C.RESET}")
+    dormir(1)
+    barra_progresso()
+
+def _chave_negada(ctx):
+    ctx.state.paranoia += 10
+    print(f"\n{C.VERMELHO}[!] ACESSO NEGADO. CHAVE INCORRETA.{C.RESET}")
+    narrar_pensamento(f"Merda. Errado. {ctx.restantes} tentativas restantes antes do wipe automático.")
+
+_DECRIPTAR = comeca("dec gpg", "decrypt")
+
+MISSAO_DESCRIPTOGRAFIA = Missao("BLACK_BOX_OMEGA", [
+    Etapa("decriptar", [
         # COMANDO DE DECRIPTAR
-        if cmd.startswith("dec gpg") or cmd.startswith("decrypt"):
-            partes = cmd.split()
-            if len(partes) < 3 and cmd.startswith("dec"): 
-                print(f"{C.VERMELHO}Sintaxe: dec gpg <chave>{C.RESET}")
-                continue
-                
-            chave = partes[-1]
-            
-            # A CHAVE É "2025" (Ano "atual" ou próximo, ou uma data lore específica. Vamos usar 2033 como lore do jogo Root Evolution)
-            # Vamos estabelecer 2033 como o ano do "Grande Apagão" na lore.
-            if chave == "2033":
-                print(f"\n{C.VERDE}[!] CHAVE ACEITA. INICIANDO DECRIPTOGRAFIA...{C.RESET}")
-                time.sleep(1)
-                barra_progresso()
-                return "SUCESSO"
-            else:
-                print(f"\n{C.VERMELHO}[!] ACESSO NEGADO. CHAVE INCORRETA.{C.RESET}")
-                tentativas -= 1
-                state.paranoia += 10
-                narrar_pensamento(f"Merda. Errado. {tentativas} tentativas restantes antes do wipe automático.")
-        
+        Regra(e_(_DECRIPTAR, funcao(lambda cmd: len(cmd.split()) < 3, "sem_chave")),
+              saida=f"{C.VERMELHO}Sintaxe: dec gpg <chave>{C.RESET}"),
+        Regra(e_(_DECRIPTAR, funcao(lambda cmd: cmd.split()[-1] == CHAVE_BLACK_BOX, "chave")),
+              efeito=_chave_aceita, ir=SUCESSO),
+        Regra(_DECRIPTAR, saida=_chave_negada, tentativa=True),
         # DICA EXTRA SE O JOGADOR ESTIVER PERDIDO
-        elif "dica" in cmd or "hint" in cmd:
-             print(f"\n{C.CINZA}System Note: O arquivo menciona 'Projeto Gênesis {C.VERDE}v20.33{C.CINZA}' nos metadados.{C.RESET}")
-        
-        else:
-             print(f"{C.VERMELHO}Comando desconhecido. Use 'dec gpg <chave>'.{C.RESET}")
-
-    return "FALHA"
+        Regra(algum("dica", "hint"),
+              saida=f"\n{C.CINZA}System Note: O arquivo menciona 'Projeto Gênesis {C.VERDE}v20.33{C.CINZA}' nos metadados.{C.RESET}"),
+    ], erro=Regra(saida=f"{C.VERMELHO}Comando desconhecido. Use 'dec gpg <chave>'.{C.RESET}"),
+       tentativas=3, depois_de_ler=_pensar_antes_de_errar),
+], prompt=lambda state: prompt_hacker(state.codinome), globais=check_comandos_globais)
 
 def barra_progresso():
+    if not interativo():
+        print(f"\n{C.VERDE}{'█' * 20} 100%{C.RESET}\n")
+        return
     print(f"\n{C.VERDE}", end="")
     for i in range(20):
-        time.sleep(0.1)
+        dormir(0.1)
         print("█", end="", flush=True)
     print(f" 100%{C.RESET}\n")
 
@@ -191,7 +202,7 @@ def barra_progresso():
 def ler_conteudo_arquivo(state):
     limpa_tela()
     print(f"\n{C.VERMELHO}>>> BLACK_BOX_OMEGA DECRYPTED <<<{C.RESET}\n")
-    time.sleep(1)
+    dormir(1)
     
     texto_secreto = [
         "ALVO: PROJETO HUMANIDADE 2.0",
@@ -208,12 +219,12 @@ def ler_conteudo_arquivo(state):
     
     for linha in texto_secreto:
         print(f"{C.CINZA}{linha}{C.RESET}")
-        time.sleep(1.5 if linha.strip() else 0.5)
+        dormir(1.5 if linha.strip() else 0.5)
     
     narrar_pensamento("Meu Deus... Não somos hackers lutando contra corporações.")
     narrar_pensamento("Somos cobaias.")
     
-    time.sleep(3)
+    dormir(3)
     
     # ESCOLHA DRAMÁTICA
     print(f"\n{C.AMARELO}[1] Copiar os dados e guardar segredo")
@@ -234,7 +245,7 @@ def ler_conteudo_arquivo(state):
         elif esc == "2":
             narrar_pensamento("Não... eu não vi nada. Não quero fazer parte disso.")
             print(f"\n{C.VERMELHO}Apagando dados...{C.RESET}")
-            time.sleep(1)
+            dormir(1)
             state.paranoia -= 10 # Menos paranoia, mas menos poder
             break
 
@@ -242,13 +253,14 @@ def ler_conteudo_arquivo(state):
 
 # ========== MAIN DO CAPÍTULO ==========
 
+@com_sessao
 def iniciar(dados_jogador, arquivo_save=None):
     state = GameStateChapter4(dados_jogador)
     
     limpa_tela()
     print(f"\n\n{C.CINZA}{' ' * 30}CAPÍTULO 04{C.RESET}")
     print(f"{C.VERMELHO}{C.NEGRITO}{' ' * 20}O ABISMO OLHA DE VOLTA{C.RESET}\n")
-    time.sleep(3)
+    dormir(3)
     
     narrar_ambiente("O zumbido do seu servidor parece mais alto hoje.")
     narrar_pensamento("Desde que aceitei aquele trabalho... sinto que estou sendo observado.")
@@ -261,9 +273,9 @@ def iniciar(dados_jogador, arquivo_save=None):
     
     if resultado == "FALHA":
         print(f"\n{C.VERMELHO}FATAL ERROR: O arquivo se autodestruiu.{C.RESET}")
-        time.sleep(2)
+        dormir(2)
         print(f"{C.CINZA}Você perdeu uma informação vital.{C.RESET}")
-        time.sleep(2)
+        dormir(2)
         # Não dá game over, mas perde chance de lore
     
     # 2. REVELAÇÃO (Se sucesso)
@@ -274,7 +286,7 @@ def iniciar(dados_jogador, arquivo_save=None):
 
     narrar_ambiente("A tela escurece. Uma nova mensagem surge no terminal.")
     print(f"\n{C.VERDE}UNKNOWN: 'Você viu demais, {state.codinome}.'{C.RESET}")
-    time.sleep(2)
+    dormir(2)
     
     # EFEITO FINAL DE CAPÍTULO
     limpa_tela()
@@ -285,6 +297,6 @@ def iniciar(dados_jogador, arquivo_save=None):
     print(f" {C.VERDE}+ 0.05 BTC{C.RESET}")
     print(f" {C.VERDE}+ Acesso à Rede Omega{C.RESET}")
     print(f" {C.VERMELHO}+ Nível de Paranoia Crítico{C.RESET}")
-    time.sleep(4)
+    dormir(4)
     
     return state.to_dict()
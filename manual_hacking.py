@@ -3,12 +3,17 @@
 MANUAL DE HACKING - ROOT EVOLUTION v2.0
 Referência completa de comandos e técnicas - Interface Mr. Robot Style
 """
-import time
 import os
 import sys
 import textwrap
 from shutil import get_terminal_size
 
+# Relógio global do jogo (pausas podem ser aceleradas ou puladas)
+try:
+    from utils.relogio import dormir
+except ImportError:
+    from time import sleep as dormir
+
 # Tentar importar utils para cores padronizadas
 try:
     from utils.terminal_kali import C, digitar, limpar_tela, header_kali_v2
@@ -31,7 +36,7 @@ except ImportError:
         NEGRITO = '\033[1m'
     
     def limpar_tela():
-        os.system('cls' if os.name == 'nt' else 'clear')
+        print('\033[H\033[2J\033[3J', end='', flush=True)
         
     def digitar(texto, delay=0.01, cor=C.BRANCO):
         print(f"{cor}{texto}{C.RESET}")
@@ -403,10 +408,12 @@ def imprimir_comando(comando, exemplo, descricao):
 
 def limpar_tela():
     """Limpa a tela do terminal"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    tela.limpar()
 
 # Usar a função padronizada de digitação do utils
 from utils.terminal_kali import digitar as _digitar_padrao
+from utils.tela import tela
+from utils.sessao_io import sessao_atual, na_sessao
 
 def digitar(texto, delay=0.01, cor=C.BRANCO, fim='\n'):
     """Wrapper compatível que encaminha para `utils.terminal_kali.digitar`.
@@ -437,7 +444,7 @@ def exibir_banner():
     # Mensagem de acesso com digitação
     print(f"{C.CINZA}[*] ", end="")
     digitar("Acessando banco de dados do manual de hacking...", delay=0.01, cor=C.VERDE)
-    time.sleep(0.5)
+    dormir(0.5)
     print(f"{C.CINZA}[✓] {C.VERDE}Acesso concedido!{C.RESET}")
     print()
 
@@ -481,7 +488,7 @@ def exibir_manual():
                 print(f"{C.VERDE}║{C.VERMELHO}  [!] Limpando rastros...{C.RESET}{C.VERDE}                  ║{C.RESET}")
                 print(f"{C.VERDE}║{C.AMARELO}  [✓] Desconectado com sucesso!{C.RESET}{C.VERDE}            ║{C.RESET}")
                 print(f"{C.VERDE}╚════════════════════════════════════════════╝{C.RESET}\n")
-                time.sleep(1)
+                dormir(1)
                 break
             elif escolha == "1":
                 mostrar_comandos_basicos()
@@ -503,11 +510,11 @@ def exibir_manual():
                 mostrar_ferramentas()
             else:
                 print(f"\n{C.VERMELHO}[!] Opção inválida. Digite 1-10 ou 'exit'{C.RESET}")
-                time.sleep(1.5)
+                dormir(1.5)
                 
         except KeyboardInterrupt:
             print(f"\n\n{C.VERMELHO}[!] Conexão interrompida pelo usuário.{C.RESET}")
-            time.sleep(1)
+            dormir(1)
             break
 
 def mostrar_comandos_basicos():
@@ -1057,10 +1064,11 @@ def mostrar_ferramentas():
 class ManualHacking:
     """Classe wrapper para integração do manual com o ROOT EVOLUTION"""
     
-    def __init__(self):
-        """Inicializa o manual de hacking"""
-        pass
+    def __init__(self, io=None):
+        """Inicializa o manual de hacking (io: sessão de E/S do jogador)"""
+        self.io = io if io is not None else sessao_atual()
     
+    @na_sessao
     def mostrar_menu(self):
         """Exibe o menu principal do manual de hacking"""
         try:
@@ -1076,7 +1084,7 @@ class ManualHacking:
 if __name__ == "__main__":
     try:
         print(f"{C.VERDE}[*] Initializing hacking manual...{C.RESET}")
-        time.sleep(1)
+        dormir(1)
         exibir_manual()
         print(f"\n{C.CIANO}[+] MANUAL FECHADO. Stay anonymous, hacker.{C.RESET}")
     except KeyboardInterrupt:
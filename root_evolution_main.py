@@ -6,11 +6,9 @@ Com animações estilo Mr. Robot e terminal Kali Linux
 
 import os
 import sys
-import time
 import random
 import shutil
-import threading
-import json
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
@@ -21,6 +19,19 @@ except ImportError as e:
     print("Certifique-se que utils/terminal_kali.py existe.")
     sys.exit(1)
 
+# Relógio global (todas as pausas e animações passam por ele)
+from utils.relogio import dormir, agora
+from utils.tela import tela
+from utils.capacidades import interativo, preparar_saida
+from utils.layout import layout
+from utils.efeitos import ChuvaMatrix, TabelasGlitch
+from utils.saves import servico_saves
+from utils.diario import diario_de
+from utils.autosave import autosave
+from chapters import registro_capitulos
+from utils.sessao_io import sessao_atual, na_sessao
+from utils.teclado import Teclado
+
 # Importar Sistema de Bitcoin
 try:
     from bitcoin_and_market import BitcoinSystem
@@ -30,13 +41,22 @@ except ImportError:
 
 class IntroMenu:
     
-    def __init__(self):
-        try:
-            self.term_width = shutil.get_terminal_size().columns
-            self.term_height = shutil.get_terminal_size().lines
-        except:
-            self.term_width = 100
-            self.term_height = 30
+    # Saves exibidos por página no menu de carregar
+    SAVES_POR_PAGINA = 10
+    
+    # Separa o espaço de saves do jogador (modo servidor) do nome do save
+    SEPARADOR_ESPACO = '@'
+    
+    def __init__(self, io=None, espaco_saves=None):
+        # Terminal do jogador (stdin/stdout do processo, ou uma sessão do servidor)
+        self.io = io if io is not None else sessao_atual()
+        
+        # No servidor cada jogador tem o próprio espaço: saves "<espaço>@<codinome>_..."
+        self.prefixo_saves = f"{espaco_saves}{self.SEPARADOR_ESPACO}" if espaco_saves else ""
+        
+        # Tamanho do terminal vem do layout (atualizado via SIGWINCH)
+        self.layout = layout
+        self.layout.observar()
         
         self.padding = 30
         self.content_width = self.term_width - (self.padding * 2)
@@ -55,25 +75,89 @@ class IntroMenu:
         
         # Flag para controlar se já mostrou introdução
         self.intro_mostrada = False
+        self._teclado = None
         self.pular_introducao = False
         self.prompt_pular_mostrado = False
         
         # Estado atual do jogo (para menu de jogo)
         self.jogo_atual = None
         
+        # Saída sem terminal (pipe/CI): sem animações nem códigos de cursor
+        self.interativo = interativo(self.io)
+        
+        # Ruído do glitch pré-calculado (refeito só quando a largura muda)
+        self.glitch = TabelasGlitch("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*()_+-=[]{}|;:,.<>?/\\")
+        
+        # Renderizador compartilhado (limpeza ANSI + redesenho por diferença)
+        self.tela = tela
+        
+        # Redimensionar invalida o quadro anterior do renderizador
+        self.layout.ao_redimensionar(self.tela.invalidar)
+        
+        # Gravação atômica dos saves e índice para o menu de carregar
+        self.saves = servico_saves
+        self.indice_saves = servico_saves.indice
+        
+        # Gravações saem do fluxo de entrada (thread de autosave)
+        self.autosave = autosave
+        
+        # Capítulos descobertos uma vez; módulos em cache até o arquivo mudar
+        self.capitulos = registro_capitulos
+        
         # Inicializar subsistemas
         self.bitcoin_system = BitcoinSystem(self)
         
+    @property
+    def term_width(self):
+        return self.layout.colunas
+    
+    @property
+    def term_height(self):
+        return self.layout.linhas
+    
+    @property
+    def pular_introducao(self):
+        """Consultado a cada quadro das animações: lê o ENTER sem bloquear"""
+        if not self._pular and self._teclado is not None and self._teclado.enter_pressionado():
+            self._pular = True
+        return self._pular
+    
+    @pular_introducao.setter
+    def pular_introducao(self, valor):
+        self._pular = valor
+    
+    @contextmanager
+    def _ler_teclado(self):
+        """Teclado lido sem bloqueio durante o bloco (nada é lido fora dele)"""
+        with Teclado(self.io) as teclado:
+            self._teclado = teclado
+            try:
+                yield teclado
+            finally:
+                self._teclado = None
+    
+    def _pausa(self, segundos):
+        """Pausa da introdução que acaba assim que o ENTER chega"""
+        if self._teclado is None or self._pular:
+            dormir(segundos)
+        elif self._teclado.esperar(segundos):
+            self._pular = True
+    
     # ========== EFEITOS VISUAIS SIMPLIFICADOS ==========
     
     def _limpar_tela(self):
         """Limpa a tela"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        self.tela.limpar()
     
     def _efeito_digitacao(self, texto, delay=0.01, cor=None, fim="\n", 
                       pode_pular=True, verificar_pular_cada=1):
         """Efeito de digitação avançado"""
         
+        if not self.interativo:
+            sys.stdout.write(texto + fim)
+            sys.stdout.flush()
+            return False
+        
         try:
             if cor is None:
                 cor = self.BRANCO
@@ -114,7 +198,7 @@ class IntroMenu:
                 
                 # Aplicar delay
                 if tempo_delay > 0:
-                    time.sleep(tempo_delay)
+                    dormir(tempo_delay)
             
             # Finalizar
             sys.stdout.write(self.RESET + fim)
@@ -133,10 +217,12 @@ class IntroMenu:
     
     def _glitch_terminal(self, duracao=2.0):
         """Efeito de glitch de terminal"""
-        tempo_inicial = time.time()
-        caracteres = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*()_+-=[]{}|;:,.<>?/\\"
+        if not self.interativo:
+            return False
+        
+        tempo_inicial = agora()
         
-        while time.time() - tempo_inicial < duracao:
+        while agora() - tempo_inicial < duracao:
             # Verificar se deve pular
             if self.pular_introducao:
                 return True
@@ -144,20 +230,23 @@ class IntroMenu:
             # Limpar linha atual
             sys.stdout.write("\r")
             
-            # Gerar texto glitchado
-            texto_glitch = ''.join(random.choice(caracteres) for _ in range(self.term_width))
+            # Próximo quadro do anel de ruído
+            texto_glitch = self.glitch.ruido(self.term_width)
             sys.stdout.write(f"{self.VERDE}{texto_glitch}")
             sys.stdout.flush()
-            time.sleep(0.05)
+            dormir(0.05)
             
             # Limpar
-            sys.stdout.write("\r" + " " * self.term_width + "\r")
+            sys.stdout.write("\r\033[K\r")
             sys.stdout.flush()
-            time.sleep(0.03)
+            dormir(0.03)
         return False
     
     def _linhas_scan(self, linhas=20, velocidade=0.05):
         """Efeito de scanlines"""
+        if not self.interativo:
+            return False
+        
         for _ in range(linhas):
             # Verificar se deve pular
             if self.pular_introducao:
@@ -165,50 +254,19 @@ class IntroMenu:
                 
             linha = "_" * self.term_width
             print(f"{self.VERDE}{linha}{self.RESET}")
-            time.sleep(velocidade)
+            dormir(velocidade)
         self._limpar_tela()
         return False
     
-    def _chuva_matrix(self, duracao=3.0):
-        """Chuva de caracteres estilo Matrix"""
-        caracteres = "01█▓▒░"
-        colunas = [0] * (self.term_width // 2)
-        tempo_inicial = time.time()
-        
-        print("\033[?25l")  # Esconder cursor
-        
+    def _chuva_matrix(self, duracao=3.0, fps=10):
+        """Chuva de caracteres estilo Matrix (compositor com uma escrita por quadro)"""
+        self._limpar_tela()
+        chuva = ChuvaMatrix(self.term_width, self.term_height, fps=fps,
+                            cor=self.VERDE, reset=self.RESET)
         try:
-            while time.time() - tempo_inicial < duracao:
-                # Verificar se deve pular
-                if self.pular_introducao:
-                    print("\033[?25h")  # Mostrar cursor novamente
-                    self._limpar_tela()
-                    return True
-                    
-                for i in range(len(colunas)):
-                    if colunas[i] > 0 or random.random() > 0.95:
-                        if colunas[i] >= self.term_height or random.random() > 0.9:
-                            colunas[i] = 0
-                        else:
-                            colunas[i] += 1
-                        
-                        # Imprimir caractere
-                        if colunas[i] > 0:
-                            col = i * 2
-                            linha = colunas[i]
-                            caractere = random.choice(caracteres)
-                            
-                            # Posicionar cursor e imprimir
-                            if linha > 0:
-                                print(f"\033[{linha-1};{col}H {self.RESET}", end="")
-                            print(f"\033[{linha};{col}H{self.VERDE}{caractere}{self.RESET}", end="")
-                
-                sys.stdout.flush()
-                time.sleep(0.1)
+            return chuva.executar(duracao, deve_parar=lambda: self.pular_introducao)
         finally:
-            print("\033[?25h")  # Mostrar cursor novamente
             self._limpar_tela()
-        return False
     
     def _piscar_erro(self, texto, repeticoes=5):
         """Efeito de piscar erro - versão final corrigida"""
@@ -232,7 +290,7 @@ class IntroMenu:
                 # Mostrar texto
                 print(f"{self.VERMELHO}{texto}{self.RESET}")
                 sys.stdout.flush()
-                time.sleep(0.1)
+                dormir(0.1)
                 
                 # Restaurar posição e limpar
                 sys.stdout.write("\033[u\033[K")
@@ -240,7 +298,7 @@ class IntroMenu:
                 
                 # Última piscada não precisa esperar
                 if i < repeticoes - 1:
-                    time.sleep(0.1)
+                    dormir(0.1)
             
             # Garantir limpeza final
             sys.stdout.write("\033[u\033[K")
@@ -341,11 +399,11 @@ class IntroMenu:
                 sys.stdout.flush()
                 
             if delay >= 0.01:
-                time.sleep(0.1)
+                dormir(0.1)
 
     def _finalizar_boot_sequence(self):
         """Finaliza a sequência de boot"""
-        time.sleep(1.0)
+        dormir(1.0)
         self._limpar_tela()
 
 
@@ -434,18 +492,18 @@ class IntroMenu:
                 # É um comando - digitar com delay
                 self._efeito_digitacao(f"└──╼ {self.CIANO}#{self.RESET} {cmd}", delay=0.01, fim="")
                 print()
-                time.sleep(0.3)
+                dormir(0.3)
             elif cmd.strip() == "":
                 # Linha vazia
                 print()
-                time.sleep(0.1)
+                dormir(0.1)
             else:
                 # É output - mostrar rápido
                 print(f"     {cmd}")
-                time.sleep(0.05)
+                dormir(0.05)
         
         if not self.pular_introducao:
-            time.sleep(1)
+            dormir(1)
         
         self._limpar_tela()
         
@@ -457,7 +515,7 @@ class IntroMenu:
             print(f"{' ' * ((self.term_width - 40) // 2)}{self.VERDE}║   STATUS: CONECTADO                   ║")
             print(f"{' ' * ((self.term_width - 40) // 2)}{self.VERDE}╚══════════════════════════════════════╝{self.RESET}")
             
-            time.sleep(2)
+            dormir(2)
  ########################################################################   
     # ========== INTRODUÇÃO ESTILO MR. ROBOT ==========
     
@@ -530,7 +588,7 @@ class IntroMenu:
                 return
                 
             if texto == "":
-                time.sleep(0.1)
+                self._pausa(0.1)
                 continue
             
             espacamento = " " * ((self.term_width - len(texto)) // 2)
@@ -542,12 +600,12 @@ class IntroMenu:
             else:
                 # Linha normal
                 self._efeito_digitacao(f"{espacamento}{cor}{texto}{self.RESET}", delay=0.01)
-                time.sleep(0.1)
+                self._pausa(0.1)
         
         if self.pular_introducao:
             return
             
-        time.sleep(0.2)
+        self._pausa(0.2)
 
     def _animacao_transicao_conexao(self):
         """Animação de transição e conexão"""
@@ -565,11 +623,11 @@ class IntroMenu:
                 
             pontos = "." * ((i % 3) + 1)
             print(f"\r" + " " * 20 + f"ESTABELECENDO CONEXÃO{pontos}", end="")
-            time.sleep(0.2)
+            self._pausa(0.2)
         
         if not self.pular_introducao:
             print(f"\r" + " " * 20 + f"{self.VERDE}CONEXÃO ESTABELECIDA{self.RESET}")
-            time.sleep(0.5)
+            self._pausa(0.5)
 
     def _animacao_chuva_matrix(self):
         """Efeito de chuva de código estilo Matrix"""
@@ -592,10 +650,10 @@ class IntroMenu:
                 
             espacamento = " " * ((self.term_width - len(tagline)) // 2)
             print(espacamento + tagline)
-            time.sleep(1)
+            self._pausa(1)
         
         if not self.pular_introducao:
-            time.sleep(1.5)
+            self._pausa(1.5)
         
         self._limpar_tela()
 #########################################################
@@ -605,6 +663,11 @@ class IntroMenu:
         """Mostra o prompt para pular a introdução"""
         if self.prompt_pular_mostrado:
             return
+        
+        # Sem terminal não há contagem regressiva (nem leitura do stdin)
+        if not self.interativo:
+            self.prompt_pular_mostrado = True
+            return
             
         self._limpar_tela()
         
@@ -630,25 +693,9 @@ class IntroMenu:
         contador = 5
         texto_contador_base = "Aguarde X segundos..."
         
-        # Thread para detectar Enter com sincronização
-        enter_pressionado = threading.Event()
-        
-        def esperar_enter():
-            try:
-                input()  # Espera Enter
-                enter_pressionado.set()
-                self.pular_introducao = True
-            except (EOFError, KeyboardInterrupt):
-                enter_pressionado.set()
-                self.pular_introducao = True
-        
-        # Iniciar thread para detectar Enter
-        thread_enter = threading.Thread(target=esperar_enter, daemon=True)
-        thread_enter.start()
-        
         # Mostrar contador
         for i in range(contador, 0, -1):
-            if self.pular_introducao or enter_pressionado.is_set():
+            if self.pular_introducao:
                 break
                 
             texto_contador_display = f"Aguarde {i} segundos..."
@@ -660,11 +707,8 @@ class IntroMenu:
                 print(f"\033[F\033[K", end="")  # Voltar linha e limpar
             print(espacamento3 + texto_contador)
             
-            # Esperar 1 segundo ou até Enter ser pressionado
-            for _ in range(10):
-                if self.pular_introducao or enter_pressionado.is_set():
-                    break
-                time.sleep(0.1)
+            # Esperar 1 segundo ou até Enter ser pressionado (o seletor acorda na hora)
+            self._pausa(1)
 
           
         self.prompt_pular_mostrado = True
@@ -673,81 +717,62 @@ class IntroMenu:
     
     # ========== LOGO SIMPLIFICADO ==========
     
-    def _mostrar_logo(self):
-        """Mostra o logo de forma mais limpa"""
-        self._limpar_tela()
-        
-        logo = f"""
-{self.VERDE}
-{' ' * ((self.term_width - 50) // 2)}╔══════════════════════════════════════════════════╗
-{' ' * ((self.term_width - 50) // 2)}║                                                  ║
-{' ' * ((self.term_width - 50) // 2)}║        ██████╗  ██████╗  ██████╗ ████████╗       ║
-{' ' * ((self.term_width - 50) // 2)}║        ██╔══██╗██╔═══██╗██╔═══██╗╚══██╔══╝       ║
-{' ' * ((self.term_width - 50) // 2)}║        ██████╔╝██║   ██║██║   ██║   ██║          ║
-{' ' * ((self.term_width - 50) // 2)}║        ██╔══██╗██║   ██║██║   ██║   ██║          ║
-{' ' * ((self.term_width - 50) // 2)}║        ██║  ██║╚██████╔╝╚██████╔╝   ██║          ║
-{' ' * ((self.term_width - 50) // 2)}║        ╚═╝  ╚═╝ ╚═════╝  ╚═════╝    ╚═╝          ║
-{' ' * ((self.term_width - 50) // 2)}║                                                  ║
-{' ' * ((self.term_width - 50) // 2)}║        ROOT EVOLUTION v2.1                       ║
-{' ' * ((self.term_width - 50) // 2)}║                                                  ║
-{' ' * ((self.term_width - 50) // 2)}╚══════════════════════════════════════════════════╝
-{self.RESET}
-"""
-        
-        # Animar logo aparecendo
-        for linha in logo.split('\n'):
-            if linha.strip():
-                self._efeito_digitacao(linha, delay=0.00, cor=self.VERDE, fim="")
-                print()
-        
+    def _linhas_logo(self):
+        """Linhas do logo (usadas tanto na animação quanto nos quadros de menu)"""
+        arte = [
+            "╔══════════════════════════════════════════════════╗",
+            "║                                                  ║",
+            "║        ██████╗  ██████╗  ██████╗ ████████╗       ║",
+            "║        ██╔══██╗██╔═══██╗██╔═══██╗╚══██╔══╝       ║",
+            "║        ██████╔╝██║   ██║██║   ██║   ██║          ║",
+            "║        ██╔══██╗██║   ██║██║   ██║   ██║          ║",
+            "║        ██║  ██║╚██████╔╝╚██████╔╝   ██║          ║",
+            "║        ╚═╝  ╚═╝ ╚═════╝  ╚═════╝    ╚═╝          ║",
+            "║                                                  ║",
+            "║        ROOT EVOLUTION v2.1                       ║",
+            "║                                                  ║",
+            "╚══════════════════════════════════════════════════╝",
+        ]
+        linhas = [f"{self.VERDE}{linha}{self.RESET}" for linha in self.layout.centralizar_bloco(arte)]
         
         # Sub-título
         subtitulo = f"{self.CINZA}« hack the system. become root. »{self.RESET}"
-        espacamento = " " * ((self.term_width - len(subtitulo)) // 2)
-        print(f"\n{espacamento}{subtitulo}")
-        
-        time.sleep(0.1)
+        linhas += ["", self.layout.centralizar(subtitulo)]
+        return linhas
+
+    def _mostrar_logo(self):
+        """Mostra o logo de forma mais limpa"""
+        self._limpar_tela()
+        sys.stdout.write('\n' + '\n'.join(self._linhas_logo()) + '\n')
+        sys.stdout.flush()
+        dormir(0.1)
     
     # ========== SISTEMA DE SAVE/LOAD COMPATÍVEL ==========
     
-    def _listar_saves_disponiveis(self):
-        """Lista jogos salvos compatíveis"""
-        pasta_saves = Path("saves")
-        saves = []
-        
-        if pasta_saves.exists():
-            for arquivo_save in pasta_saves.glob("*.json"):
-                try:
-                    with open(arquivo_save, 'r', encoding='utf-8') as f:
-                        dados = json.load(f)
-                    
-                    # Verificar se é um save compatível
-                    if 'player_name' in dados and 'codiname' in dados:
-                        saves.append({
-                            'arquivo': str(arquivo_save),
-                            'nome_jogador': dados['player_name'],
-                            'codinome': dados['codiname'],
-                            'capitulo': dados.get('current_chapter', 1),
-                            'data': dados.get('last_seen', datetime.now().isoformat()),
-                            'bitcoin': dados.get('bitcoin_wallet', 0)
-                        })
-                except:
-                    continue
-        
-        return sorted(saves, key=lambda x: x['data'], reverse=True)
+    def _listar_saves_disponiveis(self, pagina=0, por_pagina=None):
+        """Lista jogos salvos compatíveis do espaço deste jogador (mais recentes primeiro, via índice)"""
+        saves = [save for save in self.indice_saves.listar('data', decrescente=True)
+                 if self._save_do_espaco(save['arquivo'])]
+        if por_pagina is not None:
+            saves = saves[pagina * por_pagina:(pagina + 1) * por_pagina]
+        return saves
+    
+    def _save_do_espaco(self, arquivo):
+        """Save pertence a este jogador? (sem espaço, só os saves sem prefixo)"""
+        nome = os.path.basename(arquivo)
+        if self.prefixo_saves:
+            return nome.startswith(self.prefixo_saves)
+        return self.SEPARADOR_ESPACO not in nome
     
     def _carregar_jogo(self, arquivo_save):
         """Carrega jogo salvado"""
         try:
-            with open(arquivo_save, 'r', encoding='utf-8') as f:
-                dados = json.load(f)
+            # Snapshot + eventos do diário posteriores a ele (recupera quedas)
+            dados = diario_de(arquivo_save).recuperar(self.saves.carregar(arquivo_save))
             
-            # Atualizar última vez visto
+            # Atualizar última vez visto (só no índice; carregar não regrava o save)
             dados['last_seen'] = datetime.now().isoformat()
-            
-            # Salvar de volta
-            with open(arquivo_save, 'w', encoding='utf-8') as f:
-                json.dump(dados, f, indent=2, ensure_ascii=False)
+            self.indice_saves.registrar_acesso(arquivo_save, dados)
             
             return dados
         except Exception as e:
@@ -758,13 +783,10 @@ class IntroMenu:
         """Salva jogo no formato compatível"""
         if arquivo_save is None:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            arquivo_save = f"saves/{dados_jogador['codiname']}_{timestamp}.json"
-        
-        # Garantir diretório existe
-        Path("saves").mkdir(exist_ok=True)
+            arquivo_save = f"saves/{self.prefixo_saves}{dados_jogador['codiname']}_{timestamp}{self.saves.extensao}"
         
-        with open(arquivo_save, 'w', encoding='utf-8') as f:
-            json.dump(dados_jogador, f, indent=2, ensure_ascii=False)
+        # Snapshot vai para a fila do autosave (gravado em segundo plano)
+        self.autosave.agendar(arquivo_save, dados_jogador)
         
         return arquivo_save
     
@@ -772,50 +794,19 @@ class IntroMenu:
     
     def _verificar_capitulos_disponiveis(self):
         """Verifica quais capítulos estão disponíveis na pasta chapters/"""
-        pasta_capitulos = Path("chapters")
-        capitulos = []
-        
-        if not pasta_capitulos.exists():
-            return capitulos
-        
-        for arquivo in pasta_capitulos.glob("chapter_*.py"):
-            try:
-                # Extrair número do capítulo do nome do arquivo
-                nome = arquivo.stem  # "chapter_01"
-                num = nome.split("_")[1]  # "01"
-                capitulos.append({
-                    'arquivo': str(arquivo),
-                    'numero': int(num),
-                    'nome': nome
-                })
-            except:
-                continue
-        
-        return sorted(capitulos, key=lambda x: x['numero'])
+        return self.capitulos.capitulos()
     
     def _executar_capitulo(self, numero_capitulo, dados_jogador, arquivo_save):
         """Executa um capítulo específico usando o Controlador Central"""
-        # Garantir imports corretos
-        import sys
-        import importlib.util
         from chapters.chapters_control import ChapterController
         
-        capitulos = self._verificar_capitulos_disponiveis()
-        
-        if not capitulos:
+        if not self._verificar_capitulos_disponiveis():
             self._mostrar_erro_sem_capitulos()
             return False
         
-        # Encontrar o capítulo correto
-        capitulo_alvo = None
-        for cap in capitulos:
-            if cap['numero'] == numero_capitulo:
-                capitulo_alvo = cap
-                break
-        
-        if not capitulo_alvo:
+        if not self.capitulos.existe(numero_capitulo):
             print(f"{self.VERMELHO}Capítulo {numero_capitulo} não encontrado!{self.RESET}")
-            time.sleep(1.5)
+            dormir(1.5)
             # Retorna dados sem alterar progresso
             return dados_jogador
         
@@ -823,19 +814,24 @@ class IntroMenu:
             # Salvar estado atual antes de iniciar capítulo
             # IMPORTANTE: Não atualizamos 'current_chapter' aqui cegamente, o controlador fará isso
             self._salvar_jogo(dados_jogador, arquivo_save)
+            # Troca de capítulo: a fila é gravada durante a transição
+            self.autosave.descarregar()
+            
+            # Gravação anterior deste save que falhou (continua na fila para nova tentativa)
+            erro_gravacao = self.autosave.erro_pendente(arquivo_save)
+            if erro_gravacao is not None:
+                print(f"{self.AMARELO}[!] Falha ao gravar o save em segundo plano: {erro_gravacao}{self.RESET}")
             
             # Efeito de transição
             self._limpar_tela()
             print(f"\n{' ' * ((self.term_width - 40) // 2)}{self.VERDE}INICIANDO CAPÍTULO {numero_capitulo}...{self.RESET}")
-            time.sleep(1)
+            dormir(1)
             
-            # Executar capítulo (usando importlib como já estava)
-            spec = importlib.util.spec_from_file_location(f"chapter_{numero_capitulo:02d}", capitulo_alvo['arquivo'])
-            modulo = importlib.util.module_from_spec(spec)
+            # Módulo do registro (só reimportado se o arquivo mudou)
+            modulo = self.capitulos.carregar(numero_capitulo)
             
-            # Carregar módulo
-            sys.modules[f"chapter_{numero_capitulo:02d}"] = modulo # Registrar em sys.modules
-            spec.loader.exec_module(modulo)
+            # Próximo capítulo é importado em segundo plano durante este
+            self.capitulos.precarregar(numero_capitulo + 1)
             
             # Verificar se tem função iniciar
             if not hasattr(modulo, 'iniciar'):
@@ -843,7 +839,7 @@ class IntroMenu:
                 return False
                 
             # Executar função iniciar
-            resultado_bruto = modulo.iniciar(dados_jogador, arquivo_save)
+            resultado_bruto = modulo.iniciar(dados_jogador, arquivo_save, io=self.io)
             
             # Se retornou None, erro fatal
             if resultado_bruto is None:
@@ -853,13 +849,26 @@ class IntroMenu:
             controller = ChapterController()
             dados_processados = controller.processar_resultado(dados_jogador, resultado_bruto)
             
-            return dados_processados
+            # Resultado volta para o estado em memória (campos ausentes no retorno são mantidos)
+            dados_jogador.update(dados_processados)
+            concluido = dados_jogador.pop('completed', False)
+            if concluido:
+                # Conclusão vai para o diário na hora; o snapshot sai no próximo salvamento
+                diario_de(arquivo_save).registrar('capitulo', {
+                    'current_chapter': dados_jogador['current_chapter'],
+                    'completed_chapters': dados_jogador.get('completed_chapters', []),
+                }, capitulo=numero_capitulo)
+            
+            # Fim do capítulo: grava o que o capítulo deixou na fila
+            self.autosave.descarregar()
+            
+            return dados_jogador
                 
         except Exception as e:
             print(f"{self.VERMELHO}Erro crítico ao executar capítulo {numero_capitulo}: {e}{self.RESET}")
             import traceback
             traceback.print_exc()
-            input("Pressione ENTER para voltar ao menu...")
+            self.io.ler("Pressione ENTER para voltar ao menu...")
             return None
             return False
     
@@ -873,38 +882,42 @@ class IntroMenu:
         print(f"{' ' * ((self.term_width - 60) // 2)}{self.CINZA}Certifique-se de que os arquivos chapter_01.py, chapter_02.py, etc.")
         print(f"{' ' * ((self.term_width - 60) // 2)}{self.CINZA}estão presentes na pasta chapters/.{self.RESET}")
         
-        input(f"\n{' ' * ((self.term_width - 25) // 2)}{self.CINZA}[ENTER PARA CONTINUAR]{self.RESET}")
+        self.io.ler(f"\n{' ' * ((self.term_width - 25) // 2)}{self.CINZA}[ENTER PARA CONTINUAR]{self.RESET}")
     
     # ========== MENU PRINCIPAL ==========
     
+    def _quadro_menu_principal(self):
+        """Monta as linhas do menu principal"""
+        quadro = [""] + self._linhas_logo() + [""]
+        quadro.append(self.layout.centralizar(f"{self.VERDE}MENU PRINCIPAL{self.RESET}"))
+        quadro.append(self.layout.centralizar(f"{self.CINZA}════════════════════{self.RESET}"))
+        quadro.append("")
+        
+        opcoes = [
+            ("1", "NOVO JOGO", self.VERDE),
+            ("2", "CARREGAR JOGO", self.VERDE),
+            ("3", "MANUAL HACKER", self.VERDE),
+            ("4", "INFORMAÇÕES DO SISTEMA", self.CINZA),
+            ("0", "SAIR", self.VERMELHO)
+        ]
+        quadro += self.layout.centralizar_bloco(
+            [f"{cor}[{num}] {texto}{self.RESET}" for num, texto, cor in opcoes]
+        )
+        
+        quadro.append('Pressione [ENTER]...') ## temporario???
+        return quadro
+    
     def _mostrar_menu_principal(self):
         """Menu principal com controle de estado correto"""
         
         menu_ativo = True
         
         while menu_ativo:
-            self._limpar_tela()
-            self._mostrar_logo()
-            
-            print(f"\n{' ' * ((self.term_width - 20) // 2)}{self.VERDE}MENU PRINCIPAL{self.RESET}")
-            print(f"{' ' * ((self.term_width - 20) // 2)}{self.CINZA}════════════════════{self.RESET}\n")
-            
-            opcoes = [
-                ("1", "NOVO JOGO", self.VERDE),
-                ("2", "CARREGAR JOGO", self.VERDE),
-                ("3", "MANUAL HACKER", self.VERDE),
-                ("4", "INFORMAÇÕES DO SISTEMA", self.CINZA),
-                ("0", "SAIR", self.VERMELHO)
-            ]
-            
-            for num, texto, cor in opcoes:
-                espacamento = " " * ((self.term_width - 25) // 2)
-                print(f"{espacamento}{cor}[{num}] {texto}{self.RESET}")
-            
-            print('Pressione [ENTER]...') ## temporario??? 
-            
+            # Quadro em cache por tamanho de terminal; o renderizador envia só o que mudou
+            self.tela.renderizar(self.layout.quadro(('menu_principal',), self._quadro_menu_principal))
+
             try:
-                escolha = input(f"{' ' * ((self.term_width - 20) // 2)}{self.BRANCO}SELECIONE > {self.RESET}").strip()
+                escolha = self.io.ler(f"{' ' * ((self.term_width - 20) // 2)}{self.BRANCO}SELECIONE > {self.RESET}").strip()
                 
                 if escolha == "1":
                     self._novo_jogo()
@@ -927,7 +940,7 @@ class IntroMenu:
                     
                 else:
                     print(f"\n{' ' * ((self.term_width - 15) // 2)}{self.VERMELHO}Opção inválida!{self.RESET}")
-                    time.sleep(1)
+                    dormir(1)
                     
             except KeyboardInterrupt:
                 if self._confirmar_saida():
@@ -945,19 +958,61 @@ class IntroMenu:
         opcoes_text = "[S] Sim  [N] Não"
         print(f"{' ' * ((self.term_width - len(opcoes_text)) // 2)}{self.CINZA}{opcoes_text}{self.RESET}")
         
-        resposta = input(f"{' ' * ((self.term_width - 2) // 2)}{self.BRANCO}> {self.RESET}").strip().upper()
+        resposta = self.io.ler(f"{' ' * ((self.term_width - 2) // 2)}{self.BRANCO}> {self.RESET}").strip().upper()
         
         return resposta == "S" or resposta == "SIM"
 
     def _mostrar_erro(self, mensagem):
         """Mostra mensagem de erro temporária"""
         print(f"\n{' ' * ((self.term_width - len(mensagem)) // 2)}{self.VERMELHO}{mensagem}{self.RESET}")
-        time.sleep(1.2)
+        dormir(1.2)
 
 
 
     # ========== MENU DE JOGO (após criar/carregar jogo) ==========
     
+    def _quadro_menu_jogo(self, dados_jogador):
+        """Monta as linhas do menu de jogo"""
+        # Cabeçalho com informações do jogador
+        cabecalho = self.layout.centralizar_bloco([
+            "┌──────────────────────────────────────────────────┐",
+            "│           R O O T  E V O L U T I O N             │",
+            "└──────────────────────────────────────────────────┘",
+        ])
+        quadro = [""] + [f"{self.VERDE}{linha}{self.RESET}" for linha in cabecalho]
+        
+        # Informações do jogador (alinhadas com a caixa do cabeçalho)
+        margem = self.layout.margem(52)
+        info = [
+            f"{self.CIANO}JOGADOR: {self.BRANCO}{dados_jogador['player_name']}",
+            f"{self.CIANO}CODINOME: {self.VERDE}{dados_jogador['codiname']}",
+            f"{self.CIANO}CAPÍTULO ATUAL: {self.AMARELO}{dados_jogador.get('current_chapter', 1)}",
+        ]
+        
+        # Mostrar Bitcoin se disponível
+        if 'bitcoin_wallet' in dados_jogador:
+            btc = dados_jogador['bitcoin_wallet']
+            info.append(f"{self.CIANO}BITCOIN: {self.VERDE}{btc:.6f} BTC")
+        
+        quadro += [""] + [f"{margem}{linha}{self.RESET}" for linha in info]
+        quadro += ["", self.layout.centralizar(f"{self.CINZA}{'─' * 30}{self.RESET}"), ""]
+        
+        # Opções do menu de jogo
+        opcoes = [
+            ("[1]", "CONTINUAR JOGO", self.VERDE),
+            ("[2]", "CARTEIRA BITCOIN", self.AMARELO),
+            ("[3]", "MANUAL DE HACKING", self.CIANO),
+            ("[4]", "STATUS DO JOGO", self.BRANCO),
+            ("[5]", "SALVAR JOGO", self.VERDE),
+            ("[6]", "VOLTAR AO MENU PRINCIPAL", self.CINZA),
+            ("[0]", "SAIR DO JOGO", self.VERMELHO)
+        ]
+        quadro += self.layout.centralizar_bloco(
+            [f"{cor}[{num}] {texto}{self.RESET}" for num, texto, cor in opcoes]
+        )
+        quadro.append("")
+        return quadro
+    
     def _mostrar_menu_jogo(self, dados_jogador, arquivo_save):
         """Menu principal do jogo (mostrado depois de criar/carregar jogo)"""
         self.jogo_atual = {
@@ -967,47 +1022,14 @@ class IntroMenu:
         
         menu_jogo_ativo = True
         while menu_jogo_ativo and self.running:
-            self._limpar_tela()
-            
-            # Cabeçalho com informações do jogador
-            print(f"\n{' ' * ((self.term_width - 50) // 2)}{self.VERDE}┌──────────────────────────────────────────────────┐")
-            print(f"{' ' * ((self.term_width - 50) // 2)}{self.VERDE}│           R O O T  E V O L U T I O N             │")
-            print(f"{' ' * ((self.term_width - 50) // 2)}{self.VERDE}└──────────────────────────────────────────────────┘{self.RESET}")
-            
-            # Informações do jogador
-            print(f"\n{' ' * ((self.term_width - 50) // 2)}{self.CIANO}JOGADOR: {self.BRANCO}{dados_jogador['player_name']}")
-            print(f"{' ' * ((self.term_width - 50) // 2)}{self.CIANO}CODINOME: {self.VERDE}{dados_jogador['codiname']}")
-            print(f"{' ' * ((self.term_width - 50) // 2)}{self.CIANO}CAPÍTULO ATUAL: {self.AMARELO}{dados_jogador.get('current_chapter', 1)}")
-            
-            # Mostrar Bitcoin se disponível
-            if 'bitcoin_wallet' in dados_jogador:
-                btc = dados_jogador['bitcoin_wallet']
-                print(f"{' ' * ((self.term_width - 50) // 2)}{self.CIANO}BITCOIN: {self.VERDE}{btc:.6f} BTC")
-            
-            print(f"\n{' ' * ((self.term_width - 30) // 2)}{self.CINZA}{'─' * 30}{self.RESET}\n")
-            
-            # Opções do menu de jogo
-            opcoes = [
-                ("[1]", "CONTINUAR JOGO", self.VERDE),
-                ("[2]", "CARTEIRA BITCOIN", self.AMARELO),
-                ("[3]", "MANUAL DE HACKING", self.CIANO),
-                ("[4]", "STATUS DO JOGO", self.BRANCO),
-                ("[5]", "SALVAR JOGO", self.VERDE),
-                ("[6]", "VOLTAR AO MENU PRINCIPAL", self.CINZA),
-                ("[0]", "SAIR DO JOGO", self.VERMELHO)
-            ]
-            
-            for num, texto, cor in opcoes:
-                espacamento = " " * ((self.term_width - 35) // 2)
-                opcao = f"{espacamento}{cor}[{num}] {texto}{self.RESET}"
-                print(opcao)
-                time.sleep(0.01)
-            
-            print()
-            
+            # Só remonta o quadro quando os dados exibidos ou o tamanho mudam
+            chave = ('menu_jogo', dados_jogador['player_name'], dados_jogador['codiname'],
+                     dados_jogador.get('current_chapter', 1), dados_jogador.get('bitcoin_wallet'))
+            self.tela.renderizar(self.layout.quadro(chave, lambda: self._quadro_menu_jogo(dados_jogador)))
+
             # Input
             try:
-                escolha = input(f"{' ' * ((self.term_width - 20) // 2)}{self.BRANCO}SELECIONE > {self.RESET}").strip()
+                escolha = self.io.ler(f"{' ' * ((self.term_width - 20) // 2)}{self.BRANCO}SELECIONE > {self.RESET}").strip()
                 
                 if escolha == "1":
                     self._continuar_jogo(dados_jogador, arquivo_save)
@@ -1028,11 +1050,11 @@ class IntroMenu:
                     menu_jogo_ativo = False
                 else:
                     print(f"\n{' ' * ((self.term_width - 15) // 2)}{self.VERMELHO}NÚMERO INVÁLIDO{self.RESET}")
-                    time.sleep(0.5)
+                    dormir(0.5)
                     
             except KeyboardInterrupt:
                 print(f"\n\n{self.VERMELHO}INTERROMPIDO{self.RESET}")
-                time.sleep(1)
+                dormir(1)
     
     # ========== FUNÇÕES DO MENU DE JOGO ==========
     
@@ -1053,7 +1075,7 @@ class IntroMenu:
             if sucesso:
                 if dados_jogador.get('saindo_para_menu'):
                     print(f"\n{self.AMARELO}Retornando ao menu principal...{self.RESET}")
-                    time.sleep(1)
+                    dormir(1)
                     jogando = False
                     continue
                 # Verificar se o jogador completou o jogo ou se deve continuar
@@ -1068,12 +1090,9 @@ class IntroMenu:
                     # Se não avançou de capítulo mesmo com sucesso, talvez seja o fim do conteúdo atual
                     print(f"\n{' ' * ((self.term_width - 40) // 2)}{self.VERDE}FIM DO CONTEÚDO DISPONÍVEL{self.RESET}")
                     print(f"{' ' * ((self.term_width - 50) // 2)}{self.CINZA}Aguarde por novas atualizações...{self.RESET}")
-                    time.sleep(3)
+                    dormir(3)
                     jogando = False
-                else:
-                    # Avançou para o próximo, loop continua e carrega o novo
-                    # Pequena pausa dramática entre capítulos
-                    time.sleep(1)
+                # Avançou: o próximo já foi importado (pré-carga) e o loop segue direto
             else:
                 # Se falhou (Game Over ou saiu para menu)
                 jogando = False
@@ -1084,64 +1103,80 @@ class IntroMenu:
         """Abre o manual de hacking completo do arquivo manual_hacking.py"""
         try:
             from manual_hacking import ManualHacking
-            manual = ManualHacking()
+            manual = ManualHacking(io=self.io)
             manual.mostrar_menu()
         except ImportError:
             self._limpar_tela()
             print(f"\n{' ' * ((self.term_width - 40) // 2)}{self.VERMELHO}ERRO: manual_hacking.py não encontrado{self.RESET}")
             print(f"{' ' * ((self.term_width - 50) // 2)}{self.CINZA}Certifique-se que o arquivo existe no diretório raiz.{self.RESET}")
-            input(f"\n{' ' * ((self.term_width - 25) // 2)}{self.CINZA}[ENTER PARA CONTINUAR]{self.RESET}")
+            self.io.ler(f"\n{' ' * ((self.term_width - 25) // 2)}{self.CINZA}[ENTER PARA CONTINUAR]{self.RESET}")
         except AttributeError:
             self._limpar_tela()
             print(f"\n{' ' * ((self.term_width - 40) // 2)}{self.VERMELHO}ERRO: Classe ManualHacking não encontrada{self.RESET}")
             print(f"{' ' * ((self.term_width - 50) // 2)}{self.CINZA}Verifique se o arquivo manual_hacking.py possui a classe correta.{self.RESET}")
-            input(f"\n{' ' * ((self.term_width - 25) // 2)}{self.CINZA}[ENTER PARA CONTINUAR]{self.RESET}")
+            self.io.ler(f"\n{' ' * ((self.term_width - 25) // 2)}{self.CINZA}[ENTER PARA CONTINUAR]{self.RESET}")
         except Exception as e:
             self._limpar_tela()
             print(f"\n{' ' * ((self.term_width - 40) // 2)}{self.VERMELHO}ERRO ao abrir manual: {str(e)}{self.RESET}")
-            input(f"\n{' ' * ((self.term_width - 25) // 2)}{self.CINZA}[ENTER PARA CONTINUAR]{self.RESET}")
+            self.io.ler(f"\n{' ' * ((self.term_width - 25) // 2)}{self.CINZA}[ENTER PARA CONTINUAR]{self.RESET}")
     
     def _mostrar_status_jogo(self, dados_jogador):
         """Mostra status completo do jogo"""
         self._limpar_tela()
         
-        print(f"\n{' ' * ((self.term_width - 40) // 2)}{self.VERDE}╔══════════════════════════════════════╗")
-        print(f"{' ' * ((self.term_width - 40) // 2)}{self.VERDE}║          STATUS DO JOGO              ║")
-        print(f"{' ' * ((self.term_width - 40) // 2)}{self.VERDE}╚══════════════════════════════════════╝{self.RESET}\n")
+        caixa = self.layout.centralizar_bloco([
+            "╔══════════════════════════════════════╗",
+            "║          STATUS DO JOGO              ║",
+            "╚══════════════════════════════════════╝",
+        ])
+        linhas = [""] + [f"{self.VERDE}{linha}" for linha in caixa]
+        linhas[-1] += self.RESET
+        linhas.append("")
         
         # Informações do jogador
-        print(f"{' ' * ((self.term_width - 40) // 2)}{self.CIANO}JOGADOR: {self.BRANCO}{dados_jogador['player_name']}")
-        print(f"{' ' * ((self.term_width - 40) // 2)}{self.CIANO}CODINOME: {self.VERDE}{dados_jogador['codiname']}")
-        print(f"{' ' * ((self.term_width - 40) // 2)}{self.CIANO}CAPÍTULO ATUAL: {self.AMARELO}{dados_jogador.get('current_chapter', 1)}")
-        print(f"{' ' * ((self.term_width - 40) // 2)}{self.CIANO}CAPÍTULOS COMPLETADOS: {self.AMARELO}{len(dados_jogador.get('completed_chapters', []))}")
+        info = [
+            f"{self.CIANO}JOGADOR: {self.BRANCO}{dados_jogador['player_name']}",
+            f"{self.CIANO}CODINOME: {self.VERDE}{dados_jogador['codiname']}",
+            f"{self.CIANO}CAPÍTULO ATUAL: {self.AMARELO}{dados_jogador.get('current_chapter', 1)}",
+            f"{self.CIANO}CAPÍTULOS COMPLETADOS: {self.AMARELO}{len(dados_jogador.get('completed_chapters', []))}",
+        ]
         
         # Bitcoin
         if 'bitcoin_wallet' in dados_jogador:
             btc = dados_jogador['bitcoin_wallet']
-            print(f"{' ' * ((self.term_width - 40) // 2)}{self.CIANO}BITCOIN: {self.VERDE}{btc:.6f} BTC")
+            info.append(f"{self.CIANO}BITCOIN: {self.VERDE}{btc:.6f} BTC")
         
         # Nível de privacidade
         if 'privacy_level' in dados_jogador:
             privacidade = dados_jogador['privacy_level']
             barra = "█" * (privacidade // 10) + "░" * (10 - privacidade // 10)
-            print(f"{' ' * ((self.term_width - 40) // 2)}{self.CIANO}PRIVACIDADE: {self.VERDE}[{barra}] {privacidade}%")
+            info.append(f"{self.CIANO}PRIVACIDADE: {self.VERDE}[{barra}] {privacidade}%")
         
         # Reputação
         if 'reputation' in dados_jogador:
             reputacao = dados_jogador['reputation']
             cor_reputacao = self.VERDE if reputacao >= 0 else self.VERMELHO
-            print(f"{' ' * ((self.term_width - 40) // 2)}{self.CIANO}REPUTAÇÃO: {cor_reputacao}{reputacao}{self.RESET}")
+            info.append(f"{self.CIANO}REPUTAÇÃO: {cor_reputacao}{reputacao}{self.RESET}")
         
         # Acesso à darknet
         if 'darknet_access' in dados_jogador:
             acesso = "SIM" if dados_jogador['darknet_access'] else "NÃO"
             cor_acesso = self.VERDE if dados_jogador['darknet_access'] else self.VERMELHO
-            print(f"{' ' * ((self.term_width - 40) // 2)}{self.CIANO}DARKNET: {cor_acesso}{acesso}{self.RESET}")
+            info.append(f"{self.CIANO}DARKNET: {cor_acesso}{acesso}{self.RESET}")
         
-        print(f"\n{' ' * ((self.term_width - 40) // 2)}{self.CINZA}{'─' * 36}{self.RESET}")
-        print(f"\n{' ' * ((self.term_width - 40) // 2)}{self.CINZA}Último acesso: {dados_jogador.get('last_seen', 'N/A')}{self.RESET}")
+        info += [
+            "",
+            f"{self.CINZA}{'─' * 36}{self.RESET}",
+            "",
+            f"{self.CINZA}Último acesso: {dados_jogador.get('last_seen', 'N/A')}{self.RESET}",
+        ]
         
-        input(f"\n{' ' * ((self.term_width - 25) // 2)}{self.CINZA}[ENTER PARA VOLTAR]{self.RESET}")
+        # Mesma margem da caixa para manter a coluna alinhada
+        margem = self.layout.margem(40)
+        linhas += [f"{margem}{linha}" if linha else linha for linha in info]
+        print('\n'.join(linhas))
+
+        self.io.ler(f"\n{' ' * ((self.term_width - 25) // 2)}{self.CINZA}[ENTER PARA VOLTAR]{self.RESET}")
     
     def _salvar_jogo_atual(self, dados_jogador, arquivo_save):
         """Salva o jogo atual"""
@@ -1149,16 +1184,17 @@ class IntroMenu:
             # Atualizar timestamp
             dados_jogador['last_seen'] = datetime.now().isoformat()
             
-            # Salvar
-            with open(arquivo_save, 'w', encoding='utf-8') as f:
-                json.dump(dados_jogador, f, indent=2, ensure_ascii=False)
-            
+            # Salvar (se só o timestamp mudou, o save em si não é regravado);
+            # salvamento pedido pelo jogador espera a gravação para confirmar
+            self.autosave.agendar(arquivo_save, dados_jogador)
+            self.autosave.descarregar(arquivo_save, esperar=True)
+
             print(f"\n{' ' * ((self.term_width - 30) // 2)}{self.VERDE}Jogo salvo com sucesso!{self.RESET}")
-            time.sleep(1)
+            dormir(1)
             
         except Exception as e:
             print(f"\n{' ' * ((self.term_width - 30) // 2)}{self.VERMELHO}Erro ao salvar: {e}{self.RESET}")
-            time.sleep(1.5)
+            dormir(1.5)
     
     def _sair_do_jogo(self, dados_jogador, arquivo_save):
         """Sai do jogo atual, salvando primeiro"""
@@ -1166,7 +1202,7 @@ class IntroMenu:
         self._salvar_jogo_atual(dados_jogador, arquivo_save)
         
         print(f"\n{' ' * ((self.term_width - 30) // 2)}{self.CINZA}Saindo do jogo...{self.RESET}")
-        time.sleep(1)
+        dormir(1)
         
         self.jogo_atual = None
         self.running = False
@@ -1180,7 +1216,7 @@ class IntroMenu:
         print(f"{' ' * ((self.term_width - 20) // 2)}{self.CINZA}════════════════════{self.RESET}\n")
         
         # Nome do jogador
-        nome = input(f"{' ' * ((self.term_width - 25) // 2)}{self.BRANCO}SEU NOME > {self.RESET}").strip()
+        nome = self.io.ler(f"{' ' * ((self.term_width - 25) // 2)}{self.BRANCO}SEU NOME > {self.RESET}").strip()
         
         if not nome:
             nome = "Neo"
@@ -1196,7 +1232,7 @@ class IntroMenu:
         codinome = random.choice(codinomes) + "_" + str(random.randint(10, 99))
         
         print(f"\n{' ' * ((self.term_width - 30) // 2)}{self.CINZA}APELIDO DESIGNADO: {self.VERDE}{codinome}{self.RESET}")
-        time.sleep(0.5)
+        dormir(0.5)
         
         # Criar estado do jogador
         dados_jogador = {
@@ -1214,10 +1250,10 @@ class IntroMenu:
         }
         
         # Salvar jogo
-        arquivo_save = self._salvar_jogo(dados_jogador, f"saves/{codinome}_initial.json")
+        arquivo_save = self._salvar_jogo(dados_jogador, f"saves/{self.prefixo_saves}{codinome}_initial{self.saves.extensao}")
         
         print(f"\n{' ' * ((self.term_width - 25) // 2)}{self.CINZA}CRIANDO IDENTIDADE...")
-        time.sleep(0.5)
+        dormir(0.5)
         
         # MOSTRA ANIMAÇÃO DO TERMINAL KALI
         self._mostrar_terminal_kali(codinome)
@@ -1231,24 +1267,42 @@ class IntroMenu:
         print(f"\n{' ' * ((self.term_width - 20) // 2)}{self.VERDE}CARREGAR JOGO{self.RESET}")
         print(f"{' ' * ((self.term_width - 20) // 2)}{self.CINZA}════════════════════{self.RESET}\n")
         
+        # Saves ainda na fila do autosave entram na listagem
+        self.autosave.descarregar(esperar=True)
         saves = self._listar_saves_disponiveis()
         
         if not saves:
             print(f"{' ' * ((self.term_width - 30) // 2)}{self.VERMELHO}NENHUM ARQUIVO SALVO ENCONTRADO{self.RESET}")
-            time.sleep(1.5)
+            dormir(1.5)
             return
         
-        # Listar saves
-        for i, save in enumerate(saves, 1):
-            espacamento = " " * ((self.term_width - 50) // 2)
-            print(f"{espacamento}{self.CINZA}[{i}] {self.VERDE}{save['codinome']}")
-            print(f"{espacamento}    {save['nome_jogador']} - Capítulo {save['capitulo']}")
-            if 'bitcoin' in save:
-                print(f"{espacamento}    Bitcoin: {save['bitcoin']:.4f} BTC")
-            print(f"{espacamento}    {save['data'][:10]}{self.RESET}\n")
+        # Listar saves (em páginas, para pastas com muitos jogadores)
+        por_pagina = self.SAVES_POR_PAGINA
+        total_paginas = (len(saves) + por_pagina - 1) // por_pagina
+        pagina = 0
+        while True:
+            inicio = pagina * por_pagina
+            for i, save in enumerate(saves[inicio:inicio + por_pagina], inicio + 1):
+                espacamento = " " * ((self.term_width - 50) // 2)
+                print(f"{espacamento}{self.CINZA}[{i}] {self.VERDE}{save['codinome']}")
+                print(f"{espacamento}    {save['nome_jogador']} - Capítulo {save['capitulo']}")
+                if 'bitcoin' in save:
+                    print(f"{espacamento}    Bitcoin: {save['bitcoin']:.4f} BTC")
+                print(f"{espacamento}    {save['data'][:10]}{self.RESET}\n")
+            
+            if total_paginas > 1:
+                print(f"{' ' * ((self.term_width - 40) // 2)}{self.CINZA}Página {pagina + 1}/{total_paginas} - [N] próxima  [P] anterior{self.RESET}\n")
+            try:
+                escolha = self.io.ler(f"{' ' * ((self.term_width - 20) // 2)}{self.BRANCO}SELECIONE (0 para voltar) > {self.RESET}").strip()
+            except EOFError:
+                return
+            if total_paginas > 1 and escolha.upper() in ("N", "P"):
+                pagina = min(max(pagina + (1 if escolha.upper() == "N" else -1), 0), total_paginas - 1)
+                self._limpar_tela()
+                continue
+            break
         
         try:
-            escolha = input(f"{' ' * ((self.term_width - 20) // 2)}{self.BRANCO}SELECIONE (0 para voltar) > {self.RESET}").strip()
             if escolha == "0":
                 return
             
@@ -1257,7 +1311,7 @@ class IntroMenu:
                 dados_jogador = self._carregar_jogo(saves[idx]['arquivo'])
                 if dados_jogador:
                     print(f"\n{' ' * ((self.term_width - 25) // 2)}{self.VERDE}CARREGANDO...{self.RESET}")
-                    time.sleep(0.5)
+                    dormir(0.5)
                     
                     # Mostra animação rápida do terminal
                     self._mostrar_terminal_kali(dados_jogador['codiname'])
@@ -1266,39 +1320,39 @@ class IntroMenu:
                     self._mostrar_menu_jogo(dados_jogador, saves[idx]['arquivo'])
                 else:
                     print(f"\n{' ' * ((self.term_width - 30) // 2)}{self.VERMELHO}ERRO AO CARREGAR ARQUIVO{self.RESET}")
-                    time.sleep(1)
+                    dormir(1)
         except (ValueError, IndexError):
             print(f"\n{' ' * ((self.term_width - 20) // 2)}{self.VERMELHO}OPÇÃO INVÁLIDA{self.RESET}")
-            time.sleep(1)
+            dormir(1)
         except Exception as e:
             print(f"\n{' ' * ((self.term_width - 20) // 2)}{self.VERMELHO}ERRO: {e}{self.RESET}")
-            time.sleep(1)
+            dormir(1)
     
     def _abrir_manual(self):
         """Abre manual de hacking do arquivo manual_hacking.py"""
         self._limpar_tela()
         print(f"\n{' ' * ((self.term_width - 25) // 2)}{self.VERDE}ACESSANDO MANUAL...{self.RESET}")
-        time.sleep(0.5)
+        dormir(0.5)
         
         try:
             # Importar manual completo
             from manual_hacking import ManualHacking
-            manual = ManualHacking()
+            manual = ManualHacking(io=self.io)
             manual.mostrar_menu()
         except ImportError:
             self._limpar_tela()
             print(f"\n{' ' * ((self.term_width - 40) // 2)}{self.VERMELHO}ERRO: manual_hacking.py não encontrado{self.RESET}")
             print(f"{' ' * ((self.term_width - 50) // 2)}{self.CINZA}Certifique-se que o arquivo existe no diretório raiz.{self.RESET}")
-            input(f"\n{' ' * ((self.term_width - 25) // 2)}{self.CINZA}[ENTER PARA CONTINUAR]{self.RESET}")
+            self.io.ler(f"\n{' ' * ((self.term_width - 25) // 2)}{self.CINZA}[ENTER PARA CONTINUAR]{self.RESET}")
         except AttributeError:
             self._limpar_tela()
             print(f"\n{' ' * ((self.term_width - 40) // 2)}{self.VERMELHO}ERRO: Classe ManualHacking não encontrada{self.RESET}")
             print(f"{' ' * ((self.term_width - 50) // 2)}{self.CINZA}Verifique se o arquivo manual_hacking.py possui a classe correta.{self.RESET}")
-            input(f"\n{' ' * ((self.term_width - 25) // 2)}{self.CINZA}[ENTER PARA CONTINUAR]{self.RESET}")
+            self.io.ler(f"\n{' ' * ((self.term_width - 25) // 2)}{self.CINZA}[ENTER PARA CONTINUAR]{self.RESET}")
         except Exception as e:
             self._limpar_tela()
             print(f"\n{' ' * ((self.term_width - 40) // 2)}{self.VERMELHO}ERRO ao abrir manual: {str(e)}{self.RESET}")
-            input(f"\n{' ' * ((self.term_width - 25) // 2)}{self.CINZA}[ENTER PARA CONTINUAR]{self.RESET}")
+            self.io.ler(f"\n{' ' * ((self.term_width - 25) // 2)}{self.CINZA}[ENTER PARA CONTINUAR]{self.RESET}")
     
     def _informacoes_sistema(self):
         """Informações do sistema"""
@@ -1320,10 +1374,12 @@ class IntroMenu:
             espacamento = " " * ((self.term_width - len(linha.strip())) // 2)
             print(f"{espacamento}{linha}")
         
-        input(f"\n{' ' * ((self.term_width - 20) // 2)}{self.CINZA}[ENTER PARA CONTINUAR]{self.RESET}")
+        self.io.ler(f"\n{' ' * ((self.term_width - 20) // 2)}{self.CINZA}[ENTER PARA CONTINUAR]{self.RESET}")
     
     def _sair_jogo(self):
         """Sai do jogo"""
+        # Pendências do autosave são gravadas durante a despedida (e esperadas na saída)
+        self.autosave.descarregar()
         self._limpar_tela()
         
         # Mensagem de despedida
@@ -1345,14 +1401,15 @@ class IntroMenu:
                 print(f"{espacamento}{self.VERMELHO}{msg}{self.RESET}")
             else:
                 print(f"{espacamento}{self.CINZA}{msg}{self.RESET}")
-            time.sleep(0.2)
+            dormir(0.2)
         
-        time.sleep(1)
+        dormir(1)
         self._limpar_tela()
         self.running = False
     
     # ========== EXECUTAR ==========
 
+    @na_sessao
     def executar(self):
         """FLUXO CORRETO - Boot sempre aparece!"""
         try:
@@ -1362,8 +1419,9 @@ class IntroMenu:
             if not self.intro_mostrada:
                 self.pular_introducao = False
                 
-                # 1. Introdução (pode ser pulada)
-                self._mostrar_introducao_mr_robot()
+                # 1. Introdução (pode ser pulada com ENTER, lido só durante ela)
+                with self._ler_teclado():
+                    self._mostrar_introducao_mr_robot()
                 
                 # 2. Boot sequence SEMPRE (mesmo se pulou)
                 self._sequencia_boot()  # ← SEMPRE CHAMADO!
@@ -1384,7 +1442,7 @@ class IntroMenu:
             self._sair_jogo()
         except Exception as e:
             print(f"\n{self.VERMELHO}[SISTEMA] ERRO: {str(e)}{self.RESET}")
-            time.sleep(2)
+            dormir(2)
             self._sair_jogo()
 
 # ========== PONTO DE ENTRADA ==========
@@ -1399,5 +1457,8 @@ if __name__ == "__main__":
             CIANO = '\033[96m'
             RESET = '\033[0m'
     
+    # Logs e pipes recebem texto puro, sem escapes
+    preparar_saida()
+    
     menu = IntroMenu()
     menu.executar()
\ No newline at end of file
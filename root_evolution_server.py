@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+ROOT_EVOLUTION_SERVER.PY - Modo servidor do RoOt 3voluti0n
+Hospeda várias sessões do jogo (IntroMenu) num único processo, atendendo
+por TCP local ou socket Unix com um protocolo de linhas: o cliente envia
+uma linha por comando e recebe o texto do jogo como sairia no terminal.
+Qualquer `nc` ou telnet serve de cliente:
+
+    python root_evolution_server.py --porta 4433      # nc localhost 4433
+    python root_evolution_server.py --unix /tmp/root3.sock   # nc -U /tmp/root3.sock
+
+Cada conexão começa pedindo a identificação do jogador, que vira o
+espaço de saves dele: o menu de carregar só mostra (e só grava) saves
+daquele espaço.
+
+O asyncio cuida dos sockets; cada jogo roda numa thread com a sua
+SessaoRede (utils.sessao_io) como `io` do IntroMenu, e os print()/input()
+antigos chegam nela pelos roteadores de sys.stdin/sys.stdout. Módulos,
+capítulos e caches são carregados uma vez só e cada jogador custa apenas
+o próprio estado.
+"""
+
+import os
+import re
+import sys
+import queue
+import asyncio
+import argparse
+import threading
+
+from utils.sessao_io import SessaoIO, usar, instalar_roteamento
+from utils.relogio import configurar_relogio, VARIAVEL_AMBIENTE
+
+# Limite padrão de sessões simultâneas
+MAX_SESSOES = 64
+
+# Comandos de negociação do telnet (IAC ...), descartados da entrada
+_TELNET = re.compile(rb'\xff[\xfb-\xfe].|\xff[\xf0-\xfa]', re.DOTALL)
+
+# Leituras depois do fim da conexão antes de encerrar a sessão à força
+_LEITURAS_APOS_FIM = 3
+
+# Caracteres aceitos na identificação do jogador (vira prefixo dos saves)
+_IDENTIFICACAO = re.compile(r'[^A-Za-z0-9_-]')
+
+
+class SessaoEncerrada(SystemExit):
+    """A conexão acabou, mas o jogo continuou pedindo entrada"""
+
+
+# ========== SESSÃO ==========
+class SessaoRede(SessaoIO):
+    """
+    Sessão de uma conexão: a saída (com buffer de linha) é entregue ao
+    loop do asyncio e a leitura bloqueia até o cliente mandar uma linha.
+    """
+
+    def __init__(self, loop, escritor, numero):
+        super().__init__()
+        self.numero = numero
+        self._loop = loop
+        self._escritor = escritor
+        self._linhas = queue.Queue()
+        self._fechada = False
+        self._leituras_apos_fim = 0
+
+    # ----- thread do jogo -----
+    def _enviar(self, texto):
+        if self._fechada:
+            return
+        dados = texto.replace('\r\n', '\n').replace('\n', '\r\n').encode(self.encoding, self.errors)
+        self._no_loop(self._escrever_no_socket, dados)
+    
+    def _no_loop(self, funcao, *args):
+        """Agenda no loop do asyncio (ignorado se o servidor já parou)"""
+        try:
+            self._loop.call_soon_threadsafe(funcao, *args)
+        except RuntimeError:
+            # Loop fechado: a conexão não existe mais
+            self._fechada = True
+
+    def _ler_linha(self):
+        linha = self._linhas.get()
+        if linha is None:
+            self._linhas.put(None)
+            self._leituras_apos_fim += 1
+            if self._leituras_apos_fim > _LEITURAS_APOS_FIM:
+                raise SessaoEncerrada()
+            return ''
+        return linha
+
+    # ----- lado do asyncio -----
+    def _escrever_no_socket(self, dados):
+        if not self._escritor.is_closing():
+            self._escritor.write(dados)
+
+    def receber(self, linha):
+        self._linhas.put(linha)
+
+    def fim_da_entrada(self):
+        self._fechada = True
+        self._linhas.put(None)
+
+
+def _identificar(io):
+    """
+    Pergunta a identificação do jogador: ela separa os saves dele dos
+    demais (mesma identificação numa nova conexão = mesmos saves).
+    """
+    try:
+        nome = io.ler("Identificação do jogador (separa os seus saves): ")
+    except EOFError:
+        nome = ''
+    nome = _IDENTIFICACAO.sub('', nome)[:32]
+    # Sem identificação: saves só desta conexão
+    return nome or f"sessao{getattr(io, 'numero', 0)}"
+
+
+def _novo_jogo(io):
+    from root_evolution_main import IntroMenu
+    return IntroMenu(io=io, espaco_saves=_identificar(io))
+
+
+# ========== SERVIDOR ==========
+class ServidorJogo:
+    """
+    Aceita conexões e roda `fabrica(sessao).executar()` numa thread por
+    sessão. `fabrica` é o IntroMenu por padrão.
+    """
+
+    def __init__(self, fabrica=_novo_jogo, max_sessoes=MAX_SESSOES):
+        self.fabrica = fabrica
+        self.max_sessoes = max_sessoes
+        self.sessoes = {}
+        self._contador = 0
+        self._servidor = None
+
+    async def iniciar(self, host='127.0.0.1', porta=4433, unix=None):
+        instalar_roteamento()
+        if unix:
+            self._servidor = await asyncio.start_unix_server(self._atender, path=unix)
+        else:
+            self._servidor = await asyncio.start_server(self._atender, host, porta)
+        return self._servidor
+
+    @property
+    def enderecos(self):
+        return [sock.getsockname() for sock in self._servidor.sockets] if self._servidor else []
+
+    async def servir(self):
+        async with self._servidor:
+            await self._servidor.serve_forever()
+
+    def fechar(self):
+        if self._servidor is not None:
+            self._servidor.close()
+        for sessao in list(self.sessoes.values()):
+            sessao.fim_da_entrada()
+
+    async def _atender(self, leitor, escritor):
+        if len(self.sessoes) >= self.max_sessoes:
+            escritor.write("Servidor cheio. Tente novamente mais tarde.\r\n".encode('utf-8'))
+            await escritor.drain()
+            escritor.close()
+            return
+
+        loop = asyncio.get_running_loop()
+        self._contador += 1
+        sessao = SessaoRede(loop, escritor, self._contador)
+        self.sessoes[sessao.numero] = sessao
+        terminou = loop.create_future()
+
+        def jogar():
+            try:
+                with usar(sessao):
+                    self.fabrica(sessao).executar()
+            except SystemExit:
+                pass
+            except Exception as e:
+                sessao.escrever(f"\n[SISTEMA] ERRO: {e}")
+            finally:
+                sessao.flush()
+                sessao._no_loop(lambda: terminou.done() or terminou.set_result(None))
+
+        # Thread daemon: uma sessão presa num laço nunca impede o servidor de sair
+        threading.Thread(target=jogar, name=f"sessao-{sessao.numero}", daemon=True).start()
+
+        leitura = asyncio.ensure_future(self._ler(leitor, sessao))
+        try:
+            await terminou
+        finally:
+            leitura.cancel()
+            sessao.fim_da_entrada()
+            del self.sessoes[sessao.numero]
+            try:
+                await escritor.drain()
+            except ConnectionError:
+                pass
+            escritor.close()
+
+    async def _ler(self, leitor, sessao):
+        try:
+            while True:
+                dados = await leitor.readline()
+                if not dados:
+                    break
+                dados = _TELNET.sub(b'', dados)
+                sessao.receber(dados.decode('utf-8', 'replace').rstrip('\r\n') + '\n')
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            sessao.fim_da_entrada()
+
+
+# ========== PONTO DE ENTRADA ==========
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servidor multi-sessão do RoOt 3voluti0n")
+    parser.add_argument('--host', default='127.0.0.1', help="endereço TCP (padrão: só local)")
+    parser.add_argument('--porta', type=int, default=4433, help="porta TCP")
+    parser.add_argument('--unix', help="caminho de um socket Unix (no lugar do TCP)")
+    parser.add_argument('--max-sessoes', type=int, default=MAX_SESSOES, help="sessões simultâneas")
+    args = parser.parse_args(argv)
+    
+    # O stdout do servidor (log, /dev/null) não diz nada sobre os jogadores:
+    # sem ROOT_EVOLUTION_RELOGIO, pausas e animações correm em tempo real
+    if not os.environ.get(VARIAVEL_AMBIENTE):
+        configurar_relogio('real')
+    
+    servidor = ServidorJogo(max_sessoes=args.max_sessoes)
+
+    async def rodar():
+        await servidor.iniciar(args.host, args.porta, args.unix)
+        for endereco in servidor.enderecos:
+            print(f"[SERVIDOR] RoOt 3voluti0n ouvindo em {endereco}", file=sys.stderr)
+        await servidor.servir()
+
+    try:
+        asyncio.run(rodar())
+    except KeyboardInterrupt:
+        print("\n[SERVIDOR] Encerrado.", file=sys.stderr)
+    finally:
+        if args.unix and os.path.exists(args.unix):
+            os.unlink(args.unix)
+
+
+if __name__ == "__main__":
+    main()
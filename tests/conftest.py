@@ -0,0 +1,15 @@
+import io
+
+import pytest
+
+
+class TerminalFalso(io.StringIO):
+    """StringIO que se apresenta como terminal (isatty -> True)"""
+
+    def isatty(self):
+        return True
+
+
+@pytest.fixture
+def terminal():
+    return TerminalFalso()
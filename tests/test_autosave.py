@@ -0,0 +1,98 @@
+import json
+import threading
+
+import pytest
+
+from utils.autosave import Autosave
+from utils.diario import Diario
+from utils.saves import ServicoSaves
+
+
+def test_agrupa_estado_mais_recente_por_save():
+    gravados = []
+    fila = Autosave(intervalo=60, gravar=lambda arquivo, dados, seq: gravados.append((arquivo, dados)), seq=None)
+
+    dados = {'score': 1}
+    fila.agendar('a.json', dados)
+    dados['score'] = 2  # o estado na fila é uma cópia
+    fila.agendar('a.json', dados)
+    fila.agendar('b.json', {'score': 7})
+    assert gravados == []
+
+    fila.descarregar(esperar=True)
+    assert sorted(gravados) == [('a.json', {'score': 2}), ('b.json', {'score': 7})]
+    fila.encerrar()
+
+
+def test_grava_sozinho_depois_do_intervalo():
+    gravou = threading.Event()
+    fila = Autosave(intervalo=0.01, gravar=lambda arquivo, dados, seq: gravou.set(), seq=None)
+    fila.agendar('a.json', {})
+    assert gravou.wait(2)
+    fila.encerrar()
+
+
+def test_fila_limitada_espera_espaco():
+    liberar = threading.Event()
+    gravados = []
+
+    def gravar(arquivo, dados, seq):
+        liberar.wait(2)
+        gravados.append(arquivo)
+
+    fila = Autosave(intervalo=60, limite=1, gravar=gravar, seq=None)
+    fila.agendar('a.json', {})
+    fila.agendar('a.json', {})  # mesmo save: substitui, não espera
+    fila.descarregar()
+
+    terceiro = threading.Thread(target=fila.agendar, args=('b.json', {}))
+    terceiro.start()
+    liberar.set()
+    terceiro.join(2)
+    fila.encerrar()
+    assert gravados == ['a.json', 'b.json']
+
+
+def test_erro_fica_com_o_save_e_a_gravacao_volta_para_a_fila():
+    falhar = {'a.json'}
+    gravados = []
+
+    def gravar(arquivo, dados, seq):
+        if arquivo in falhar:
+            raise OSError("disco cheio")
+        gravados.append(arquivo)
+
+    fila = Autosave(intervalo=60, gravar=gravar, seq=None)
+    fila.agendar('a.json', {})
+    fila.agendar('b.json', {})
+    # Descarregar sem esperar (ou esperando outro save) não consome o erro de a.json
+    fila.descarregar()
+    fila.descarregar('b.json', esperar=True)
+    fila.descarregar(esperar=True)
+    with pytest.raises(OSError):
+        fila.descarregar('a.json', esperar=True)
+    assert fila.pendentes == 1  # a.json espera nova tentativa
+
+    falhar.clear()
+    fila.descarregar('a.json', esperar=True)
+    assert sorted(gravados) == ['a.json', 'b.json']
+    assert fila.erro_pendente('a.json') is None
+    fila.encerrar()
+
+
+def test_eventos_posteriores_ao_agendamento_continuam_no_diario(tmp_path):
+    arquivo = str(tmp_path / "NEO.json")
+    diario = Diario(arquivo, ServicoSaves())
+    fila = Autosave(intervalo=60, gravar=lambda arq, dados, seq: diario.compactar(dados, ate=seq),
+                    seq=lambda arq: diario.seq)
+
+    diario.registrar('sucesso', {'score': 10})
+    fila.agendar(arquivo, {'codiname': 'NEO', 'score': 10})
+    # Evento registrado depois da cópia: o snapshot não o contém
+    diario.registrar('sucesso', {'score': 20})
+    fila.encerrar()
+
+    with open(arquivo, encoding='utf-8') as f:
+        snapshot = json.load(f)
+    assert snapshot['score'] == 10
+    assert diario.recuperar(snapshot)['score'] == 20
@@ -0,0 +1,57 @@
+import os
+
+from chapters import RegistroCapitulos
+
+
+def _pacote(tmp_path, monkeypatch, nome):
+    pasta = tmp_path / nome
+    pasta.mkdir()
+    (pasta / "__init__.py").write_text("")
+    (pasta / "chapter_01.py").write_text("EXECUCOES = []\nEXECUCOES.append(1)\nVERSAO = 1\n")
+    (pasta / "chapter_xx.py").write_text("")  # nome sem número: ignorado
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return pasta
+
+
+def test_descobre_e_reaproveita_modulo(tmp_path, monkeypatch):
+    pasta = _pacote(tmp_path, monkeypatch, "capitulos_cache")
+    registro = RegistroCapitulos(str(pasta), pacote="capitulos_cache")
+
+    assert [capitulo['numero'] for capitulo in registro.capitulos()] == [1]
+    assert registro.existe(1) and not registro.existe(2)
+
+    modulo = registro.carregar(1)
+    assert registro.carregar(1) is modulo
+    assert modulo.EXECUCOES == [1]
+
+
+def test_reimporta_quando_o_arquivo_muda(tmp_path, monkeypatch):
+    pasta = _pacote(tmp_path, monkeypatch, "capitulos_edicao")
+    registro = RegistroCapitulos(str(pasta), pacote="capitulos_edicao")
+    assert registro.carregar(1).VERSAO == 1
+
+    arquivo = pasta / "chapter_01.py"
+    arquivo.write_text("VERSAO = 2\n")
+    stat = os.stat(arquivo)
+    os.utime(arquivo, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    assert registro.carregar(1).VERSAO == 2
+
+    (pasta / "chapter_02.py").write_text("VERSAO = 1\n")
+    stat = os.stat(pasta)
+    os.utime(pasta, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    assert registro.existe(2)
+
+
+def test_precarrega_proximo_capitulo_em_segundo_plano(tmp_path, monkeypatch):
+    pasta = _pacote(tmp_path, monkeypatch, "capitulos_precarga")
+    (pasta / "chapter_02.py").write_text("CARREGADO = True\n")
+    registro = RegistroCapitulos(str(pasta), pacote="capitulos_precarga")
+
+    thread = registro.precarregar(2)
+    thread.join(5)
+    assert registro._em_cache(2) is not None
+    assert registro.carregar(2).CARREGADO
+
+    # Já em cache ou inexistente: nada a fazer
+    assert registro.precarregar(2) is None
+    assert registro.precarregar(3) is None
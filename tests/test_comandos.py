@@ -0,0 +1,49 @@
+from utils.comandos import PadraoComando, IndiceSugestoes, canonico, distancia
+from utils.missoes import Etapa, Regra, comando
+
+
+def test_ordem_de_flags_aspas_e_espacos_nao_importam():
+    padrao = PadraoComando("ls -la /tmp")
+    assert padrao.casa("ls -a -l /tmp")
+    assert padrao.casa("ls   '-al'  /tmp")
+    assert not padrao.casa("ls -a /tmp")
+    assert not padrao.casa("ls -la /var")
+    assert canonico("echo 'a'|base64 --decode") == "echo a | base64 --decode"
+
+
+def test_opcoes_com_valor_e_flags_desconhecidas_ficam_no_lugar():
+    padrao = PadraoComando("openssl enc -d -in a.enc -out b.txt")
+    assert padrao.casa("openssl  enc -d -in a.enc -out 'b.txt'")
+    assert not padrao.casa("openssl enc -d -out a.enc -in b.txt")
+    assert not PadraoComando("find / -name x").casa("find / -eman x")
+    assert not PadraoComando("nmap -sV alvo").casa("nmap -Vs alvo")
+    # Grupo só é desmembrado se todas as letras forem flags booleanas do programa
+    assert PadraoComando("rm -rf pasta").casa("rm -f -r pasta")
+
+
+def test_coringa_aceita_qualquer_argumento_e_destino():
+    padrao = PadraoComando("zip2john fotos.zip > *")
+    assert padrao.casa("zip2john fotos.zip > hash.txt")
+    assert not padrao.casa("zip2john fotos.zip")
+    assert not padrao.casa("zip2john fotos.zip >> hash.txt")
+    assert not padrao.casa("echo 'aspas sem fim")
+
+
+def test_distancia_limitada():
+    assert distancia("cd Private", "cd private", 3) == 1
+    assert distancia("ls", "rm -rf /", 2) == 3
+
+
+def test_sugestao_da_resposta_mais_proxima():
+    indice = IndiceSugestoes(["ssh admin@backup-cloud", "cd Private", "echo * | base64 -d"])
+    assert indice.sugerir("ssh admin@backupcloud") == "ssh admin@backup-cloud"
+    assert indice.sugerir("cd  Privat") == "cd Private"
+    assert indice.sugerir("nmap 10.0.0.1") is None
+    assert indice.sugerir("cd Private") is None
+
+
+def test_etapa_casa_pela_forma_normalizada():
+    etapa = Etapa("ls", [Regra(comando("ls -a"), ir="proxima")], erro=Regra())
+    assert etapa.casar("ls '-a'") is etapa.regras[0]
+    assert etapa.casar("ls -A") is etapa.erro
+    assert etapa.sugestoes.sugerir("ls -A") == "ls -a"
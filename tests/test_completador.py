@@ -0,0 +1,35 @@
+from utils.completador import Completador, IndicePrefixos
+from utils.vfs import SistemaArquivos
+
+
+def _completador():
+    vfs = SistemaArquivos('/root')
+    vfs.montar({'Private': {'.conversa_hotel_nobile.pdf': 'x', 'evidences': {}}, 'Desktop': {}}, '~')
+    return Completador(vfs, lambda: '/root', ['cat', 'cd', 'clear', 'nmap'])
+
+
+def test_indice_de_prefixos():
+    indice = IndicePrefixos(['nmap', 'cat', 'cd'])
+    indice.adicionar('clear')
+    indice.adicionar('cat')
+    assert indice.com_prefixo('c') == ['cat', 'cd', 'clear']
+    indice.remover('cd')
+    assert 'cd' not in indice
+    assert len(indice) == 3
+
+
+def test_primeira_palavra_completa_comandos():
+    completador = _completador()
+    assert completador.candidatos('c', 0, 'c') == ['cat', 'cd', 'clear']
+    assert completador.candidatos('cat x | n', 8, 'n') == ['nmap']
+
+
+def test_argumentos_completam_caminhos_do_vfs():
+    completador = _completador()
+    assert completador.candidatos('cd Pr', 3, 'Pr') == ['Private/']
+    assert completador.candidatos('cat ~/Private/', 4, '~/Private/') == ['~/Private/evidences/']
+    assert completador.candidatos('cat ~/Private/.c', 4, '~/Private/.c') == ['~/Private/.conversa_hotel_nobile.pdf']
+
+    # Arquivos montados depois entram no índice
+    completador.vfs.montar({'Dumps': {}}, '~')
+    assert completador.candidatos('ls D', 3, 'D') == ['Desktop/', 'Dumps/']
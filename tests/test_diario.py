@@ -0,0 +1,103 @@
+import json
+
+from utils.diario import CAMPO_SEQUENCIA, Diario
+from utils.saves import ServicoSaves
+
+
+def _diario(tmp_path):
+    arquivo = str(tmp_path / "NEO.json")
+    return Diario(arquivo, ServicoSaves()), arquivo
+
+
+def test_recupera_eventos_depois_do_snapshot(tmp_path):
+    diario, arquivo = _diario(tmp_path)
+    estado = {'codiname': 'NEO', 'score': 0, 'inventory': []}
+    diario.compactar(estado)
+
+    diario.registrar('sucesso', {'score': 10}, bonus=10)
+    diario.registrar('compra', {'inventory': ['vpn_plus'], 'bitcoin_wallet': 0.003}, item='vpn_plus', custo=0.002)
+
+    # Queda antes do próximo snapshot: o save em disco ainda é o antigo
+    with open(arquivo, encoding='utf-8') as f:
+        snapshot = json.load(f)
+    assert snapshot['score'] == 0
+
+    recuperado = Diario(arquivo).recuperar(snapshot)
+    assert recuperado['score'] == 10
+    assert recuperado['inventory'] == ['vpn_plus']
+    assert recuperado[CAMPO_SEQUENCIA] == 2
+
+
+def test_compactacao_move_eventos_para_o_historico(tmp_path):
+    diario, arquivo = _diario(tmp_path)
+    estado = {'codiname': 'NEO', 'score': 0}
+    for score in range(1, 4):
+        diario.registrar('sucesso', {'score': score})
+        estado['score'] = score
+    assert diario.pendentes == 3
+
+    diario.compactar(estado)
+    assert diario.pendentes == 0
+    assert [e['tipo'] for e in diario.eventos()] == ['snapshot']
+
+    diario.registrar('falha', {'privacy_level': 70})
+    assert [e['seq'] for e in diario.historico()] == [1, 2, 3, 4]
+    assert len(list(diario.historico('falha'))) == 1
+
+    # Reaplicar sobre o snapshot ignora o que ele já incorpora
+    with open(arquivo, encoding='utf-8') as f:
+        assert Diario(arquivo).recuperar(json.load(f))['score'] == 3
+
+
+def test_linha_cortada_no_fim_e_ignorada(tmp_path):
+    diario, arquivo = _diario(tmp_path)
+    diario.registrar('sucesso', {'score': 5})
+    with open(diario.caminho, 'a', encoding='utf-8') as f:
+        f.write('{"seq": 2, "tipo": "suc')
+    assert Diario(arquivo).recuperar({'score': 0})['score'] == 5
+
+
+def test_compactacao_interrompida_nao_duplica_o_historico(tmp_path, monkeypatch):
+    import pytest
+    from utils import diario as modulo
+
+    diario, arquivo = _diario(tmp_path)
+    for score in range(1, 4):
+        diario.registrar('sucesso', {'score': score})
+
+    # Queda depois de gravar o histórico e antes de reiniciar o diário
+    substituir = modulo.os.replace
+
+    def queda(origem, destino):
+        if destino == diario.caminho:
+            raise OSError("queda")
+        substituir(origem, destino)
+    monkeypatch.setattr(modulo.os, 'replace', queda)
+    with pytest.raises(OSError):
+        diario.compactar({'score': 3})
+    monkeypatch.undo()
+
+    reaberto = Diario(arquivo, ServicoSaves())
+    assert [e['seq'] for e in reaberto.historico()] == [1, 2, 3]
+    reaberto.compactar({'score': 3})
+    assert [e['seq'] for e in reaberto.historico()] == [1, 2, 3]
+
+
+def test_diario_de_devolve_o_mesmo_diario_entre_threads(tmp_path):
+    import threading
+    from utils.diario import diario_de
+
+    arquivo = str(tmp_path / "NEO.json")
+    barreira = threading.Barrier(8)
+    vistos = []
+
+    def pegar():
+        barreira.wait()
+        vistos.append(diario_de(arquivo))
+
+    threads = [threading.Thread(target=pegar) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(diario) for diario in vistos}) == 1
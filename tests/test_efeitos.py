@@ -0,0 +1,51 @@
+import io
+import random
+
+from utils.efeitos import ChuvaMatrix
+
+
+def test_chuva_um_write_por_quadro_e_sem_celulas_repetidas():
+    random.seed(7)
+    chuva = ChuvaMatrix(250, 60, chance_nascer=0.5, chance_parar=0.01)
+    quadros = [chuva.passo() for _ in range(30)]
+
+    # Em regime, um quadro largo continua bem abaixo de dezenas de KB
+    assert max(len(q) for q in quadros) < 4096
+    # Cor aplicada uma vez por quadro, não por caractere
+    assert all(q.count('\033[92m') <= 1 for q in quadros)
+
+
+def test_chuva_executar_respeita_interrupcao(terminal):
+    chuva = ChuvaMatrix(40, 10)
+    assert chuva.executar(5, deve_parar=lambda: True, saida=terminal) is True
+    assert terminal.getvalue().endswith('\033[?25h')
+
+
+def test_chuva_sem_terminal_nao_anima():
+    saida = io.StringIO()
+    assert ChuvaMatrix(40, 10).executar(5, saida=saida) is False
+    assert saida.getvalue() == ''
+
+
+def test_glitch_so_reconstroi_quando_largura_muda(monkeypatch):
+    from utils.efeitos import TabelasGlitch
+
+    glitch = TabelasGlitch("01", tamanho_anel=4)
+    chamadas = []
+    original = random.choices
+    monkeypatch.setattr(random, 'choices', lambda *a, **k: chamadas.append(1) or original(*a, **k))
+
+    for _ in range(20):
+        assert len(glitch.ruido(80)) == 80
+    assert len(chamadas) == 4
+
+    glitch.ruido(120)
+    assert len(chamadas) == 8
+
+
+def test_glitch_misturar_preserva_tamanho():
+    from utils.efeitos import TabelasGlitch
+
+    texto = "ACESSO CONCEDIDO"
+    misturado = TabelasGlitch("#").misturar(texto, intensidade=1.0)
+    assert misturado == "#" * len(texto)
@@ -0,0 +1,84 @@
+import copy
+import json
+import os
+
+import pytest
+
+from utils import formato_save
+from utils.formato_save import FormatoInvalido, SaveBinario
+from utils.saves_binario import ServicoSavesBinario
+
+
+def _dados():
+    return {
+        'player_name': 'Neo', 'codiname': 'NEO_01', 'current_chapter': 3,
+        'bitcoin_wallet': 0.5, 'score': 120, 'inventory': ['pendrive'],
+        'historico': [{'evento': f'login {i}'} for i in range(200)],
+    }
+
+
+def test_ida_e_volta_com_secoes_comprimidas():
+    bruto = formato_save.codificar(*formato_save.separar(_dados()))
+    assert bruto.startswith(formato_save.MAGICO)
+    assert len(bruto) < len(json.dumps(_dados()))
+
+    save = formato_save.decodificar(bruto)
+    assert dict(save.items()) == _dados()
+
+
+def test_decodifica_secoes_sob_demanda():
+    save = formato_save.decodificar(formato_save.codificar(*formato_save.separar(_dados())))
+    assert save['codiname'] == 'NEO_01' and 'historico' in save
+    assert save.decodificadas == set()
+
+    save['score'] += 1
+    assert save.decodificadas == {'estado'}
+    # Seções não usadas voltam com os mesmos bytes, sem recomprimir
+    intacta = next(secao for secao in save.secoes() if secao.nome == 'historico')
+    assert intacta._cru is None
+
+    copia = copy.deepcopy(save)
+    copia['inventory'].append('laptop')
+    assert save['inventory'] == ['pendrive']
+
+
+def test_cabecalho_sem_ler_secoes(tmp_path):
+    caminho = tmp_path / "NEO.r3v"
+    bruto = formato_save.codificar(*formato_save.separar(_dados()))
+    caminho.write_bytes(bruto[:300])  # seções cortadas: o cabeçalho ainda é lido
+    assert formato_save.ler_cabecalho(str(caminho))['current_chapter'] == 3
+
+
+def test_rejeita_versao_futura_e_crc_invalido():
+    bruto = bytearray(formato_save.codificar(*formato_save.separar(_dados())))
+    futuro = bytes(bruto[:4]) + (formato_save.VERSAO + 1).to_bytes(2, 'big') + bytes(bruto[6:])
+    with pytest.raises(FormatoInvalido):
+        formato_save.decodificar(futuro)
+
+    bruto[-1] ^= 0xFF  # último byte da última seção ('inventario')
+    save = formato_save.decodificar(bytes(bruto))
+    assert save['codiname'] == 'NEO_01'
+    with pytest.raises(FormatoInvalido):
+        save['inventory']
+
+
+def test_servico_binario_lista_e_nao_regrava(tmp_path):
+    pasta = str(tmp_path / "saves")
+    os.makedirs(pasta)
+    with open(os.path.join(pasta, "VELHO.json"), 'w', encoding='utf-8') as f:
+        json.dump({'player_name': 'Ana', 'codiname': 'VELHO', 'current_chapter': 2}, f)
+
+    servico = ServicoSavesBinario(pasta)
+    arquivo = os.path.join(pasta, "NEO_01.r3v")
+    assert servico.salvar(arquivo, _dados()) is True
+
+    codinomes = sorted(save['codinome'] for save in servico.indice.listar())
+    assert codinomes == ['NEO_01', 'VELHO']
+
+    save = servico.carregar(arquivo)
+    assert isinstance(save, SaveBinario)
+    save['last_seen'] = '2026-01-01T00:00:00'
+    assert servico.salvar(arquivo, save) is False
+    save['score'] = 999
+    assert servico.salvar(arquivo, save) is True
+    assert servico.carregar(arquivo)['score'] == 999
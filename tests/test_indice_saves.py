@@ -0,0 +1,62 @@
+import json
+import os
+
+from utils.indice_saves import IndiceSaves
+
+
+def _gravar(pasta, nome, dados):
+    caminho = os.path.join(pasta, nome)
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump(dados, f)
+    return caminho
+
+
+def _save(codinome, data, capitulo=1):
+    return {'player_name': 'Neo', 'codiname': codinome, 'current_chapter': capitulo, 'last_seen': data}
+
+
+def test_lista_ordenado_e_paginado(tmp_path):
+    pasta = str(tmp_path)
+    for i in range(5):
+        _gravar(pasta, f"S{i}.json", _save(f"S{i}", f"2024-01-0{i + 1}T00:00:00"))
+    _gravar(pasta, "lixo.json", {'outro': 1})
+
+    indice = IndiceSaves(pasta)
+    saves = indice.listar()
+    assert [s['codinome'] for s in saves] == ['S4', 'S3', 'S2', 'S1', 'S0']
+    assert [s['codinome'] for s in indice.listar(pagina=1, por_pagina=2)] == ['S2', 'S1']
+    assert os.path.exists(os.path.join(pasta, IndiceSaves.ARQUIVO))
+
+
+def test_nao_relê_saves_inalterados(tmp_path, monkeypatch):
+    pasta = str(tmp_path)
+    caminho = _gravar(pasta, "A.json", _save("A", "2024-01-01"))
+    IndiceSaves(pasta).listar()
+
+    # Um índice novo (outra sessão) confia no manifesto enquanto o mtime bate
+    lidos = []
+    abrir = open
+
+    def espiao(arquivo, *args, **kwargs):
+        lidos.append(os.path.basename(str(arquivo)))
+        return abrir(arquivo, *args, **kwargs)
+
+    monkeypatch.setattr('builtins.open', espiao)
+    assert IndiceSaves(pasta).listar()[0]['codinome'] == 'A'
+    assert 'A.json' not in lidos
+
+    # Alterado por fora: relido
+    _gravar(pasta, "A.json", _save("A", "2024-02-01", capitulo=3))
+    os.utime(caminho, ns=(1, 1))
+    assert IndiceSaves(pasta).listar()[0]['capitulo'] == 3
+
+
+def test_atualizar_e_remocao_do_disco(tmp_path):
+    pasta = str(tmp_path)
+    indice = IndiceSaves(pasta)
+    caminho = _gravar(pasta, "B.json", _save("B", "2024-01-01"))
+    indice.atualizar(caminho, _save("B", "2024-01-01"))
+    assert len(indice.listar()) == 1
+
+    os.remove(caminho)
+    assert indice.listar() == []
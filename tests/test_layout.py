@@ -0,0 +1,31 @@
+from utils.layout import Layout, largura_exibicao
+
+
+def test_largura_ignora_ansi_e_conta_caracteres_largos():
+    assert largura_exibicao("\033[92mMENU\033[0m") == 4
+    assert largura_exibicao("ação") == 4
+    assert largura_exibicao("終了") == 4
+
+
+def test_quadro_em_cache_ate_invalidar():
+    layout = Layout()
+    layout._tamanho = (80, 24)
+    layout._observando = True
+    construcoes = []
+
+    def construir():
+        construcoes.append(1)
+        return [layout.centralizar("\033[92mMENU\033[0m")]
+
+    primeiro = layout.quadro(('menu',), construir)
+    assert layout.quadro(('menu',), construir) is primeiro
+    assert len(construcoes) == 1
+    assert primeiro[0].startswith(' ' * 38 + '\033[92m')
+
+    avisos = []
+    layout.ao_redimensionar(lambda: avisos.append(1))
+    layout.invalidar()
+    layout._tamanho = (120, 40)
+    layout.quadro(('menu',), construir)
+    assert len(construcoes) == 2
+    assert avisos == [1]
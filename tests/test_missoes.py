@@ -0,0 +1,97 @@
+from utils.missoes import (Missao, Etapa, Regra, SUCESSO, FALHA, MENU,
+                           exato, comeca, contem)
+
+
+class Estado:
+    def __init__(self):
+        self.score = 0
+        self.falhas = []
+        self.saindo_para_menu = False
+
+    def registrar_sucesso(self, pontos):
+        self.score += pontos
+
+    def registrar_falha(self, penalidade):
+        self.falhas.append(penalidade)
+        return len(self.falhas) >= 5
+
+
+def _leitor(*comandos):
+    fila = list(comandos)
+
+    def ler(prompt=''):
+        if not fila:
+            raise EOFError
+        return fila.pop(0)
+    return ler
+
+
+def test_primeira_regra_na_ordem_declarada():
+    etapa = Etapa("scan", [
+        Regra(comeca("nmap -sV"), saida="detalhado"),
+        Regra(exato("nmap -sV alvo"), saida="exato"),
+        Regra(contem("nmap")),
+    ], erro=Regra(saida="erro"))
+    assert etapa.casar("nmap -sV alvo").saida == "detalhado"
+    assert etapa.casar("nmap alvo") is etapa.regras[2]
+    assert etapa.casar("ls") is etapa.erro
+
+
+def test_etapas_pontos_e_penalidades():
+    missao = Missao("TESTE", [
+        Etapa("um", [Regra(exato("ls"), ir="dois")], erro=Regra(penalidade=2)),
+        Etapa("dois", [Regra(comeca("cat"), pontos=15, ir=SUCESSO)]),
+    ])
+    estado = Estado()
+    metricas = {}
+    assert missao.executar(estado, _leitor("pwd", "ls", "cat flag"), metricas=metricas) == SUCESSO
+    assert estado.score == 15 and estado.falhas == [2]
+    assert metricas['um']['comandos'] == 2 and metricas['um']['erros'] == 1
+
+    # Cada execução tem os próprios contadores
+    outras = {}
+    missao.executar(Estado(), _leitor("ls", "cat flag"), metricas=outras)
+    assert outras['um'] == dict(outras['um'], comandos=1, erros=0)
+    assert metricas['um']['comandos'] == 2
+
+
+def test_tentativas_esgotadas_vao_para_falha():
+    missao = Missao("CHAVE", [
+        Etapa("chave", [
+            Regra(exato("2033"), ir=SUCESSO),
+            Regra(comeca("dica"), saida="a dica não gasta tentativa"),
+        ], erro=Regra(tentativa=True), tentativas=2),
+    ])
+    assert missao.executar(Estado(), _leitor("1", "dica", "dica", "2")) == FALHA
+    assert missao.executar(Estado(), _leitor("1", "2033")) == SUCESSO
+
+
+def test_globais_e_interrupcao_voltam_ao_menu():
+    vistos = []
+
+    def globais(cmd, state):
+        if cmd == 'menu':
+            return MENU
+        if cmd == 'manual':
+            vistos.append(cmd)
+            return 'MANUAL'
+        return None
+
+    missao = Missao("GLOBAIS", [Etapa("e", [Regra(exato("ok"), ir=SUCESSO)])], globais=globais)
+    assert missao.executar(Estado(), _leitor("manual", "menu")) == MENU
+    assert vistos == ['manual']
+
+    estado = Estado()
+    assert missao.executar(estado, _leitor()) == MENU
+    assert estado.saindo_para_menu is True
+
+
+def test_quest_base64_valida_pela_forma_sem_executar():
+    from chapters.chapter_03 import MISSAO_DECODIFICAR
+
+    etapa = MISSAO_DECODIFICAR.etapas["decodificar"]
+    aceita = etapa.regras[0]
+    assert etapa.casar("echo 'abc' | base64 -d") is aceita
+    assert etapa.casar("base64 --decode < msg.txt") is aceita
+    # Não executa o pipeline: argumento inválido não derruba a missão
+    assert etapa.casar("echo x | head -n abc") is etapa.erro
@@ -0,0 +1,26 @@
+import time
+
+from utils.relogio import Relogio
+
+
+def test_virtual_avanca_apenas_com_pausas():
+    relogio = Relogio('virtual')
+    inicio = relogio.agora()
+    antes = time.monotonic()
+    relogio.dormir(30)
+    assert time.monotonic() - antes < 0.5
+    assert relogio.agora() - inicio == 30
+
+
+def test_escalado_divide_o_tempo_real():
+    relogio = Relogio('escalado', 0.01)
+    antes = time.monotonic()
+    relogio.dormir(5)
+    assert 0.04 <= time.monotonic() - antes < 1.0
+
+
+def test_ambiente_aceita_formatos_e_ignora_invalidos():
+    assert Relogio.do_ambiente('0.1').escala == 0.1
+    assert Relogio.do_ambiente('escalado:0.5').escala == 0.5
+    assert Relogio.do_ambiente('instantaneo').modo == 'instantaneo'
+    assert Relogio.do_ambiente('turbo').modo == 'real'
@@ -0,0 +1,89 @@
+import io
+import sys
+import time
+
+from utils.relogio import Relogio
+from utils.roda_temporizadores import RodaTemporizadores
+
+
+def test_roda_dispara_em_ordem_e_respeita_cancelamento():
+    relogio = Relogio('virtual')
+    roda = RodaTemporizadores(resolucao=0.1, fendas=8, relogio=relogio)
+    disparados = []
+
+    roda.agendar(0.5, lambda: disparados.append('b'))
+    roda.agendar(0.2, lambda: disparados.append('a'))
+    cancelado = roda.agendar(0.3, lambda: disparados.append('x'))
+    # Mais de uma volta da roda (8 fendas de 0.1 s)
+    roda.agendar(2.0, lambda: disparados.append('c'))
+    cancelado.cancelar()
+
+    relogio.dormir(0.55)
+    assert roda.avancar() == 2
+    assert disparados == ['a', 'b']
+    assert len(roda) == 1
+
+    relogio.dormir(1.0)
+    assert roda.avancar() == 0
+    relogio.dormir(0.5)
+    assert roda.avancar() == 1
+    assert disparados == ['a', 'b', 'c'] and len(roda) == 0
+
+
+def test_pausas_puladas_nao_adiantam_os_prazos():
+    from utils.relogio import relogio
+
+    modo, escala = relogio.modo, relogio.escala
+    relogio.configurar('instantaneo')
+    try:
+        roda = RodaTemporizadores()
+        roda.agendar(5, lambda: None)
+        # Outra sessão "dorme" um minuto no relógio do jogo
+        relogio.dormir(60)
+        assert roda.avancar() == 0 and len(roda) == 1
+    finally:
+        relogio.configurar(modo, escala)
+
+
+def test_juliana_avanca_enquanto_o_jogador_digita(monkeypatch):
+    from chapters import chapter_01
+    from utils.sessao_io import SessaoIO, usar
+
+    monkeypatch.setattr(sys, 'stdout', sys.stdout)
+    monkeypatch.setattr(sys, 'stdin', sys.stdin)
+    monkeypatch.setattr(chapter_01, 'PRAZO_ESTAGIO', 0.05)
+
+    class Lento(io.StringIO):
+        def readline(self, *args):
+            # O jogador demora para apertar ENTER (até com o comando certo)
+            time.sleep(0.8)
+            return "rm -rf *\n"
+
+    saida = io.StringIO()
+    state = chapter_01.GameState({'codiname': 'NEO'})
+    with usar(SessaoIO(Lento(), saida)):
+        resultado = chapter_01.prompt_sob_pressao("rm -rf *", state, "Teste", fase_inicial=4)
+
+    assert resultado == "TIMEOUT"
+    assert "A PORTA ESTÁ ABRINDO!" in saida.getvalue()
+    assert "ELA ESTÁ ATRÁS DE VOCÊ!" in saida.getvalue()
+
+
+def test_comando_sob_pressao_casa_pela_forma_e_erros_adiantam_juliana(monkeypatch):
+    from chapters import chapter_01
+    from utils.sessao_io import SessaoIO, usar
+
+    monkeypatch.setattr(sys, 'stdout', sys.stdout)
+    monkeypatch.setattr(sys, 'stdin', sys.stdin)
+
+    def jogar(*linhas):
+        state = chapter_01.GameState({'codiname': 'NEO'})
+        entrada = io.StringIO(''.join(f"{linha}\n" for linha in linhas))
+        with usar(SessaoIO(entrada, io.StringIO())):
+            return chapter_01.prompt_sob_pressao("rm -rf *", state, "Teste", fase_inicial=4), state
+
+    resultado, state = jogar("rm  -rf   *")
+    assert resultado == "SUCESSO" and state.score == 15
+
+    resultado, state = jogar("ls", "rm -f *")
+    assert resultado == "TIMEOUT" and state.comandos_digitados == ["ls", "rm -f *"]
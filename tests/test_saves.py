@@ -0,0 +1,80 @@
+import json
+import os
+
+from utils.indice_saves import IndiceSaves
+from utils.saves import ServicoSaves
+
+
+def test_grava_json_compacto_e_ignora_estado_identico(tmp_path):
+    arquivo = str(tmp_path / "saves" / "NEO.json")
+    servico = ServicoSaves()
+    dados = {'player_name': 'Neo', 'codiname': 'NEO', 'inventory': ['pendrive']}
+
+    assert servico.salvar(arquivo, dados) is True
+    with open(arquivo, encoding='utf-8') as f:
+        texto = f.read()
+    assert json.loads(texto) == dados
+    assert '\n' not in texto
+
+    assert servico.salvar(arquivo, dict(dados)) is False
+    dados['inventory'].append('laptop')
+    assert servico.campos_sujos(arquivo, dados)[0] == {'inventory'}
+    assert servico.salvar(arquivo, dados) is True
+    assert servico.gravacoes == 2 and servico.ignoradas == 1
+
+
+def test_carregar_memoriza_estado(tmp_path):
+    arquivo = str(tmp_path / "A.json")
+    with open(arquivo, 'w', encoding='utf-8') as f:
+        json.dump({'codiname': 'A', 'score': 1}, f, indent=2)
+
+    servico = ServicoSaves()
+    dados = servico.carregar(arquivo)
+    assert servico.salvar(arquivo, dados) is False
+    dados['score'] = 2
+    assert servico.salvar(arquivo, dados) is True
+
+
+def test_falha_na_escrita_preserva_save_anterior(tmp_path):
+    arquivo = str(tmp_path / "B.json")
+    servico = ServicoSaves()
+    servico.salvar(arquivo, {'codiname': 'B', 'score': 1})
+
+    class Quebrado:
+        def __repr__(self):
+            return 'x'
+
+    try:
+        servico.salvar(arquivo, {'codiname': 'B', 'score': Quebrado()})
+    except TypeError:
+        pass
+    with open(arquivo, encoding='utf-8') as f:
+        assert json.load(f) == {'codiname': 'B', 'score': 1}
+    assert [nome for nome in os.listdir(tmp_path) if nome.endswith('.tmp')] == []
+
+
+def test_rajada_divide_um_fsync_e_atualiza_indice(tmp_path):
+    pasta = str(tmp_path)
+    servico = ServicoSaves(IndiceSaves(pasta), janela_fsync=60)
+    for score in range(5):
+        servico.salvar(os.path.join(pasta, "C.json"), {'player_name': 'c', 'codiname': 'C', 'score': score})
+    assert len(servico._pendentes) == 1
+    servico.sincronizar()
+    assert not servico._pendentes
+    assert servico.indice.listar()[0]['codinome'] == 'C'
+
+
+def test_acesso_vai_para_o_indice_sem_regravar_o_save(tmp_path):
+    pasta = str(tmp_path)
+    arquivo = os.path.join(pasta, "D.json")
+    servico = ServicoSaves(IndiceSaves(pasta))
+    servico.salvar(arquivo, {'player_name': 'd', 'codiname': 'D', 'last_seen': '2024-01-01'})
+    mtime = os.stat(arquivo).st_mtime_ns
+
+    dados = servico.carregar(arquivo)
+    dados['last_seen'] = '2024-05-05'
+    assert servico.salvar(arquivo, dados) is False
+    assert os.stat(arquivo).st_mtime_ns == mtime
+
+    # Outra sessão vê o acesso novo pelo índice
+    assert IndiceSaves(pasta).listar()[0]['data'] == '2024-05-05'
@@ -0,0 +1,62 @@
+import json
+import threading
+
+from utils.saves_sqlite import ArmazemSQLite
+
+
+def _save(codinome, data, capitulo=1):
+    return {'player_name': 'Neo', 'codiname': codinome, 'current_chapter': capitulo, 'last_seen': data}
+
+
+def test_salvar_carregar_e_listar(tmp_path):
+    armazem = ArmazemSQLite(str(tmp_path / "saves.db"))
+    for i in range(5):
+        armazem.salvar(f"saves/S{i}.json", _save(f"S{i}", f"2024-01-0{i + 1}", capitulo=i))
+
+    assert armazem.carregar("saves/S3.json")['current_chapter'] == 3
+    assert [s['codinome'] for s in armazem.listar(pagina=1, por_pagina=2)] == ['S2', 'S1']
+    assert [s['codinome'] for s in armazem.listar('capitulo', decrescente=False)][:2] == ['S0', 'S1']
+    modo = armazem._conexao().execute("PRAGMA journal_mode").fetchone()[0]
+    assert modo == 'wal'
+
+
+def test_acesso_nao_regrava_os_dados(tmp_path):
+    armazem = ArmazemSQLite(str(tmp_path / "saves.db"))
+    armazem.salvar("saves/A.json", _save("A", "2024-01-01"))
+    dados = armazem.carregar("saves/A.json")
+    dados['last_seen'] = '2024-06-01'
+    assert armazem.salvar("saves/A.json", dados) is False
+    assert armazem.listar()[0]['data'] == '2024-06-01'
+    assert armazem.carregar("saves/A.json")['last_seen'] == '2024-01-01'
+
+
+def test_escritores_concorrentes(tmp_path):
+    caminho = str(tmp_path / "saves.db")
+    ArmazemSQLite(caminho)
+    erros = []
+
+    def sessao(n):
+        try:
+            armazem = ArmazemSQLite(caminho)
+            for score in range(20):
+                dados = _save(f"P{n}", "2024-01-01")
+                dados['score'] = score
+                armazem.salvar(f"saves/P{n}.json", dados)
+        except Exception as e:
+            erros.append(e)
+
+    threads = [threading.Thread(target=sessao, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert erros == []
+    assert ArmazemSQLite(caminho).total() == 8
+
+
+def test_importa_pasta_json(tmp_path):
+    pasta = tmp_path / "saves"
+    pasta.mkdir()
+    (pasta / "X.json").write_text(json.dumps(_save("X", "2024-03-03")), encoding='utf-8')
+    armazem = ArmazemSQLite(str(pasta / "saves.db"), importar_de=str(pasta))
+    assert armazem.listar()[0]['codinome'] == 'X'
@@ -0,0 +1,92 @@
+import sys
+import asyncio
+
+from root_evolution_server import ServidorJogo
+
+
+class JogoEco:
+    """Jogo mínimo: pergunta o nome e repete comandos até 'sair'"""
+
+    def __init__(self, io):
+        self.io = io
+
+    def executar(self):
+        nome = input("nome> ")
+        print(f"ola {nome}")
+        while True:
+            try:
+                cmd = input("$ ")
+            except EOFError:
+                return
+            if cmd == 'sair':
+                print(f"tchau {nome}")
+                return
+            print(f"{nome}: {cmd}")
+
+
+async def _conversar(porta, linhas):
+    leitor, escritor = await asyncio.open_connection('127.0.0.1', porta)
+    for linha in linhas:
+        escritor.write(linha.encode() + b'\r\n')
+    await escritor.drain()
+    recebido = await asyncio.wait_for(leitor.read(), 5)
+    escritor.close()
+    return recebido.decode()
+
+
+def test_sessoes_simultaneas_nao_se_misturam(monkeypatch):
+    # O servidor troca sys.stdin/sys.stdout pelos roteadores: restaurados no fim do teste
+    monkeypatch.setattr(sys, 'stdout', sys.stdout)
+    monkeypatch.setattr(sys, 'stdin', sys.stdin)
+
+    async def cenario():
+        servidor = ServidorJogo(fabrica=JogoEco)
+        await servidor.iniciar(porta=0)
+        porta = servidor.enderecos[0][1]
+        ana, bia = await asyncio.gather(
+            _conversar(porta, ['ana', 'ls', 'sair']),
+            _conversar(porta, ['bia', 'pwd', 'sair']),
+        )
+        servidor.fechar()
+        return ana, bia
+
+    ana, bia = asyncio.run(cenario())
+    assert 'ola ana\r\n' in ana and 'ana: ls' in ana and 'tchau ana' in ana
+    assert 'bia: pwd' in bia and 'ana' not in bia
+
+
+def test_servidor_cheio_recusa_conexao(monkeypatch):
+    monkeypatch.setattr(sys, 'stdout', sys.stdout)
+    monkeypatch.setattr(sys, 'stdin', sys.stdin)
+
+    async def cenario():
+        servidor = ServidorJogo(fabrica=JogoEco, max_sessoes=1)
+        await servidor.iniciar(porta=0)
+        porta = servidor.enderecos[0][1]
+        leitor, escritor = await asyncio.open_connection('127.0.0.1', porta)
+        await leitor.readuntil(b'nome> ')
+        recusado = await _conversar(porta, [])
+        escritor.close()
+        servidor.fechar()
+        return recusado
+
+    assert 'Servidor cheio' in asyncio.run(cenario())
+
+
+def test_cada_jogador_so_ve_os_proprios_saves():
+    import io
+    from root_evolution_main import IntroMenu
+    from utils.sessao_io import SessaoIO
+
+    class Indice:
+        def listar(self, *args, **kwargs):
+            return [{'arquivo': f"saves/{nome}"} for nome in
+                    ("ana@NEO_10_initial.json", "bia@NEO_10_initial.json", "NEO_10_initial.json")]
+
+    def saves_de(espaco):
+        menu = IntroMenu(io=SessaoIO(io.StringIO(), io.StringIO()), espaco_saves=espaco)
+        menu.indice_saves = Indice()
+        return [save['arquivo'] for save in menu._listar_saves_disponiveis()]
+
+    assert saves_de('ana') == ["saves/ana@NEO_10_initial.json"]
+    assert saves_de(None) == ["saves/NEO_10_initial.json"]
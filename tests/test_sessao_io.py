@@ -0,0 +1,62 @@
+import io
+import sys
+import asyncio
+import threading
+
+import pytest
+
+from utils.sessao_io import SessaoIO, usar, sessao_atual, sessao_padrao
+
+
+@pytest.fixture
+def roteamento(monkeypatch):
+    # `usar` instala os roteadores em sys.stdin/sys.stdout: restaurados no fim do teste
+    monkeypatch.setattr(sys, 'stdout', sys.stdout)
+    monkeypatch.setattr(sys, 'stdin', sys.stdin)
+
+
+def test_buffer_por_bloco_sai_na_leitura():
+    saida = io.StringIO()
+    sessao = SessaoIO(io.StringIO("ls\n"), saida, linha_a_linha=False)
+    sessao.escrever("linha 1")
+    sessao.escrever("linha 2")
+    assert saida.getvalue() == ""
+
+    assert sessao.ler("$ ") == "ls"
+    assert saida.getvalue() == "linha 1\nlinha 2\n$ "
+    with pytest.raises(EOFError):
+        sessao.ler()
+
+
+def test_print_e_input_vao_para_a_sessao_da_thread(roteamento):
+    saida = io.StringIO()
+    sessao = SessaoIO(io.StringIO("Neo\n"), saida)
+    outra_thread = []
+
+    with usar(sessao):
+        nome = input("nome> ")
+        print(f"ola {nome}")
+        assert sessao_atual() is sessao
+        thread = threading.Thread(target=lambda: outra_thread.append(sessao_atual()))
+        thread.start()
+        thread.join()
+
+    assert saida.getvalue() == "nome> ola Neo\n"
+    assert outra_thread == [sessao_padrao]
+    assert sessao_atual() is sessao_padrao
+
+
+def test_leitura_assincrona():
+    sessao = SessaoIO(io.StringIO("whoami\n"), io.StringIO())
+    assert asyncio.run(sessao.ler_async("$ ")) == "whoami"
+
+
+def test_capitulo_roda_numa_sessao(roteamento):
+    from chapters import chapter_04
+
+    saida = io.StringIO()
+    sessao = SessaoIO(io.StringIO("menu\n"), saida, linha_a_linha=False)
+    resultado = chapter_04.iniciar({'codiname': 'NEO'}, io=sessao)
+
+    assert resultado['saindo_para_menu'] is True
+    assert "BLACK_BOX_OMEGA" in saida.getvalue()
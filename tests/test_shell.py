@@ -0,0 +1,102 @@
+import pytest
+
+from utils.shell import ErroSintaxe, Shell, analisar
+
+
+def test_pipe_decodifica_base64():
+    shell = Shell()
+    status, saida = shell.capturar("echo 'T2zDoSwgbXVuZG8=' | base64 -d")
+    assert status == 0
+    assert saida == ['Olá, mundo']
+
+
+def test_redirecionamento_grava_no_vfs():
+    shell = Shell()
+    shell.capturar("echo primeira > log.txt; echo segunda >> log.txt")
+    assert shell.vfs.buscar('~/log.txt').conteudo == 'primeira\nsegunda\n'
+    assert shell.capturar("grep -n seg < log.txt") == (0, ['2:segunda'])
+
+
+def test_e_logico_interrompe_apos_falha():
+    shell = Shell(ao_erro=lambda mensagem, tipo: None)
+    status, saida = shell.capturar("cat inexistente && echo nao || echo sim")
+    assert status == 0
+    assert saida == ['sim']
+
+
+def test_head_consome_a_entrada_sob_demanda():
+    shell = Shell()
+    produzidas = []
+
+    def infinito(args, entrada):
+        numero = 0
+        while True:
+            produzidas.append(numero)
+            yield str(numero)
+            numero += 1
+
+    shell.registrar('yes', infinito)
+    assert shell.capturar("yes | head -n 3") == (0, ['0', '1', '2'])
+    assert len(produzidas) <= 4
+
+
+def test_comando_antigo_entra_no_pipe_sem_ansi():
+    comandos = {'whoami': lambda args: print('\033[92mroot\033[0m') or True}
+    shell = Shell(comandos=comandos)
+    assert shell.capturar("whoami | wc -c") == (0, ['5'])
+
+
+def test_erros_de_sintaxe():
+    for linha in ("| grep x", "echo a >", "echo a &&"):
+        with pytest.raises(ErroSintaxe):
+            analisar(linha)
+
+
+def test_quantidade_invalida_em_head_e_tail_e_erro_do_estagio():
+    erros = []
+    shell = Shell(ao_erro=lambda mensagem, tipo: erros.append(mensagem))
+    assert shell.capturar("echo x | head -n abc") == (1, [])
+    assert shell.capturar("echo x | tail -n -3") == (1, [])
+    assert erros == ["head: invalid number of lines: 'abc'", "tail: invalid number of lines: '-3'"]
+
+
+def test_erros_dos_estagios_levam_o_nome_do_programa():
+    erros = []
+    shell = Shell(ao_erro=lambda mensagem, tipo: erros.append(mensagem))
+    shell.capturar("cat ~; head nada.txt; grep x < nada.txt")
+    assert erros == ["cat: ~: Is a directory",
+                     "head: nada.txt: No such file or directory",
+                     "bash: nada.txt: No such file or directory"]
+
+
+def test_captura_de_comando_antigo_nao_pega_a_saida_de_outras_threads():
+    import io
+    import sys
+    import threading
+    from utils.sessao_io import SessaoIO, instalar_roteamento, usar
+
+    instalar_roteamento()
+    roteador = sys.stdout
+    dentro = threading.Event()
+    liberar = threading.Event()
+
+    def lento(args):
+        print('capturado')
+        dentro.set()
+        liberar.wait(2)
+        return True
+
+    shell = Shell(comandos={'lento': lento})
+    resultado = []
+    thread = threading.Thread(target=lambda: resultado.append(shell.capturar("lento | wc -l")))
+    thread.start()
+    dentro.wait(2)
+    assert sys.stdout is roteador
+    # Outra sessão imprimindo enquanto a captura está aberta
+    outra = io.StringIO()
+    with usar(SessaoIO(None, outra)):
+        print('de outra sessão')
+    liberar.set()
+    thread.join()
+    assert resultado == [(0, ['1'])]
+    assert outra.getvalue() == 'de outra sessão\n'
@@ -0,0 +1,35 @@
+import os
+import time
+
+from utils.relogio import Relogio
+from utils import teclado as modulo_teclado
+from utils.teclado import Teclado
+
+
+def test_enter_e_consumido_sem_levar_o_resto(monkeypatch):
+    monkeypatch.setattr(modulo_teclado, 'relogio', Relogio('real'))
+    leitura, escrita = os.pipe()
+    try:
+        with Teclado(descritor=leitura) as teclado:
+            assert teclado.disponivel
+            assert not teclado.enter_pressionado()
+
+            os.write(escrita, b"\nmenu\n")
+            inicio = time.monotonic()
+            assert teclado.esperar(5)
+            assert time.monotonic() - inicio < 1
+
+        # Fora do bloco nada é lido: a próxima linha continua na entrada
+        assert os.read(leitura, 100) == b"menu\n"
+    finally:
+        os.close(leitura)
+        os.close(escrita)
+
+
+def test_sem_descritor_nunca_acusa_tecla():
+    import io
+    from utils.sessao_io import SessaoIO
+
+    with Teclado(SessaoIO(io.StringIO("\n"), io.StringIO())) as teclado:
+        assert not teclado.disponivel
+        assert not teclado.esperar(0.01)
@@ -0,0 +1,36 @@
+import io
+
+from utils.tela import Tela
+
+
+def test_limpar_nao_cria_subprocesso(monkeypatch, terminal):
+    import os
+    monkeypatch.setattr(os, 'system', lambda *_: (_ for _ in ()).throw(AssertionError("os.system chamado")))
+    Tela(terminal).limpar()
+    assert '\033[2J' in terminal.getvalue()
+
+
+def test_renderizar_envia_apenas_linhas_alteradas(terminal):
+    saida = terminal
+    tela = Tela(saida)
+    tela.renderizar(["MENU", "[1] NOVO JOGO", "[0] SAIR"])
+
+    saida.seek(0)
+    saida.truncate()
+    tela.renderizar(["MENU", "[1] CONTINUAR", "[0] SAIR"])
+
+    enviado = saida.getvalue()
+    assert "CONTINUAR" in enviado
+    assert "MENU" not in enviado
+    assert "SAIR" not in enviado
+    assert '\033[2J' not in enviado
+
+
+def test_sem_terminal_nao_emite_escapes():
+    saida = io.StringIO()
+    tela = Tela(saida)
+    tela.limpar()
+    tela.renderizar(["MENU", "[0] SAIR"])
+    tela.renderizar(["MENU", "[1] NOVO"])
+    assert '\033' not in saida.getvalue()
+    assert saida.getvalue().count("MENU") == 2
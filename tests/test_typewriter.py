@@ -0,0 +1,53 @@
+import io
+
+from utils.relogio import agora
+from utils.typewriter import Typewriter
+
+
+class ContadorFlush(io.StringIO):
+    """StringIO (com cara de terminal) que conta quantas vezes flush() foi chamado"""
+
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+    def isatty(self):
+        return True
+
+
+def test_digitar_agrupa_por_quadro():
+    saida = ContadorFlush()
+    tw = Typewriter(fps=60, stream=saida)
+
+    texto = "x" * 120
+    inicio = agora()
+    tw.digitar(texto, delay=0.001, cor="<", fim=">")
+    decorrido = agora() - inicio
+
+    assert saida.getvalue() == "<" + texto + ">"
+    # 120 caracteres em ~0.12s a 60 fps: bem menos flushes que caracteres
+    assert saida.flushes <= 12
+    assert decorrido >= 0.11
+
+
+def test_glitch_reescreve_com_backspace():
+    saida = ContadorFlush()
+    tw = Typewriter(stream=saida)
+
+    tw.digitar("abcdefghij" * 5, delay=0.0005, glitch=True)
+
+    visivel = saida.getvalue()
+    # Cada backspace é seguido pela reescrita do mesmo caractere
+    for i, caractere in enumerate(visivel):
+        if caractere == '\b':
+            assert visivel[i + 1] == visivel[i - 1]
+
+
+def test_saida_sem_terminal_escreve_de_uma_vez():
+    saida = io.StringIO()
+    Typewriter(stream=saida).digitar("log capturado", delay=0.5, glitch=True)
+    assert saida.getvalue() == "log capturado"
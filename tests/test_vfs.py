@@ -0,0 +1,47 @@
+import pytest
+
+from utils.vfs import ErroVFS, SistemaArquivos
+
+
+def test_normalizar_resolve_ponto_pontoponto_e_home():
+    vfs = SistemaArquivos('/root')
+    assert vfs.normalizar('~/a/./b/../c//d/') == '/root/a/c/d'
+    assert vfs.normalizar('../../..', cwd='/root/a') == '/'
+    assert vfs.normalizar('x', cwd='/tmp') == '/tmp/x'
+    assert vfs.exibir('/root/Private') == '~/Private'
+
+
+def test_montar_arvore_grande_e_buscar():
+    vfs = SistemaArquivos('/root')
+    arvore = {f"caso_{i}": {f"log_{j}.txt": f"evento {j}" for j in range(50)} for i in range(100)}
+    vfs.montar(arvore, '~/forense')
+
+    arquivo = vfs.buscar('~/forense/caso_42/../caso_99/log_7.txt')
+    assert arquivo.conteudo == "evento 7"
+    assert vfs.caminho_de(arquivo) == '/root/forense/caso_99/log_7.txt'
+    assert vfs.buscar('~/forense/caso_1/nao_existe') is None
+    assert len(vfs) > 5000
+
+
+def test_escrever_e_remover():
+    vfs = SistemaArquivos('/root')
+    vfs.escrever('~/notas.txt', 'a')
+    vfs.escrever('~/notas.txt', 'b', anexar=True)
+    assert vfs.buscar('~/notas.txt').conteudo == 'ab'
+
+    vfs.remover('~/notas.txt')
+    assert vfs.buscar('~/notas.txt') is None
+    with pytest.raises(ErroVFS):
+        vfs.escrever('~/sem/pai.txt', 'x')
+
+
+def test_com_prefixo_acompanha_montagens():
+    vfs = SistemaArquivos('/root')
+    vfs.montar({'Private': {'.conversa.pdf': 'x', 'evidences': {}}, 'Pictures': {}}, '~')
+    home = vfs.buscar('~')
+    assert vfs.com_prefixo(home, 'P') == ['Pictures', 'Private']
+
+    vfs.montar({'Projects': {}}, '~')
+    vfs.remover('~/Pictures')
+    assert vfs.com_prefixo(home, 'P') == ['Private', 'Projects']
+    assert vfs.listar(home) == ['Private', 'Projects']
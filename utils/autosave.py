@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+AUTOSAVE.PY - Gravação dos saves em segundo plano (RoOt 3voluti0n)
+O menu, os capítulos e o mercado só entregam o estado do jogador para
+a fila; uma thread de gravação faz o snapshot (diário + serviço de
+saves) fora do fluxo de entrada, então nenhum prompt espera pelo disco.
+
+- a fila guarda só o estado mais recente de cada save: dez salvamentos
+  seguidos do mesmo arquivo viram uma gravação;
+- a fila é limitada: com `limite` saves diferentes pendentes, quem
+  agenda espera a thread esvaziá-la;
+- a thread grava quando o intervalo passa, quando alguém pede
+  (`descarregar`, nas trocas de capítulo) e na saída do programa;
+- gravação que falha volta para a fila (nova tentativa no próximo
+  lote) e o erro fica guardado por save até alguém daquele save
+  perguntar: `descarregar(arquivo, esperar=True)` ou `erro_pendente`.
+  O erro de um jogador nunca chega a outro.
+"""
+
+import copy
+import time
+import atexit
+import threading
+
+
+def _gravar_snapshot(arquivo, dados, seq):
+    from utils.diario import diario_de
+    diario_de(arquivo).compactar(dados, ate=seq)
+
+
+def _seq_atual(arquivo):
+    from utils.diario import diario_de
+    return diario_de(arquivo).seq
+
+
+class Autosave:
+    """
+    Fila de saves com uma thread de gravação.
+    
+    `agendar(arquivo, dados)` copia o estado e retorna na hora;
+    `descarregar()` pede a gravação imediata do que está na fila. Com
+    `esperar=True` só retorna depois dela; se `arquivo` foi dado, espera
+    uma tentativa daquele save e relança o erro dele, se houver.
+    """
+
+    def __init__(self, intervalo=2.0, limite=32, gravar=_gravar_snapshot, seq=_seq_atual):
+        self.intervalo = intervalo
+        self.limite = limite
+        self._gravar = gravar
+        self._seq = seq
+        self._pendentes = {}
+        self._erros = {}
+        self._tentativas = {}
+        self._urgente = False
+        self._gravando = frozenset()
+        self._encerrando = False
+        self._thread = None
+        self._condicao = threading.Condition()
+        self.gravacoes = 0
+
+    # ========== FILA ==========
+    def agendar(self, arquivo, dados):
+        """Coloca na fila uma cópia do estado de `arquivo` (substitui a anterior)"""
+        # Último evento do diário já refletido neste estado
+        seq = self._seq(arquivo) if self._seq else None
+        copia = copy.deepcopy(dados)
+        with self._condicao:
+            if self._encerrando:
+                # Thread já parada (saída do programa): grava direto
+                self._gravar(arquivo, copia, seq)
+                return
+            while arquivo not in self._pendentes and len(self._pendentes) >= self.limite:
+                self._urgente = True
+                self._condicao.notify_all()
+                self._condicao.wait()
+            self._pendentes[arquivo] = (copia, seq)
+            self._iniciar()
+            self._condicao.notify_all()
+
+    @property
+    def pendentes(self):
+        with self._condicao:
+            return len(self._pendentes) + (1 if self._gravando else 0)
+
+    def descarregar(self, arquivo=None, esperar=False):
+        """
+        Grava agora o que está na fila. Com `esperar`, bloqueia até a
+        tentativa de gravação do que estava pendente (só de `arquivo`, se
+        dado) e relança o erro de `arquivo`; sem `arquivo` nenhum erro é
+        relançado, eles continuam guardados para o respectivo save.
+        """
+        with self._condicao:
+            if self._pendentes or self._gravando:
+                self._urgente = True
+                self._condicao.notify_all()
+            if esperar:
+                alvos = [arquivo] if arquivo is not None else [*self._pendentes, *self._gravando]
+                # Espera uma tentativa nova de cada alvo ainda na fila (ou sendo gravado)
+                vistas = {alvo: self._tentativas.get(alvo, 0) for alvo in alvos}
+                while any(self._em_andamento(alvo) and self._tentativas.get(alvo, 0) == vista
+                          for alvo, vista in vistas.items()):
+                    self._condicao.wait()
+            erro = self._erros.pop(arquivo, None) if esperar and arquivo is not None else None
+        if erro is not None:
+            raise erro
+
+    def _em_andamento(self, arquivo):
+        return arquivo in self._pendentes or arquivo in self._gravando
+
+    def erro_pendente(self, arquivo):
+        """Erro ainda não informado da última gravação de `arquivo` (e o esquece)"""
+        with self._condicao:
+            return self._erros.pop(arquivo, None)
+
+    def encerrar(self):
+        """Grava tudo que está pendente e para a thread"""
+        with self._condicao:
+            self._encerrando = True
+            self._condicao.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    # ========== THREAD DE GRAVAÇÃO ==========
+    def _iniciar(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._laco, name="autosave", daemon=True)
+            self._thread.start()
+
+    def _proximo_lote(self):
+        with self._condicao:
+            while not self._pendentes and not self._encerrando:
+                self._condicao.wait()
+            # Janela de agrupamento: mais salvamentos do mesmo save substituem o pendente
+            prazo = time.monotonic() + self.intervalo
+            while not self._urgente and not self._encerrando:
+                restante = prazo - time.monotonic()
+                if restante <= 0:
+                    break
+                self._condicao.wait(restante)
+            lote, self._pendentes = self._pendentes, {}
+            self._urgente = False
+            self._gravando = frozenset(lote)
+            # Libera quem esperava espaço na fila
+            self._condicao.notify_all()
+            return lote
+
+    def _laco(self):
+        while True:
+            lote = self._proximo_lote()
+            if not lote:
+                return
+            for arquivo, (dados, seq) in lote.items():
+                try:
+                    self._gravar(arquivo, dados, seq)
+                    erro = None
+                    self.gravacoes += 1
+                except Exception as e:
+                    erro = e
+                with self._condicao:
+                    self._tentativas[arquivo] = self._tentativas.get(arquivo, 0) + 1
+                    if erro is None:
+                        # Gravou: um erro anterior deste save deixou de valer
+                        self._erros.pop(arquivo, None)
+                    else:
+                        self._erros[arquivo] = erro
+                        if not self._encerrando:
+                            # Tenta de novo no próximo lote (se não chegou estado mais novo)
+                            self._pendentes.setdefault(arquivo, (dados, seq))
+            with self._condicao:
+                self._gravando = frozenset()
+                self._condicao.notify_all()
+
+
+# Instância compartilhada pelo menu, capítulos e mercado
+autosave = Autosave()
+atexit.register(autosave.encerrar)
+
+
+__all__ = ['Autosave', 'autosave']
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+CAPACIDADES.PY - Detecção das capacidades da saída do RoOt 3voluti0n
+Quando a saída não é um terminal (pipe, captura de log, CI), as animações
+usam um caminho simples: sem pausas, sem códigos de escape, sem redesenho.
+
+A detecção automática pode ser forçada com ROOT_EVOLUTION_INTERATIVO=1/0.
+"""
+
+import os
+import re
+import sys
+
+VARIAVEL_AMBIENTE = 'ROOT_EVOLUTION_INTERATIVO'
+
+# CSI (cores, cursor, limpeza), OSC e escapes de dois caracteres
+_ANSI = re.compile(r'\x1b\[[0-?]*[ -/]*[@-~]|\x1b\][^\x07]*\x07|\x1b[@-Z\\-_]')
+
+
+def interativo(stream=None):
+    """True se `stream` (padrão: sys.stdout) é um terminal de verdade"""
+    forcado = os.environ.get(VARIAVEL_AMBIENTE, '').strip().lower()
+    if forcado in ('1', 'sim', 'true'):
+        return True
+    if forcado in ('0', 'nao', 'não', 'false'):
+        return False
+
+    if stream is None:
+        stream = sys.stdout
+    try:
+        return bool(stream.isatty())
+    except (AttributeError, ValueError):
+        # Sem isatty ou stream já fechado
+        return False
+
+
+def remover_ansi(texto):
+    """Remove sequências de escape ANSI de `texto`"""
+    return _ANSI.sub('', texto)
+
+
+class SaidaSimples:
+    """
+    Envolve um stream não interativo removendo os códigos de escape,
+    para que logs capturados fiquem pequenos e legíveis.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, texto):
+        return self._stream.write(remover_ansi(texto))
+
+    def isatty(self):
+        return False
+
+    def __getattr__(self, nome):
+        return getattr(self._stream, nome)
+
+
+def preparar_saida():
+    """Instala a saída sem escapes quando stdout não é um terminal"""
+    if not interativo() and not isinstance(sys.stdout, SaidaSimples):
+        sys.stdout = SaidaSimples(sys.stdout)
+    return sys.stdout
+
+
+__all__ = ['interativo', 'remover_ansi', 'SaidaSimples', 'preparar_saida']
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+COMANDOS.PY - Padrões de comando para validar as missões do RoOt 3voluti0n
+Cada resposta esperada é compilada uma vez (com o analisador do shell)
+numa forma normalizada: programa, conjunto de flags, argumentos e
+redirecionamentos de cada estágio do pipeline. Assim 'ls -la', 'ls -a -l'
+e "ls  '-al'" são o mesmo comando, e o que o jogador digita é analisado
+uma vez só, por mais regras que a etapa tenha.
+
+Só as flags booleanas conhecidas do programa (FLAGS_BOOLEANAS) viram
+conjunto, e só um grupo feito apenas delas ('-la') é desmembrado. As
+demais opções ficam no lugar, junto do valor que as segue: em
+'openssl enc -in a.enc -out b.txt' trocar os arquivos, escrever
+'find / -eman x' ou 'nmap -Vs' não casa.
+
+    PadraoComando("echo * | base64 -d")      '*' aceita qualquer argumento
+    PadraoComando("zip2john fotos.zip > *")  ... e qualquer destino
+
+IndiceSugestoes responde o "você quis dizer" com distância de edição
+limitada sobre as formas canônicas das respostas válidas.
+"""
+
+from functools import lru_cache
+
+from utils.shell import analisar, ErroSintaxe
+
+# Coringa: qualquer argumento (ou alvo de redirecionamento)
+CORINGA = '*'
+
+# Distância máxima para uma sugestão
+DISTANCIA_SUGESTAO = 3
+
+# Flags sem valor, por programa: só estas podem mudar de ordem ou vir agrupadas
+FLAGS_BOOLEANAS = {
+    'ls': frozenset('-a -l -h -r -t -R -S -A -1 -d -i --all --human-readable'.split()),
+    'rm': frozenset('-r -f -R -i -v -d --recursive --force'.split()),
+    'cp': frozenset('-r -f -R -i -v -p -a --recursive --force'.split()),
+    'mv': frozenset('-f -i -v -n --force'.split()),
+    'mkdir': frozenset('-p -v --parents'.split()),
+    'grep': frozenset('-i -v -n -r -R -l -c -w -o -E -F -H --ignore-case --invert-match'.split()),
+    'base64': frozenset('-d -i --decode --ignore-garbage'.split()),
+    'cat': frozenset('-n -A -b -E -s -v'.split()),
+    'ps': frozenset('-e -f -a -u -x'.split()),
+    'netstat': frozenset('-t -u -l -p -a -n'.split()),
+    'ss': frozenset('-t -u -l -p -a -n'.split()),
+    'uname': frozenset('-a -r -s -n -m'.split()),
+    'wc': frozenset('-l -w -c -m'.split()),
+    'sort': frozenset('-r -n -u -f'.split()),
+    'uniq': frozenset('-c -d -u -i'.split()),
+}
+
+
+# ========== FORMA NORMALIZADA ==========
+def _flags(token, booleanas):
+    """
+    '-la' -> ('-a', '-l') se todas as letras forem flags booleanas do
+    programa; senão None (a opção fica no lugar, com o valor seguinte)
+    """
+    if token in booleanas:
+        return (token,)
+    if token.startswith('--') or len(token) < 3:
+        return None
+    letras = tuple('-' + letra for letra in token[1:])
+    return letras if all(letra in booleanas for letra in letras) else None
+
+
+def _estagio(comando):
+    programa, *resto = comando.argv
+    booleanas = FLAGS_BOOLEANAS.get(programa, frozenset())
+    flags = set()
+    argumentos = []
+    for token in resto:
+        desmembradas = _flags(token, booleanas) if token.startswith('-') and token != '-' else None
+        if desmembradas is not None:
+            flags.update(desmembradas)
+        else:
+            argumentos.append(token)
+    saida = (comando.saida, comando.anexar) if comando.saida is not None else None
+    return (programa, frozenset(flags), tuple(argumentos), saida, comando.entrada)
+
+
+@lru_cache(maxsize=512)
+def forma(cmd):
+    """Forma normalizada da linha (tupla de (operador, estágios)), ou None se não analisável"""
+    try:
+        itens = analisar(cmd)
+    except ErroSintaxe:
+        return None
+    if not itens:
+        return None
+    return tuple((operador, tuple(_estagio(comando) for comando in pipeline))
+                 for operador, pipeline in itens)
+
+
+def _texto_estagio(estagio):
+    programa, flags, argumentos, saida, entrada = estagio
+    partes = [programa, *sorted(flags), *argumentos]
+    if entrada is not None:
+        partes += ['<', entrada]
+    if saida is not None:
+        partes += ['>>' if saida[1] else '>', saida[0]]
+    return ' '.join(partes)
+
+
+@lru_cache(maxsize=512)
+def canonico(cmd):
+    """Texto canônico (flags em ordem, espaços e aspas normalizados)"""
+    normalizada = forma(cmd)
+    if normalizada is None:
+        return ' '.join(cmd.split())
+    partes = []
+    for operador, estagios in normalizada:
+        if operador:
+            partes.append(operador)
+        partes.append(' | '.join(_texto_estagio(estagio) for estagio in estagios))
+    return ' '.join(partes)
+
+
+# ========== PADRÕES ==========
+def _valor_casa(esperado, valor):
+    return esperado == CORINGA or esperado == valor
+
+
+def _estagio_casa(esperado, digitado):
+    programa, flags, argumentos, saida, entrada = esperado
+    if programa != digitado[0] or flags != digitado[1] or len(argumentos) != len(digitado[2]):
+        return False
+    if not all(_valor_casa(a, b) for a, b in zip(argumentos, digitado[2])):
+        return False
+    if (saida is None) != (digitado[3] is None) or (entrada is None) != (digitado[4] is None):
+        return False
+    if saida is not None and (saida[1] != digitado[3][1] or not _valor_casa(saida[0], digitado[3][0])):
+        return False
+    return entrada is None or _valor_casa(entrada, digitado[4])
+
+
+class PadraoComando:
+    """Uma resposta esperada, compilada"""
+
+    __slots__ = ('texto', 'forma', 'canonico', 'coringa')
+
+    def __init__(self, texto):
+        self.texto = texto
+        self.forma = forma(texto)
+        if self.forma is None:
+            raise ValueError(f"padrão de comando inválido: {texto!r}")
+        self.canonico = canonico(texto)
+        self.coringa = CORINGA in self.canonico.split()
+
+    def casa(self, cmd):
+        digitada = forma(cmd)
+        if digitada is None:
+            return False
+        if not self.coringa:
+            return digitada == self.forma
+        if len(digitada) != len(self.forma):
+            return False
+        for (operador, estagios), (operador_digitado, digitados) in zip(self.forma, digitada):
+            if operador != operador_digitado or len(estagios) != len(digitados):
+                return False
+            if not all(_estagio_casa(e, d) for e, d in zip(estagios, digitados)):
+                return False
+        return True
+
+    __call__ = casa
+
+    def __repr__(self):
+        return f"PadraoComando({self.texto!r})"
+
+
+# ========== SUGESTÕES ==========
+def distancia(a, b, limite):
+    """Distância de Levenshtein entre a e b, ou limite + 1 se passar do limite"""
+    if abs(len(a) - len(b)) > limite:
+        return limite + 1
+    if len(a) < len(b):
+        a, b = b, a
+    anterior = list(range(len(b) + 1))
+    for i, letra in enumerate(a, 1):
+        atual = [i]
+        for j, outra in enumerate(b, 1):
+            atual.append(min(anterior[j] + 1, atual[j - 1] + 1, anterior[j - 1] + (letra != outra)))
+        # Nenhum caminho cabe mais no limite: desiste da linha toda
+        if min(atual) > limite:
+            return limite + 1
+        anterior = atual
+    return anterior[-1]
+
+
+class IndiceSugestoes:
+    """
+    Respostas válidas agrupadas pelo tamanho da forma canônica: uma
+    consulta só compara com as de tamanho próximo (dentro do limite).
+    """
+
+    def __init__(self, respostas=(), limite=DISTANCIA_SUGESTAO):
+        self.limite = limite
+        self._por_tamanho = {}
+        for resposta in respostas:
+            self.adicionar(resposta)
+
+    def adicionar(self, resposta):
+        forma_canonica = canonico(resposta)
+        if CORINGA in forma_canonica.split():
+            return
+        grupo = self._por_tamanho.setdefault(len(forma_canonica), {})
+        grupo.setdefault(forma_canonica, resposta)
+
+    def __bool__(self):
+        return bool(self._por_tamanho)
+
+    def sugerir(self, cmd):
+        """Resposta mais próxima do comando (None se for igual ou longe demais)"""
+        alvo = canonico(cmd)
+        # Comandos curtos toleram menos edições ('ls -a' não vira 'ls')
+        limite = min(self.limite, max(1, len(alvo) // 3))
+        melhor, menor = None, limite + 1
+        for tamanho in range(len(alvo) - limite, len(alvo) + limite + 1):
+            for forma_canonica, resposta in self._por_tamanho.get(tamanho, {}).items():
+                d = distancia(alvo, forma_canonica, menor - 1)
+                if 0 < d < menor:
+                    melhor, menor = resposta, d
+        return melhor
+
+
+__all__ = ['PadraoComando', 'IndiceSugestoes', 'forma', 'canonico', 'distancia', 'CORINGA', 'FLAGS_BOOLEANAS']
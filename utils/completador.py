@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+COMPLETADOR.PY - Completar com TAB no terminal simulado do RoOt 3voluti0n
+Índice de prefixos (lista ordenada + busca binária) para os comandos e
+busca por prefixo direto nos diretórios do VFS, que mantêm os nomes dos
+filhos em ordem a cada arquivo montado. Completar custa O(log n + k),
+mesmo com árvores grandes.
+"""
+
+from bisect import bisect_left, insort
+
+# Separadores de palavra para o readline: '/' e '~' fazem parte dos caminhos
+DELIMITADORES = ' \t\n|;&<>'
+
+
+class IndicePrefixos:
+    """Conjunto ordenado de palavras com consulta por prefixo"""
+
+    def __init__(self, palavras=()):
+        self._palavras = sorted(set(palavras))
+
+    def adicionar(self, palavra):
+        indice = bisect_left(self._palavras, palavra)
+        if indice == len(self._palavras) or self._palavras[indice] != palavra:
+            insort(self._palavras, palavra)
+
+    def remover(self, palavra):
+        indice = bisect_left(self._palavras, palavra)
+        if indice < len(self._palavras) and self._palavras[indice] == palavra:
+            del self._palavras[indice]
+
+    def com_prefixo(self, prefixo):
+        """Palavras que começam com `prefixo`, em ordem"""
+        resultado = []
+        for indice in range(bisect_left(self._palavras, prefixo), len(self._palavras)):
+            palavra = self._palavras[indice]
+            if not palavra.startswith(prefixo):
+                break
+            resultado.append(palavra)
+        return resultado
+
+    def __contains__(self, palavra):
+        indice = bisect_left(self._palavras, palavra)
+        return indice < len(self._palavras) and self._palavras[indice] == palavra
+
+    def __len__(self):
+        return len(self._palavras)
+
+
+class Completador:
+    """
+    Completer do readline: a primeira palavra de cada comando (início da
+    linha ou depois de |, ;, &&) completa nomes de comando; as demais
+    completam caminhos do VFS relativos ao diretório atual.
+    """
+
+    def __init__(self, vfs, cwd, comandos=()):
+        self.vfs = vfs
+        self._cwd = cwd
+        self.comandos = IndicePrefixos(comandos)
+        self._resultados = []
+
+    # ========== CANDIDATOS ==========
+    def candidatos(self, linha, inicio, texto):
+        """Completações de `texto`, que começa na posição `inicio` de `linha`"""
+        antes = linha[:inicio]
+        segmento = antes
+        for separador in '|;&':
+            segmento = segmento.rpartition(separador)[2]
+        if not segmento.strip():
+            return self.comandos.com_prefixo(texto)
+        return self.caminhos(texto)
+
+    def caminhos(self, texto):
+        """Completa um caminho do VFS (diretórios terminam com '/')"""
+        diretorio, barra, prefixo = texto.rpartition('/')
+        base = diretorio + barra
+        if texto == '~':
+            return ['~/']
+
+        pasta = self.vfs.buscar(base or '.', self._cwd())
+        if pasta is None or not pasta.eh_diretorio:
+            return []
+
+        resultado = []
+        for nome in self.vfs.com_prefixo(pasta, prefixo):
+            # Arquivos ocultos só aparecem quando o prefixo começa com '.'
+            if nome.startswith('.') and not prefixo.startswith('.'):
+                continue
+            sufixo = '/' if pasta.filhos[nome].eh_diretorio else ''
+            resultado.append(f"{base}{nome}{sufixo}")
+        return resultado
+
+    # ========== READLINE ==========
+    def completar(self, texto, estado):
+        """Função no formato do readline.set_completer"""
+        if estado == 0:
+            try:
+                import readline
+                linha = readline.get_line_buffer()
+                inicio = readline.get_begidx()
+            except (ImportError, AttributeError):
+                linha, inicio = texto, 0
+            self._resultados = self.candidatos(linha, inicio, texto)
+        return self._resultados[estado] if estado < len(self._resultados) else None
+
+    def instalar(self):
+        """Registra este completer no readline (se disponível)"""
+        try:
+            import readline
+        except ImportError:
+            return False
+        readline.set_completer(self.completar)
+        readline.set_completer_delims(DELIMITADORES)
+        # O readline do macOS (libedit) usa outra sintaxe de bind
+        if 'libedit' in (readline.__doc__ or ''):
+            readline.parse_and_bind('bind ^I rl_complete')
+        else:
+            readline.parse_and_bind('tab: complete')
+        return True
+
+
+__all__ = ['Completador', 'IndicePrefixos', 'DELIMITADORES']
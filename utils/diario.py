@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+DIARIO.PY - Diário de eventos do estado do jogo (RoOt 3voluti0n)
+Cada save ganha um diário (<save>.diario, uma linha JSON por evento):
+sucesso, falha, compra, capítulo concluído... Registrar um evento é um
+append de uma linha; o save completo (snapshot) só é regravado na
+compactação. Ao carregar, os eventos posteriores ao snapshot são
+reaplicados, então uma queda no meio do capítulo não perde progresso.
+
+Os eventos compactados vão para <save>.historico.gz, que guarda a
+história completa do jogador para consultas e estatísticas. Eventos com
+seq já arquivada não são gravados de novo, então repetir uma compactação
+interrompida (queda entre o histórico e o diário) não duplica nada.
+"""
+
+import os
+import gzip
+import json
+import threading
+from datetime import datetime
+
+# Campo do snapshot com o último evento já incorporado
+CAMPO_SEQUENCIA = 'journal_seq'
+
+
+def aplicar_eventos(estado, eventos, desde=0):
+    """Aplica ao estado os campos definidos pelos eventos com seq > desde"""
+    for evento in eventos:
+        if evento['seq'] <= desde:
+            continue
+        for campo, valor in evento.get('definir', {}).items():
+            estado[campo] = valor
+        estado[CAMPO_SEQUENCIA] = evento['seq']
+    return estado
+
+
+class Diario:
+    """
+    Diário de um save.
+
+    Os eventos guardam os valores resultantes (`definir`), não deltas:
+    reaplicar é idempotente e limites (privacidade 0-100) não precisam
+    ser recalculados. Campos extras (bônus, item, custo) ficam no evento
+    para o histórico.
+    """
+
+    LIMITE_EVENTOS = 50
+
+    def __init__(self, arquivo_save, servico=None):
+        self.arquivo_save = arquivo_save
+        self.caminho = arquivo_save + '.diario'
+        self.caminho_historico = arquivo_save + '.historico.gz'
+        self._servico = servico
+        self._seq = None
+        self._pendentes = 0
+        self._arquivado = None
+        self._trava = threading.Lock()
+
+    @property
+    def servico(self):
+        if self._servico is None:
+            from utils.saves import servico_saves
+            self._servico = servico_saves
+        return self._servico
+
+    # ========== LEITURA ==========
+    def eventos(self):
+        """Eventos do diário atual (a primeira linha marca o último snapshot)"""
+        try:
+            with open(self.caminho, 'r', encoding='utf-8') as f:
+                for linha in f:
+                    try:
+                        yield json.loads(linha)
+                    except ValueError:
+                        # Linha cortada por uma queda durante o append
+                        break
+        except OSError:
+            return
+
+    def _abrir(self):
+        if self._seq is None:
+            self._seq = 0
+            self._pendentes = 0
+            for evento in self.eventos():
+                self._seq = max(self._seq, evento['seq'])
+                if evento['tipo'] != 'snapshot':
+                    self._pendentes += 1
+
+    @property
+    def pendentes(self):
+        """Eventos registrados desde o último snapshot"""
+        self._abrir()
+        return self._pendentes
+
+    def _arquivados(self):
+        """Eventos do histórico compactado"""
+        try:
+            fonte = gzip.open(self.caminho_historico, 'rt', encoding='utf-8')
+        except OSError:
+            return
+        with fonte:
+            try:
+                for linha in fonte:
+                    yield json.loads(linha)
+            except (OSError, EOFError, ValueError):
+                pass
+    
+    def _ultimo_arquivado(self):
+        """Maior seq já gravada no histórico (lida do arquivo uma vez, depois mantida)"""
+        if self._arquivado is None:
+            self._arquivado = max((evento['seq'] for evento in self._arquivados()), default=0)
+        return self._arquivado
+    
+    def historico(self, tipo=None):
+        """Todos os eventos do jogador (compactados + atuais), em ordem"""
+        ultimo = 0
+        for evento in self._arquivados():
+            ultimo = max(ultimo, evento['seq'])
+            if tipo is None or evento['tipo'] == tipo:
+                yield evento
+        for evento in self.eventos():
+            # Já arquivado por uma compactação que caiu antes de reiniciar o diário
+            if evento['tipo'] == 'snapshot' or evento['seq'] <= ultimo:
+                continue
+            if tipo is None or evento['tipo'] == tipo:
+                yield evento
+
+    # ========== ESCRITA ==========
+    def registrar(self, tipo, definir=None, **info):
+        """Acrescenta um evento ao diário (um append de uma linha)"""
+        with self._trava:
+            self._abrir()
+            self._seq += 1
+            evento = {'seq': self._seq, 'tipo': tipo, 'quando': datetime.now().isoformat()}
+            if definir:
+                evento['definir'] = definir
+            evento.update(info)
+            diretorio = os.path.dirname(self.caminho)
+            if diretorio:
+                os.makedirs(diretorio, exist_ok=True)
+            with open(self.caminho, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(evento, ensure_ascii=False, separators=(',', ':')) + '\n')
+            self._pendentes += 1
+            return evento
+
+    @property
+    def precisa_compactar(self):
+        return self.pendentes >= self.LIMITE_EVENTOS
+
+    def recuperar(self, dados):
+        """Reaplica sobre o snapshot os eventos que ainda não estão nele"""
+        with self._trava:
+            self._abrir()
+            # Diário apagado/perdido: a numeração continua depois do snapshot
+            self._seq = max(self._seq, dados.get(CAMPO_SEQUENCIA, 0))
+        return aplicar_eventos(dados, self.eventos(), dados.get(CAMPO_SEQUENCIA, 0))
+
+    @property
+    def seq(self):
+        """Número do último evento registrado"""
+        with self._trava:
+            self._abrir()
+            return self._seq
+
+    def compactar(self, estado, ate=None):
+        """
+        Grava `estado` como snapshot (pelo serviço de saves), move os
+        eventos incorporados para o histórico e reinicia o diário.
+        `ate` é o último evento refletido em `estado` (padrão: todos);
+        eventos posteriores, de um snapshot capturado antes, continuam
+        no diário.
+        """
+        with self._trava:
+            self._abrir()
+            self._seq = max(self._seq, estado.get(CAMPO_SEQUENCIA, 0))
+            ate = self._seq if ate is None else ate
+            estado[CAMPO_SEQUENCIA] = ate
+            self.servico.salvar(self.arquivo_save, estado)
+
+            eventos = [evento for evento in self.eventos() if evento['tipo'] != 'snapshot']
+            incorporados = [evento for evento in eventos if evento['seq'] <= ate]
+            restantes = [evento for evento in eventos if evento['seq'] > ate]
+            if not incorporados:
+                # Nada a mover: o diário já reflete o snapshot
+                self._pendentes = len(restantes)
+                return
+            # Repetição de uma compactação interrompida: o que já está no histórico fica de fora
+            novos = [evento for evento in incorporados if evento['seq'] > self._ultimo_arquivado()]
+            if novos:
+                with gzip.open(self.caminho_historico, 'at', encoding='utf-8') as f:
+                    for evento in novos:
+                        f.write(json.dumps(evento, ensure_ascii=False, separators=(',', ':')) + '\n')
+                self._arquivado = novos[-1]['seq']
+
+            # O diário recomeça com o marcador do snapshot (e o que veio depois dele)
+            temporario = self.caminho + '.tmp'
+            with open(temporario, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'seq': ate, 'tipo': 'snapshot'}) + '\n')
+                for evento in restantes:
+                    f.write(json.dumps(evento, ensure_ascii=False, separators=(',', ':')) + '\n')
+            os.replace(temporario, self.caminho)
+            self._pendentes = len(restantes)
+
+
+_diarios = {}
+_trava_diarios = threading.Lock()
+
+
+def diario_de(arquivo_save):
+    """Diário compartilhado de um save (um por arquivo no processo, mesmo entre threads)"""
+    chave = os.path.abspath(arquivo_save)
+    with _trava_diarios:
+        diario = _diarios.get(chave)
+        if diario is None:
+            diario = _diarios[chave] = Diario(arquivo_save)
+        return diario
+
+
+__all__ = ['Diario', 'diario_de', 'aplicar_eventos', 'CAMPO_SEQUENCIA']
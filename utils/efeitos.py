@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+EFEITOS.PY - Efeitos visuais compostos para RoOt 3voluti0n
+Os efeitos desenham num buffer fora da tela e enviam ao terminal apenas
+as células que mudaram, em uma única escrita por quadro.
+"""
+
+import sys
+import random
+from array import array
+
+from utils.relogio import agora, dormir
+from utils.capacidades import interativo
+
+VERDE = '\033[92m'
+RESET = '\033[0m'
+ESCONDER_CURSOR = '\033[?25l'
+MOSTRAR_CURSOR = '\033[?25h'
+
+
+def _bytes_aleatorios(n):
+    """n bytes aleatórios com uma única chamada ao gerador"""
+    if n <= 0:
+        return b''
+    return random.getrandbits(8 * n).to_bytes(n, 'little')
+
+
+# ========== GLITCH ==========
+class TabelasGlitch:
+    """
+    Anel de quadros de ruído pré-calculados para os efeitos de glitch.
+
+    Em vez de sortear um caractere por célula a cada quadro, as tabelas são
+    geradas uma vez para a largura atual e percorridas em ciclo. Só são
+    refeitas quando a largura muda (terminal redimensionado).
+    """
+
+    def __init__(self, caracteres, tamanho_anel=32):
+        self.caracteres = caracteres
+        self.tamanho_anel = tamanho_anel
+        self._largura = 0
+        self._anel = []
+        self._mascaras = []
+        self._indice = 0
+
+    def _preparar(self, largura):
+        if largura == self._largura:
+            return
+        self._anel = [''.join(random.choices(self.caracteres, k=largura))
+                      for _ in range(self.tamanho_anel)]
+        self._mascaras = [_bytes_aleatorios(largura) for _ in range(self.tamanho_anel)]
+        self._largura = largura
+        self._indice = 0
+
+    def _proximo(self):
+        self._indice = (self._indice + 1) % self.tamanho_anel
+        return self._anel[self._indice], self._mascaras[self._indice]
+
+    def ruido(self, largura):
+        """Próxima linha de ruído com `largura` caracteres"""
+        self._preparar(largura)
+        return self._proximo()[0]
+
+    def misturar(self, texto, intensidade=0.7):
+        """Troca ~`intensidade` dos caracteres de `texto` por ruído"""
+        # Textos mais largos que as tabelas forçam uma reconstrução (raro)
+        self._preparar(max(self._largura, len(texto)))
+        ruido, mascara = self._proximo()
+        limiar = int(256 * (1 - intensidade))
+        return ''.join(r if m >= limiar else c for c, r, m in zip(texto, ruido, mascara))
+
+
+# ========== CHUVA MATRIX ==========
+class ChuvaMatrix:
+    """
+    Compositor da chuva de caracteres estilo Matrix.
+
+    Cada coluna (uma a cada duas células) guarda só a linha da sua "gota"
+    num array compacto. A cada passo as mudanças vão para um buffer de tela
+    (um byte por célula) e viram um único fluxo de escape, pulando células
+    inalteradas e evitando movimentos de cursor quando a lacuna é pequena.
+    """
+
+    # Lacunas até este tamanho são preenchidas com o conteúdo atual da tela,
+    # que é mais curto que uma sequência de posicionamento do cursor
+    LACUNA_MAXIMA = 4
+
+    def __init__(self, largura, altura, fps=10, caracteres="01█▓▒░",
+                 cor=VERDE, reset=RESET, chance_nascer=0.05, chance_parar=0.1):
+        self.largura = max(2, largura)
+        self.altura = max(1, altura)
+        self.fps = fps
+        self.cor = cor
+        self.reset = reset
+
+        # Índice 0 do glifo = célula vazia
+        self._glifos = ' ' + caracteres
+        self._colunas = self.largura // 2
+        self._cabecas = array('H', bytes(2 * self._colunas))
+        self._tela = bytearray(self.largura * self.altura)
+
+        # Probabilidades convertidas para limiares de um byte aleatório
+        self._limiar_nascer = int(256 * (1 - chance_nascer))
+        self._limiar_parar = int(256 * (1 - chance_parar))
+
+    def passo(self):
+        """Avança um quadro e retorna o fluxo de escape mínimo ('' se nada mudou)"""
+        n = self._colunas
+        nascer = _bytes_aleatorios(n)
+        parar = _bytes_aleatorios(n)
+        escolha = _bytes_aleatorios(n)
+
+        cabecas = self._cabecas
+        largura = self.largura
+        total_glifos = len(self._glifos) - 1
+        mudancas = {}
+
+        for i in range(n):
+            linha = cabecas[i]
+            if linha == 0 and nascer[i] < self._limiar_nascer:
+                continue
+            if linha >= self.altura or parar[i] >= self._limiar_parar:
+                cabecas[i] = 0
+                continue
+
+            linha += 1
+            cabecas[i] = linha
+            coluna = i * 2
+            if linha > 1:
+                mudancas[(linha - 2) * largura + coluna] = 0
+            mudancas[(linha - 1) * largura + coluna] = 1 + escolha[i] % total_glifos
+
+        return self._compor(mudancas)
+
+    def _compor(self, mudancas):
+        """Transforma as células alteradas em uma única string de escape"""
+        tela = self._tela
+        largura = self.largura
+        glifos = self._glifos
+        partes = []
+        cursor = -1  # posição linear onde o cursor do terminal está
+
+        for pos in sorted(mudancas):
+            glifo = mudancas[pos]
+            if tela[pos] == glifo:
+                continue
+
+            if pos != cursor:
+                lacuna = pos - cursor
+                if 0 < lacuna <= self.LACUNA_MAXIMA and cursor // largura == pos // largura:
+                    partes.append(''.join(glifos[tela[p]] for p in range(cursor, pos)))
+                else:
+                    partes.append(f"\033[{pos // largura + 1};{pos % largura + 1}H")
+
+            partes.append(glifos[glifo])
+            tela[pos] = glifo
+            cursor = pos + 1
+
+        if not partes:
+            return ''
+        return self.cor + ''.join(partes) + self.reset
+
+    def executar(self, duracao, deve_parar=None, saida=None):
+        """
+        Roda a animação por `duracao` segundos (uma escrita por quadro).
+        Retorna True se `deve_parar()` interrompeu a animação.
+        """
+        saida = saida if saida is not None else sys.stdout
+        if not interativo(saida):
+            # Animação posicionada não faz sentido fora de um terminal
+            return False
+
+        intervalo = 1.0 / self.fps
+        inicio = agora()
+
+        saida.write(ESCONDER_CURSOR)
+        try:
+            while agora() - inicio < duracao:
+                if deve_parar is not None and deve_parar():
+                    return True
+                quadro = self.passo()
+                if quadro:
+                    saida.write(quadro)
+                saida.flush()
+                dormir(intervalo)
+        finally:
+            saida.write(MOSTRAR_CURSOR)
+            saida.flush()
+        return False
+
+
+__all__ = ['ChuvaMatrix', 'TabelasGlitch']
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+FORMATO_SAVE.PY - Formato binário versionado dos saves (RoOt 3voluti0n)
+Um save .r3v é um contêiner com seções independentes:
+
+    MAGICO 'R3VS' | versão (u16) | tamanho do cabeçalho (u32) | tamanho da tabela (u32)
+    cabeçalho     JSON com os campos do menu (jogador, codinome, capítulo...)
+    tabela        JSON: por seção, nome, campos, codificação, tamanhos e crc32
+    seções        conteúdo de cada seção, na ordem da tabela
+
+O menu lê só o cabeçalho (`ler_cabecalho`). `decodificar` devolve um
+SaveBinario, que se comporta como o dicionário do jogador mas só
+descomprime uma seção quando algum campo dela é usado; seções que o
+capítulo não tocou voltam para o disco com os mesmos bytes.
+"""
+
+import json
+import zlib
+import struct
+from collections.abc import MutableMapping
+
+MAGICO = b'R3VS'
+VERSAO = 1
+EXTENSAO = '.r3v'
+
+_FIXO = struct.Struct('>4sHII')
+
+# Campos guardados no cabeçalho (sem compressão, lidos pelo menu)
+CAMPOS_CABECALHO = ('player_name', 'codiname', 'current_chapter', 'last_seen', 'bitcoin_wallet')
+
+# Campo -> seção; os demais vão para 'estado'
+SECOES = {
+    'inventory': 'inventario',
+    'completed_chapters': 'progresso',
+    'historico': 'historico',
+    'vfs': 'vfs',
+}
+SECAO_PADRAO = 'estado'
+
+# Codificações de seção
+CRU = 'json'
+ZLIB = 'json+zlib'
+
+# Seções menores que isso não compensam a compressão
+COMPRIMIR_A_PARTIR = 256
+
+
+class FormatoInvalido(ValueError):
+    """Arquivo que não é um save .r3v (ou de uma versão mais nova)"""
+
+
+def secao_do_campo(campo):
+    return SECOES.get(campo, SECAO_PADRAO)
+
+
+def _json(valor):
+    return json.dumps(valor, ensure_ascii=False, separators=(',', ':'), sort_keys=True).encode('utf-8')
+
+
+# ========== SEÇÕES ==========
+class Secao:
+    """
+    Uma seção do save. Criada a partir dos valores (`de_valores`, ainda
+    não comprimida) ou lida do arquivo (`conteudo` já codificado). Duas
+    seções são iguais quando o JSON original é o mesmo (crc + tamanho).
+    """
+
+    __slots__ = ('nome', 'campos', 'crc', 'tamanho_original', '_cru', '_codificacao', '_conteudo')
+
+    def __init__(self, nome, campos, crc, tamanho_original, cru=None, codificacao=None, conteudo=None):
+        self.nome = nome
+        self.campos = list(campos)
+        self.crc = crc
+        self.tamanho_original = tamanho_original
+        self._cru = cru
+        self._codificacao = codificacao
+        self._conteudo = conteudo
+
+    @classmethod
+    def de_valores(cls, nome, valores):
+        cru = _json(valores)
+        return cls(nome, sorted(valores), zlib.crc32(cru), len(cru), cru=cru)
+
+    def codificada(self):
+        """(codificação, bytes) para o arquivo; comprime só na primeira vez"""
+        if self._conteudo is None:
+            comprimido = zlib.compress(self._cru, 6) if len(self._cru) >= COMPRIMIR_A_PARTIR else None
+            if comprimido is not None and len(comprimido) < len(self._cru):
+                self._codificacao, self._conteudo = ZLIB, comprimido
+            else:
+                self._codificacao, self._conteudo = CRU, self._cru
+        return self._codificacao, self._conteudo
+
+    def valores(self):
+        """Decodifica a seção (confere o crc32)"""
+        if self._cru is None:
+            if self._codificacao == ZLIB:
+                self._cru = zlib.decompress(self._conteudo)
+            elif self._codificacao == CRU:
+                self._cru = self._conteudo
+            else:
+                raise FormatoInvalido(f"seção {self.nome}: codificação desconhecida {self._codificacao!r}")
+            if zlib.crc32(self._cru) != self.crc:
+                raise FormatoInvalido(f"seção {self.nome}: crc32 não confere")
+        return json.loads(self._cru.decode('utf-8'))
+
+    def __eq__(self, outra):
+        if not isinstance(outra, Secao):
+            return NotImplemented
+        return (self.nome, self.crc, self.tamanho_original) == (outra.nome, outra.crc, outra.tamanho_original)
+
+    def __hash__(self):
+        return hash((self.nome, self.crc, self.tamanho_original))
+
+    def __repr__(self):
+        return f"Secao({self.nome!r}, {self.tamanho_original} bytes)"
+
+
+# ========== SAVE COM DECODIFICAÇÃO SOB DEMANDA ==========
+class SaveBinario(MutableMapping):
+    """
+    Dados do jogador vindos de um .r3v. Campos do cabeçalho estão sempre
+    disponíveis; os das seções são decodificados no primeiro acesso
+    (por seção inteira). `secoes()` devolve as seções para regravar.
+    """
+
+    def __init__(self, cabecalho, secoes=()):
+        self.cabecalho = dict(cabecalho)
+        self._secoes = {secao.nome: secao for secao in secoes}
+        self._decodificadas = {}
+        self._onde = {campo: secao.nome for secao in self._secoes.values() for campo in secao.campos}
+
+    def _valores(self, nome):
+        valores = self._decodificadas.get(nome)
+        if valores is None:
+            secao = self._secoes.get(nome)
+            valores = self._decodificadas[nome] = secao.valores() if secao else {}
+        return valores
+
+    @property
+    def decodificadas(self):
+        """Nomes das seções já decodificadas"""
+        return set(self._decodificadas)
+
+    def __getitem__(self, campo):
+        if campo in self.cabecalho:
+            return self.cabecalho[campo]
+        return self._valores(self._onde[campo])[campo]
+
+    def __setitem__(self, campo, valor):
+        if campo in CAMPOS_CABECALHO:
+            self.cabecalho[campo] = valor
+            return
+        nome = self._onde.get(campo) or secao_do_campo(campo)
+        self._valores(nome)[campo] = valor
+        self._onde[campo] = nome
+
+    def __delitem__(self, campo):
+        if campo in self.cabecalho:
+            del self.cabecalho[campo]
+            return
+        del self._valores(self._onde[campo])[campo]
+        del self._onde[campo]
+
+    def __contains__(self, campo):
+        return campo in self.cabecalho or campo in self._onde
+
+    def __iter__(self):
+        yield from self.cabecalho
+        yield from self._onde
+
+    def __len__(self):
+        return len(self.cabecalho) + len(self._onde)
+
+    def secoes(self):
+        """Seções atuais: as não decodificadas voltam como foram lidas"""
+        resultado = []
+        for nome in sorted(set(self._secoes) | set(self._decodificadas)):
+            if nome in self._decodificadas:
+                if self._decodificadas[nome]:
+                    resultado.append(Secao.de_valores(nome, self._decodificadas[nome]))
+            else:
+                resultado.append(self._secoes[nome])
+        return resultado
+
+    def __repr__(self):
+        return f"SaveBinario({self.cabecalho!r}, secoes={sorted(set(self._secoes) | set(self._decodificadas))})"
+
+
+def separar(dados):
+    """(cabeçalho, seções) de um dicionário do jogador ou SaveBinario"""
+    if isinstance(dados, SaveBinario):
+        return dict(dados.cabecalho), dados.secoes()
+    cabecalho = {}
+    grupos = {}
+    for campo, valor in dados.items():
+        if campo in CAMPOS_CABECALHO:
+            cabecalho[campo] = valor
+        else:
+            grupos.setdefault(secao_do_campo(campo), {})[campo] = valor
+    return cabecalho, [Secao.de_valores(nome, valores) for nome, valores in sorted(grupos.items())]
+
+
+# ========== CODIFICAÇÃO ==========
+def codificar(cabecalho, secoes):
+    """Monta o arquivo .r3v"""
+    tabela = []
+    corpos = []
+    for secao in secoes:
+        codificacao, conteudo = secao.codificada()
+        tabela.append({
+            'nome': secao.nome,
+            'campos': secao.campos,
+            'codificacao': codificacao,
+            'tamanho': len(conteudo),
+            'original': secao.tamanho_original,
+            'crc': secao.crc,
+        })
+        corpos.append(conteudo)
+    bytes_cabecalho = _json(cabecalho)
+    bytes_tabela = _json(tabela)
+    return b''.join([_FIXO.pack(MAGICO, VERSAO, len(bytes_cabecalho), len(bytes_tabela)),
+                     bytes_cabecalho, bytes_tabela] + corpos)
+
+
+def _fixo(dados):
+    if len(dados) < _FIXO.size:
+        raise FormatoInvalido("arquivo truncado")
+    magico, versao, tamanho_cabecalho, tamanho_tabela = _FIXO.unpack_from(dados)
+    if magico != MAGICO:
+        raise FormatoInvalido("não é um save .r3v")
+    if versao > VERSAO:
+        raise FormatoInvalido(f"save na versão {versao}; este jogo lê até a {VERSAO}")
+    return tamanho_cabecalho, tamanho_tabela
+
+
+def decodificar(dados):
+    """Lê o cabeçalho e a tabela; as seções ficam para quando forem usadas"""
+    tamanho_cabecalho, tamanho_tabela = _fixo(dados)
+    posicao = _FIXO.size
+    try:
+        cabecalho = json.loads(dados[posicao:posicao + tamanho_cabecalho].decode('utf-8'))
+        posicao += tamanho_cabecalho
+        tabela = json.loads(dados[posicao:posicao + tamanho_tabela].decode('utf-8'))
+        posicao += tamanho_tabela
+    except ValueError as e:
+        raise FormatoInvalido(f"cabeçalho corrompido: {e}") from e
+
+    secoes = []
+    for entrada in tabela:
+        conteudo = dados[posicao:posicao + entrada['tamanho']]
+        if len(conteudo) != entrada['tamanho']:
+            raise FormatoInvalido(f"seção {entrada['nome']} truncada")
+        posicao += entrada['tamanho']
+        secoes.append(Secao(entrada['nome'], entrada['campos'], entrada['crc'], entrada['original'],
+                            codificacao=entrada['codificacao'], conteudo=conteudo))
+    return SaveBinario(cabecalho, secoes)
+
+
+def ler_cabecalho(caminho):
+    """Só o cabeçalho de um .r3v (para o menu), sem ler as seções"""
+    with open(caminho, 'rb') as f:
+        fixo = f.read(_FIXO.size)
+        tamanho_cabecalho, _ = _fixo(fixo)
+        bruto = f.read(tamanho_cabecalho)
+    if len(bruto) != tamanho_cabecalho:
+        raise FormatoInvalido("cabeçalho truncado")
+    return json.loads(bruto.decode('utf-8'))
+
+
+__all__ = ['SaveBinario', 'Secao', 'FormatoInvalido', 'codificar', 'decodificar', 'separar',
+           'ler_cabecalho', 'CAMPOS_CABECALHO', 'SECOES', 'EXTENSAO', 'VERSAO']
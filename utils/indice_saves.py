@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+INDICE_SAVES.PY - Índice dos jogos salvos do RoOt 3voluti0n
+Mantém em saves/.indice.json um resumo de cada save (jogador, codinome,
+capítulo, data, bitcoin), validado pelo mtime/tamanho do arquivo. Listar
+os saves passa a custar um stat por arquivo; o JSON do save só é lido
+quando o arquivo mudou por fora (capítulos, mercado) ou é novo.
+
+O índice também guarda o último acesso de cada save, para que carregar
+um jogo não precise regravar o save só para atualizar 'last_seen'.
+"""
+
+import os
+import json
+import threading
+from collections.abc import Mapping
+from datetime import datetime
+
+
+class IndiceSaves:
+    """
+    Resumos dos saves de uma pasta.
+
+    `atualizar(arquivo, dados)` é chamado por quem acabou de gravar o save;
+    `registrar_acesso(arquivo, dados)` anota só o último acesso;
+    `listar()` confere o índice contra o disco e devolve os resumos
+    ordenados (e paginados, se pedido). Seguro entre threads (o autosave
+    atualiza o índice enquanto o menu lista ou registra acessos).
+    """
+
+    ARQUIVO = '.indice.json'
+    VERSAO = 1
+
+    def __init__(self, pasta="saves", extensao='.json', ler_resumo=None):
+        self.pasta = pasta
+        self.extensao = extensao
+        # Leitura dos campos do resumo (padrão: o JSON inteiro do save)
+        self._ler_resumo = ler_resumo or self._ler_json
+        self._entradas = None
+        self._trava = threading.RLock()
+
+    @property
+    def caminho(self):
+        return os.path.join(self.pasta, self.ARQUIVO)
+
+    # ========== PERSISTÊNCIA DO ÍNDICE ==========
+    def _carregar(self):
+        if self._entradas is None:
+            try:
+                with open(self.caminho, 'r', encoding='utf-8') as f:
+                    conteudo = json.load(f)
+                if conteudo.get('versao') != self.VERSAO:
+                    raise ValueError("versão do índice")
+                self._entradas = conteudo['saves']
+            except (OSError, ValueError, KeyError, AttributeError):
+                # Índice ausente ou corrompido: reconstruído na próxima listagem
+                self._entradas = {}
+        return self._entradas
+
+    def _persistir(self):
+        os.makedirs(self.pasta, exist_ok=True)
+        temporario = self.caminho + '.tmp'
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump({'versao': self.VERSAO, 'saves': self._entradas}, f,
+                      ensure_ascii=False, separators=(',', ':'))
+        os.replace(temporario, self.caminho)
+
+    # ========== RESUMOS ==========
+    @staticmethod
+    def _ler_json(caminho):
+        with open(caminho, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _resumo(dados, mtime):
+        """Campos exibidos no menu de carregar, ou None se não for um save válido"""
+        if not isinstance(dados, Mapping) or 'player_name' not in dados or 'codiname' not in dados:
+            return None
+        return {
+            'nome_jogador': dados['player_name'],
+            'codinome': dados['codiname'],
+            'capitulo': dados.get('current_chapter', 1),
+            'data': dados.get('last_seen') or datetime.fromtimestamp(mtime).isoformat(),
+            'bitcoin': dados.get('bitcoin_wallet', 0),
+        }
+
+    @staticmethod
+    def _assinatura(stat):
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def atualizar(self, arquivo, dados):
+        """Registra o resumo de um save recém-gravado"""
+        with self._trava:
+            try:
+                stat = os.stat(arquivo)
+            except OSError:
+                return
+            entradas = self._carregar()
+            nome = os.path.basename(arquivo)
+            resumo = self._resumo(dados, stat.st_mtime)
+            if resumo is None:
+                entradas.pop(nome, None)
+            else:
+                acesso = dados.get('last_seen') or entradas.get(nome, {}).get('acesso')
+                entradas[nome] = {'assinatura': self._assinatura(stat), 'resumo': resumo, 'acesso': acesso}
+            self._persistir()
+
+    def registrar_acesso(self, arquivo, dados, quando=None):
+        """Anota o último acesso ao save (dados['last_seen']) sem tocar no arquivo do save"""
+        with self._trava:
+            quando = quando or dados.get('last_seen')
+            entradas = self._carregar()
+            nome = os.path.basename(arquivo)
+            entrada = entradas.get(nome)
+            if entrada is None or entrada.get('resumo') is None:
+                self.atualizar(arquivo, dados)
+                entrada = entradas.get(nome)
+                if entrada is None:
+                    return
+            entrada['acesso'] = quando
+            self._persistir()
+
+    def ultimo_acesso(self, arquivo):
+        """Último acesso registrado (ou None)"""
+        entrada = self._carregar().get(os.path.basename(arquivo))
+        return entrada.get('acesso') if entrada else None
+
+    def remover(self, arquivo):
+        """Tira um save do índice"""
+        with self._trava:
+            if self._carregar().pop(os.path.basename(arquivo), None) is not None:
+                self._persistir()
+
+    # ========== LISTAGEM ==========
+    def listar(self, ordenar_por='data', decrescente=True, pagina=0, por_pagina=None):
+        """
+        Resumos dos saves (com 'arquivo'), ordenados por `ordenar_por`.
+        Com `por_pagina`, devolve só a página `pagina` (começando em 0).
+        """
+        with self._trava:
+            entradas = self._carregar()
+            alterado = False
+            vistos = set()
+
+            try:
+                arquivos = list(os.scandir(self.pasta))
+            except OSError:
+                arquivos = []
+
+            for arquivo in arquivos:
+                if not arquivo.name.endswith(self.extensao) or arquivo.name.startswith('.'):
+                    continue
+                vistos.add(arquivo.name)
+                try:
+                    stat = arquivo.stat()
+                except OSError:
+                    continue
+                entrada = entradas.get(arquivo.name)
+                if entrada is not None and entrada['assinatura'] == self._assinatura(stat):
+                    continue
+
+                # Novo ou modificado por fora: só então o save é lido
+                try:
+                    resumo = self._resumo(self._ler_resumo(arquivo.path), stat.st_mtime)
+                except (OSError, ValueError):
+                    resumo = None
+                acesso = entrada.get('acesso') if entrada is not None else None
+                entradas[arquivo.name] = {'assinatura': self._assinatura(stat), 'resumo': resumo, 'acesso': acesso}
+                alterado = True
+
+            for nome in [nome for nome in entradas if nome not in vistos]:
+                del entradas[nome]
+                alterado = True
+
+            if alterado:
+                try:
+                    self._persistir()
+                except OSError:
+                    pass
+
+            saves = [
+                dict(entrada['resumo'], arquivo=os.path.join(self.pasta, nome),
+                     data=entrada.get('acesso') or entrada['resumo']['data'])
+                for nome, entrada in entradas.items()
+                if entrada['resumo'] is not None
+            ]
+            saves.sort(key=lambda save: save[ordenar_por], reverse=decrescente)
+            if por_pagina is not None:
+                saves = saves[pagina * por_pagina:(pagina + 1) * por_pagina]
+            return saves
+
+
+__all__ = ['IndiceSaves']
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+LAYOUT.PY - Motor de layout para os menus centralizados do RoOt 3voluti0n
+Mede a largura visível do texto (sem códigos ANSI, considerando caracteres
+largos) e guarda os quadros de menu já montados por tamanho de terminal.
+O cache é invalidado pelo SIGWINCH, em vez de o tamanho ser lido uma única
+vez na criação do menu.
+"""
+
+import re
+import shutil
+import signal
+import threading
+import unicodedata
+from functools import lru_cache
+
+_ANSI = re.compile(r'\x1b\[[0-?]*[ -/]*[@-~]')
+
+TAMANHO_PADRAO = (100, 30)
+
+
+@lru_cache(maxsize=4096)
+def largura_exibicao(texto):
+    """Quantidade de colunas que `texto` ocupa no terminal"""
+    visivel = _ANSI.sub('', texto)
+    if visivel.isascii():
+        return len(visivel)
+
+    largura = 0
+    for caractere in visivel:
+        if unicodedata.combining(caractere):
+            continue
+        largura += 2 if unicodedata.east_asian_width(caractere) in ('W', 'F') else 1
+    return largura
+
+
+class Layout:
+    """
+    Tamanho do terminal e cache de quadros renderizados.
+
+    `quadro(chave, construir)` só chama `construir()` quando a combinação
+    (chave, tamanho do terminal) ainda não foi vista; depois disso o menu
+    é só uma consulta ao dicionário.
+    """
+
+    LIMITE_QUADROS = 64
+
+    def __init__(self):
+        self._tamanho = None
+        self._quadros = {}
+        self._ouvintes = []
+        self._observando = False
+
+    # ========== TAMANHO DO TERMINAL ==========
+    def observar(self):
+        """Instala o tratador de SIGWINCH (só na thread principal, onde existir)"""
+        if self._observando or not hasattr(signal, 'SIGWINCH'):
+            return self._observando
+        if threading.current_thread() is not threading.main_thread():
+            return False
+
+        anterior = signal.getsignal(signal.SIGWINCH)
+
+        def _ao_redimensionar(signum, frame):
+            self.invalidar()
+            if callable(anterior):
+                anterior(signum, frame)
+
+        try:
+            signal.signal(signal.SIGWINCH, _ao_redimensionar)
+        except (ValueError, OSError):
+            return False
+        self._observando = True
+        return True
+
+    @property
+    def tamanho(self):
+        """(colunas, linhas) atuais"""
+        # Sem SIGWINCH não há aviso de redimensionamento: lê sempre
+        if self._tamanho is None or not self._observando:
+            try:
+                tamanho = shutil.get_terminal_size(TAMANHO_PADRAO)
+                novo = (tamanho.columns, tamanho.lines)
+            except Exception:
+                novo = TAMANHO_PADRAO
+            if novo != self._tamanho and self._tamanho is not None:
+                self._quadros.clear()
+            self._tamanho = novo
+        return self._tamanho
+
+    @property
+    def colunas(self):
+        return self.tamanho[0]
+
+    @property
+    def linhas(self):
+        return self.tamanho[1]
+
+    def ao_redimensionar(self, callback):
+        """Registra `callback()` para ser chamado quando o terminal mudar de tamanho"""
+        if callback not in self._ouvintes:
+            self._ouvintes.append(callback)
+
+    def invalidar(self):
+        """Esquece o tamanho medido e todos os quadros em cache"""
+        self._tamanho = None
+        self._quadros.clear()
+        for callback in self._ouvintes:
+            callback()
+
+    # ========== ALINHAMENTO ==========
+    def margem(self, largura_bloco):
+        """Espaços à esquerda para centralizar um bloco de `largura_bloco` colunas"""
+        return ' ' * max(0, (self.colunas - largura_bloco) // 2)
+
+    def centralizar(self, texto):
+        """Centraliza uma linha pela largura visível"""
+        return self.margem(largura_exibicao(texto)) + texto
+
+    def centralizar_bloco(self, linhas):
+        """Centraliza um bloco mantendo o alinhamento à esquerda entre as linhas"""
+        largura = max((largura_exibicao(linha) for linha in linhas), default=0)
+        margem = self.margem(largura)
+        return [margem + linha if linha else linha for linha in linhas]
+
+    # ========== CACHE DE QUADROS ==========
+    def quadro(self, chave, construir):
+        """Quadro (lista de linhas) em cache para `chave` no tamanho atual"""
+        completa = (chave, self.tamanho)
+        linhas = self._quadros.get(completa)
+        if linhas is None:
+            # Chaves com dados do jogador variam; evita crescimento sem limite
+            if len(self._quadros) >= self.LIMITE_QUADROS:
+                self._quadros.clear()
+            linhas = self._quadros[completa] = list(construir())
+        return linhas
+
+
+# Instância compartilhada pelos menus
+layout = Layout()
+
+
+__all__ = ['Layout', 'layout', 'largura_exibicao']
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+MISSOES.PY - Motor de missões do RoOt 3voluti0n
+As missões dos capítulos são declaradas como dados: etapas com regras
+(casador + saída + pontos/penalidade + transição) e um único
+interpretador faz o laço de sempre — ler o comando, tratar 'menu' e
+'manual', achar a regra, aplicar, repetir.
+
+    Missao("RECONHECIMENTO", [
+        Etapa("scan", [
+            Regra(e_(comeca("nmap"), contem("192.168.55.10")), saida=relatorio, pontos=15, ir=SUCESSO),
+        ], erro=Regra(saida="Comando inválido.", penalidade=2)),
+    ], prompt=lambda state: prompt_kali(state.codinome))
+
+Casadores são compilados uma vez: comandos exatos de uma etapa (e os
+padrões de `comando`, pela forma normalizada) viram uma tabela (busca
+O(1)) e os demais são testados na ordem declarada. Comando que não casa
+com nada recebe um "você quis dizer" com a resposta válida mais próxima.
+O interpretador também conta comandos, erros e tempo por etapa, por
+execução (`executar(state, metricas={})`).
+"""
+
+import re
+import time
+
+from utils.colors import C
+from utils.comandos import PadraoComando, IndiceSugestoes, forma
+from utils.relogio import dormir
+
+# Resultados de uma missão (e destinos especiais de uma regra)
+SUCESSO = "SUCESSO"
+FALHA = "FALHA"
+MENU = "MENU"
+FINAIS = (SUCESSO, FALHA, MENU)
+
+
+# ========== CASADORES ==========
+class Casador:
+    """Predicado sobre o comando digitado (`exatos` permite a busca por tabela)"""
+
+    def __init__(self, teste, exatos=None, descricao='', formas=None, respostas=()):
+        self._teste = teste
+        self.exatos = exatos
+        self.descricao = descricao
+        self.formas = formas
+        self.respostas = tuple(respostas)
+
+    def __call__(self, cmd):
+        return self._teste(cmd)
+
+    def __repr__(self):
+        return f"Casador({self.descricao})"
+
+
+def exato(*textos):
+    """Comando igual a um dos textos"""
+    conjunto = frozenset(textos)
+    return Casador(conjunto.__contains__, exatos=conjunto, descricao=f"exato{textos}", respostas=textos)
+
+
+def comando(*padroes):
+    """
+    Comando equivalente a um dos padrões, ignorando ordem das flags, aspas
+    e espaços ('*' aceita qualquer argumento; ver utils.comandos)
+    """
+    compilados = [PadraoComando(padrao) for padrao in padroes]
+    if any(padrao.coringa for padrao in compilados):
+        teste = lambda cmd: any(padrao.casa(cmd) for padrao in compilados)
+        return Casador(teste, descricao=f"comando{padroes}", respostas=padroes)
+    formas = frozenset(padrao.forma for padrao in compilados)
+    return Casador(lambda cmd: forma(cmd) in formas, descricao=f"comando{padroes}",
+                   formas=formas, respostas=padroes)
+
+
+def comeca(*prefixos):
+    """Comando que começa com algum dos prefixos"""
+    return Casador(lambda cmd: cmd.startswith(prefixos), descricao=f"comeca{prefixos}")
+
+
+def contem(*trechos):
+    """Comando que contém todos os trechos"""
+    return Casador(lambda cmd: all(trecho in cmd for trecho in trechos), descricao=f"contem{trechos}")
+
+
+def algum(*trechos):
+    """Comando que contém pelo menos um dos trechos"""
+    return Casador(lambda cmd: any(trecho in cmd for trecho in trechos), descricao=f"algum{trechos}")
+
+
+def regex(padrao, flags=0):
+    """Comando em que a expressão regular casa (re.search)"""
+    compilado = re.compile(padrao, flags)
+    return Casador(lambda cmd: compilado.search(cmd) is not None, descricao=f"regex({padrao!r})")
+
+
+def e_(*casadores):
+    """Todos os casadores"""
+    return Casador(lambda cmd: all(casador(cmd) for casador in casadores), descricao="e_")
+
+
+def ou(*casadores):
+    """Algum dos casadores"""
+    return Casador(lambda cmd: any(casador(cmd) for casador in casadores), descricao="ou")
+
+
+def nao(casador):
+    return Casador(lambda cmd: not casador(cmd), descricao=f"nao({casador.descricao})")
+
+
+def funcao(teste, descricao=''):
+    """Casador a partir de uma função cmd -> bool"""
+    return Casador(teste, descricao=descricao or getattr(teste, '__name__', 'funcao'))
+
+
+# ========== DECLARAÇÃO ==========
+class Regra:
+    """
+    O que fazer com um comando que casou.
+
+    - saida: texto, lista de linhas ou função(ctx) que imprime/retorna o texto;
+    - pontos / penalidade: passados a `recompensar` / `penalizar` da missão
+      (penalidade que encerra o jogo leva a FALHA);
+    - efeito: função(ctx); se retornar um destino, ele substitui `ir`;
+    - ir: nome da próxima etapa, SUCESSO, FALHA, MENU ou None (continua);
+    - tentativa: conta como tentativa errada (para o limite da etapa);
+    - pausa: segundos depois da saída.
+    """
+
+    def __init__(self, casa=None, saida=None, ir=None, pontos=0, penalidade=0,
+                 efeito=None, tentativa=False, pausa=0):
+        self.casa = casa
+        self.saida = saida
+        self.ir = ir
+        self.pontos = pontos
+        self.penalidade = penalidade
+        self.efeito = efeito
+        self.tentativa = tentativa
+        self.pausa = pausa
+
+
+class Etapa:
+    """
+    Um estado da missão: regras na ordem de prioridade, regra `erro` para
+    o que não casar, limite opcional de `tentativas` (ao atingir, aplica
+    `esgotou` e vai para o destino dela, FALHA por padrão) e ganchos:
+    `entrada(state)` ao entrar, `antes(ctx)` antes de cada leitura,
+    `depois_de_ler(ctx)` depois de ler (pode ler mais campos com ctx.ler).
+    Com `sugerir`, os comandos de `exato`/`comando` servem de sugestão
+    quando nada casa.
+    """
+
+    def __init__(self, nome, regras=(), erro=None, prompt=None, entrada=None,
+                 tentativas=None, esgotou=None, antes=None, depois_de_ler=None, sugerir=True):
+        self.nome = nome
+        self.regras = list(regras)
+        self.erro = erro
+        self.prompt = prompt
+        self.entrada = entrada
+        self.tentativas = tentativas
+        self.esgotou = esgotou if esgotou is not None else Regra(ir=FALHA)
+        self.antes = antes
+        self.depois_de_ler = depois_de_ler
+        self.sugestoes = IndiceSugestoes()
+        self._compilar(sugerir)
+
+    def _compilar(self, sugerir):
+        # Comandos exatos / formas normalizadas -> índice da primeira regra que os aceita
+        self._exatos = {}
+        self._formas = {}
+        self._demais = []
+        for indice, regra in enumerate(self.regras):
+            exatos = getattr(regra.casa, 'exatos', None)
+            formas = getattr(regra.casa, 'formas', None)
+            if exatos is not None:
+                for texto in exatos:
+                    self._exatos.setdefault(texto, indice)
+            elif formas is not None:
+                for normalizada in formas:
+                    self._formas.setdefault(normalizada, indice)
+            else:
+                self._demais.append((indice, regra))
+            if sugerir:
+                for resposta in getattr(regra.casa, 'respostas', ()):
+                    self.sugestoes.adicionar(resposta)
+
+    def casar(self, cmd):
+        """Primeira regra (na ordem declarada) que aceita o comando, ou a de erro"""
+        limite = self._exatos.get(cmd, len(self.regras))
+        if self._formas:
+            limite = min(limite, self._formas.get(forma(cmd), limite))
+        for indice, regra in self._demais:
+            if indice > limite:
+                break
+            if regra.casa is None or regra.casa(cmd):
+                return regra
+        if limite < len(self.regras):
+            return self.regras[limite]
+        return self.erro
+
+
+class Contexto:
+    """
+    O que regras e ganchos recebem: estado do capítulo, comando e
+    contadores. Uma por execução: as métricas ficam aqui, e não na
+    Missao (que é compartilhada entre sessões).
+    """
+
+    def __init__(self, missao, state, ler, metricas=None):
+        self.missao = missao
+        self.state = state
+        self.ler = ler
+        self.etapa = None
+        self.cmd = ''
+        self.erros = 0
+        self.rodada = 0
+        self.inicio_etapa = time.monotonic()
+        self.dados = {}
+        self.metricas = {} if metricas is None else metricas
+
+    def metricas_da_etapa(self):
+        """Contadores da etapa atual: comandos, erros e segundos"""
+        metricas = self.metricas.get(self.etapa.nome)
+        if metricas is None:
+            metricas = self.metricas[self.etapa.nome] = {'comandos': 0, 'erros': 0, 'segundos': 0.0}
+        return metricas
+
+    @property
+    def esgotado(self):
+        return self.etapa.tentativas is not None and self.erros >= self.etapa.tentativas
+
+    @property
+    def restantes(self):
+        return None if self.etapa.tentativas is None else self.etapa.tentativas - self.erros
+
+
+def _penalizar(state, penalidade):
+    return bool(state.registrar_falha(penalidade))
+
+
+def _recompensar(state, pontos):
+    state.registrar_sucesso(pontos)
+
+
+def _interromper(state, excecao):
+    state.saindo_para_menu = True
+    return MENU
+
+
+def _sugerir(ctx, sugestao):
+    print(f"{C.CINZA}[?] Você quis dizer: {C.BRANCO}{sugestao}{C.CINZA} ?{C.RESET}")
+
+
+class Missao:
+    """
+    Conjunto de etapas interpretado por `executar(state)`.
+
+    `globais(cmd, state)` trata comandos válidos em qualquer etapa
+    ('menu', 'manual'): MENU/FALHA/SUCESSO encerram, outro valor
+    verdadeiro apenas consome o comando. `penalizar(state, n)` retorna
+    True quando a penalidade encerra o jogo. `sugerir(ctx, resposta)`
+    mostra o "você quis dizer" depois da regra de erro.
+    """
+
+    def __init__(self, nome, etapas, inicio=None, prompt=None, globais=None,
+                 penalizar=_penalizar, recompensar=_recompensar, ao_interromper=_interromper,
+                 interrupcoes=(KeyboardInterrupt, EOFError), sugerir=_sugerir):
+        self.nome = nome
+        self.etapas = {etapa.nome: etapa for etapa in etapas}
+        self.inicio = inicio or etapas[0].nome
+        self.prompt = prompt
+        self.globais = globais
+        self.penalizar = penalizar
+        self.recompensar = recompensar
+        self.ao_interromper = ao_interromper
+        self.interrupcoes = interrupcoes
+        self.sugerir = sugerir
+
+    # ========== INTERPRETADOR ==========
+    def executar(self, state, ler=input, metricas=None):
+        """
+        Roda a missão até SUCESSO, FALHA ou MENU. Se `metricas` (um dict)
+        for passado, recebe os contadores de cada etapa desta execução.
+        """
+        ctx = Contexto(self, state, ler, metricas)
+        resultado = self._entrar(ctx, self.inicio)
+        while resultado is None:
+            resultado = self._rodada(ctx)
+        self._fechar(ctx)
+        return resultado
+
+    def _entrar(self, ctx, nome):
+        if nome in FINAIS:
+            return nome
+        self._fechar(ctx)
+        ctx.etapa = self.etapas[nome]
+        ctx.erros = 0
+        ctx.rodada = 0
+        ctx.inicio_etapa = time.monotonic()
+        if ctx.etapa.entrada:
+            ctx.etapa.entrada(ctx.state)
+        return None
+
+    def _fechar(self, ctx):
+        if ctx.etapa is not None:
+            ctx.metricas_da_etapa()['segundos'] += time.monotonic() - ctx.inicio_etapa
+            ctx.etapa = None
+
+    def _rodada(self, ctx):
+        etapa = ctx.etapa
+        ctx.rodada += 1
+        if etapa.antes:
+            etapa.antes(ctx)
+
+        prompt = etapa.prompt or self.prompt
+        try:
+            ctx.cmd = ctx.ler(prompt(ctx.state) if callable(prompt) else (prompt or '')).strip()
+            status = self.globais(ctx.cmd, ctx.state) if self.globais else None
+            if status in FINAIS:
+                return status
+            if status:
+                return None
+            if etapa.depois_de_ler:
+                etapa.depois_de_ler(ctx)
+        except self.interrupcoes as e:
+            return self.ao_interromper(ctx.state, e)
+
+        metricas = ctx.metricas_da_etapa()
+        metricas['comandos'] += 1
+
+        regra = etapa.casar(ctx.cmd)
+        if regra is None:
+            return None
+        if regra.tentativa:
+            ctx.erros += 1
+        if regra.tentativa or regra is etapa.erro:
+            metricas['erros'] += 1
+        destino = self._aplicar(ctx, regra)
+        if destino is None and regra.tentativa and ctx.esgotado:
+            destino = self._aplicar(ctx, etapa.esgotou)
+        if destino is None and regra is etapa.erro and etapa.sugestoes and self.sugerir:
+            sugestao = etapa.sugestoes.sugerir(ctx.cmd)
+            if sugestao is not None:
+                self.sugerir(ctx, sugestao)
+        return self._entrar(ctx, destino) if destino is not None else None
+
+    def _aplicar(self, ctx, regra):
+        """Aplica a regra; retorna o destino (ou None para continuar na etapa)"""
+        destino = regra.ir
+        if regra.efeito:
+            retorno = regra.efeito(ctx)
+            if retorno is not None:
+                destino = retorno
+        if regra.saida is not None:
+            saida = regra.saida(ctx) if callable(regra.saida) else regra.saida
+            if saida is not None:
+                print(saida if isinstance(saida, str) else '\n'.join(saida))
+        if regra.pausa:
+            dormir(regra.pausa)
+        if regra.pontos:
+            self.recompensar(ctx.state, regra.pontos)
+        if regra.penalidade and self.penalizar(ctx.state, regra.penalidade):
+            return FALHA
+        return destino
+
+
+__all__ = ['Missao', 'Etapa', 'Regra', 'Contexto', 'Casador',
+           'exato', 'comando', 'comeca', 'contem', 'algum', 'regex', 'e_', 'ou', 'nao', 'funcao',
+           'SUCESSO', 'FALHA', 'MENU']
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+RELOGIO.PY - Relógio global do RoOt 3voluti0n
+Todas as pausas do jogo (narração, animações, transições) passam por aqui,
+para que possam ser executadas em tempo real, aceleradas ou puladas.
+
+Modos:
+  real         - dorme normalmente
+  escalado     - dorme `escala` vezes o tempo pedido (ex: 0.1 = 10x mais rápido)
+  instantaneo  - não dorme; o tempo pulado é somado ao relógio real
+  virtual      - não dorme; o tempo só avança com as pausas (determinístico)
+
+O modo inicial vem da variável de ambiente ROOT_EVOLUTION_RELOGIO
+(ex: "instantaneo", "virtual", "escalado:0.1" ou apenas "0.1").
+Sem a variável, a saída não interativa (pipe, CI) usa o modo instantaneo.
+"""
+
+import os
+import time
+import threading
+
+from utils.capacidades import interativo
+
+MODOS = ('real', 'escalado', 'instantaneo', 'virtual')
+VARIAVEL_AMBIENTE = 'ROOT_EVOLUTION_RELOGIO'
+
+
+class Relogio:
+    """Serviço central de tempo do jogo"""
+
+    def __init__(self, modo='real', escala=1.0):
+        self._lock = threading.Lock()
+        self.configurar(modo, escala)
+
+    def configurar(self, modo, escala=None):
+        """Troca o modo do relógio (o tempo percebido continua contínuo)"""
+        if modo not in MODOS:
+            raise ValueError(f"Modo de relógio inválido: {modo!r} (use {', '.join(MODOS)})")
+        if escala is None:
+            escala = 1.0
+        if escala <= 0:
+            raise ValueError("A escala do relógio deve ser positiva")
+
+        with self._lock:
+            # Ponto de partida: o "agora" do modo anterior, se houver
+            base = self._agora_sem_lock() if hasattr(self, 'modo') else time.monotonic()
+            self.modo = modo
+            self.escala = escala if modo == 'escalado' else 1.0
+            self._base_real = time.monotonic()
+            self._base = base
+            self._avanco = 0.0
+
+    @classmethod
+    def do_ambiente(cls, valor=None):
+        """Cria um relógio a partir de ROOT_EVOLUTION_RELOGIO"""
+        if valor is None:
+            valor = os.environ.get(VARIAVEL_AMBIENTE, '')
+        valor = valor.strip().lower()
+
+        if not valor:
+            # Ninguém está assistindo: as pausas só atrasariam a execução
+            return cls() if interativo() else cls('instantaneo')
+
+        modo, _, escala = valor.partition(':')
+        try:
+            # "0.1" sozinho significa modo escalado
+            return cls('escalado', float(modo))
+        except ValueError:
+            pass
+
+        try:
+            return cls(modo, float(escala) if escala else None)
+        except ValueError:
+            # Valor inválido no ambiente nunca deve impedir o jogo de abrir
+            return cls()
+
+    # ========== TEMPO ==========
+    def _agora_sem_lock(self):
+        if self.modo == 'virtual':
+            return self._base + self._avanco
+        decorrido = (time.monotonic() - self._base_real) / self.escala
+        return self._base + decorrido + self._avanco
+
+    def agora(self):
+        """Instante atual (em segundos) na escala do jogo"""
+        with self._lock:
+            return self._agora_sem_lock()
+
+    def dormir(self, segundos):
+        """Pausa o jogo por `segundos` de tempo de jogo"""
+        if segundos <= 0:
+            return
+
+        if self.modo in ('instantaneo', 'virtual'):
+            with self._lock:
+                self._avanco += segundos
+            return
+
+        time.sleep(segundos * self.escala)
+
+    @property
+    def acelerado(self):
+        """True quando as pausas não consomem tempo real"""
+        return self.modo in ('instantaneo', 'virtual')
+
+
+# ========== INSTÂNCIA GLOBAL ==========
+relogio = Relogio.do_ambiente()
+
+
+def dormir(segundos):
+    """Atalho para relogio.dormir (substitui time.sleep no jogo)"""
+    relogio.dormir(segundos)
+
+
+def agora():
+    """Atalho para relogio.agora (substitui time.time em animações)"""
+    return relogio.agora()
+
+
+def configurar_relogio(modo, escala=None):
+    """Reconfigura o relógio global"""
+    relogio.configurar(modo, escala)
+
+
+__all__ = ['Relogio', 'relogio', 'dormir', 'agora', 'configurar_relogio', 'MODOS']
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+RODA_TEMPORIZADORES.PY - Prazos do jogo numa roda de temporizadores
+Os eventos com hora marcada (Juliana avançando pelo corredor enquanto o
+jogador digita) ficam numa roda com hash: `fendas` posições de
+`resolucao` segundos, cada temporizador na fenda do tique em que vence.
+Agendar e cancelar custam O(1), e cada tique só olha a própria fenda.
+
+Um único laço (`LoopTemporizadores`, uma thread para o processo todo)
+gira a roda e chama os vencidos, seja uma sessão local ou milhares no
+servidor: nenhuma sessão precisa de thread nem de polling próprio. Sem
+temporizadores pendentes o laço dorme até o próximo `agendar`.
+
+Os prazos correm no tempo real (time.monotonic), só ajustado pela escala
+do relógio do jogo. O relógio do jogo em si não serve: nos modos
+instantaneo/virtual ele salta com cada dormir() de qualquer thread, e no
+servidor a narração de um jogador adiantaria os prazos de outro.
+"""
+
+import time
+import threading
+
+from utils.relogio import relogio as relogio_jogo
+
+# Duração de um tique e número de fendas (uma volta = 51,2 s)
+RESOLUCAO = 0.1
+FENDAS = 512
+
+
+class RelogioMonotonico:
+    """Tempo real em segundos de jogo: nenhuma pausa, de nenhuma sessão, o adianta"""
+    
+    @property
+    def escala(self):
+        return relogio_jogo.escala
+    
+    def agora(self):
+        return time.monotonic() / self.escala
+
+
+class Temporizador:
+    """Um prazo agendado; `cancelar()` o descarta sem mexer na roda"""
+
+    __slots__ = ('prazo', 'tique', 'acao', 'cancelado')
+
+    def __init__(self, prazo, tique, acao):
+        self.prazo = prazo
+        self.tique = tique
+        self.acao = acao
+        self.cancelado = False
+
+    def cancelar(self):
+        self.cancelado = True
+
+
+# ========== RODA ==========
+class RodaTemporizadores:
+    """
+    Roda com hash, sem thread: quem a usa chama `avancar()` para disparar
+    o que venceu. Temporizadores além de uma volta ficam na fenda até o
+    tique deles chegar.
+    """
+
+    def __init__(self, resolucao=RESOLUCAO, fendas=FENDAS, relogio=None):
+        self.resolucao = resolucao
+        self.fendas = fendas
+        self.relogio = relogio or RelogioMonotonico()
+        self._roda = [[] for _ in range(fendas)]
+        self._tique = self._tique_de(self.relogio.agora())
+        self._pendentes = 0
+
+    def _tique_de(self, instante):
+        return int(instante // self.resolucao)
+
+    def __len__(self):
+        return self._pendentes
+
+    def agendar(self, atraso, acao):
+        """Chama `acao()` daqui a `atraso` segundos (de jogo); devolve o Temporizador"""
+        prazo = self.relogio.agora() + max(0.0, atraso)
+        # Nunca no tique que já foi processado
+        tique = max(self._tique_de(prazo), self._tique + 1)
+        temporizador = Temporizador(prazo, tique, acao)
+        self._roda[tique % self.fendas].append(temporizador)
+        self._pendentes += 1
+        return temporizador
+
+    def _recolher(self, fenda, ate):
+        vencidos, restantes = [], []
+        for temporizador in self._roda[fenda]:
+            if temporizador.cancelado:
+                self._pendentes -= 1
+            elif temporizador.tique <= ate:
+                vencidos.append(temporizador)
+                self._pendentes -= 1
+            else:
+                restantes.append(temporizador)
+        self._roda[fenda] = restantes
+        return vencidos
+
+    def vencidos(self, agora=None):
+        """Gira a roda até `agora` e devolve os temporizadores vencidos (em ordem de prazo)"""
+        ate = self._tique_de(self.relogio.agora() if agora is None else agora)
+        if ate <= self._tique:
+            return []
+        vencidos = []
+        if ate - self._tique >= self.fendas:
+            # Salto maior que uma volta (pausa pulada): todas as fendas de uma vez
+            for fenda in range(self.fendas):
+                vencidos.extend(self._recolher(fenda, ate))
+        else:
+            for tique in range(self._tique + 1, ate + 1):
+                vencidos.extend(self._recolher(tique % self.fendas, ate))
+        self._tique = ate
+        vencidos.sort(key=lambda temporizador: temporizador.prazo)
+        return vencidos
+
+    def avancar(self, agora=None):
+        """Dispara os vencidos até `agora`; devolve quantos foram chamados"""
+        vencidos = self.vencidos(agora)
+        for temporizador in vencidos:
+            temporizador.acao()
+        return len(vencidos)
+
+
+# ========== LAÇO ÚNICO ==========
+class LoopTemporizadores:
+    """
+    A roda compartilhada e a thread que a gira, criada no primeiro
+    `agendar`. As ações rodam nessa thread: devem ser curtas e escrever
+    direto na sessão de quem agendou.
+    """
+
+    def __init__(self, resolucao=RESOLUCAO, fendas=FENDAS, relogio=None):
+        self.roda = RodaTemporizadores(resolucao, fendas, relogio)
+        self._condicao = threading.Condition()
+        self._thread = None
+        self.ultimo_erro = None
+
+    def agendar(self, atraso, acao):
+        with self._condicao:
+            temporizador = self.roda.agendar(atraso, acao)
+            self._iniciar()
+            self._condicao.notify()
+        return temporizador
+
+    def _iniciar(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._laco, name="temporizadores", daemon=True)
+            self._thread.start()
+
+    def _laco(self):
+        while True:
+            with self._condicao:
+                while not len(self.roda):
+                    self._condicao.wait()
+                # Um tique de espera (em tempo real, na escala do relógio)
+                self._condicao.wait(self.roda.resolucao * self.roda.relogio.escala)
+                vencidos = self.roda.vencidos()
+            for temporizador in vencidos:
+                if temporizador.cancelado:
+                    continue
+                try:
+                    temporizador.acao()
+                except Exception as e:
+                    self.ultimo_erro = e
+
+
+# Instância compartilhada por todas as sessões
+temporizadores = LoopTemporizadores()
+
+
+def agendar(atraso, acao):
+    """Agenda `acao` no laço compartilhado"""
+    return temporizadores.agendar(atraso, acao)
+
+
+__all__ = ['RelogioMonotonico', 'Temporizador', 'RodaTemporizadores', 'LoopTemporizadores', 'temporizadores',
+           'agendar', 'RESOLUCAO', 'FENDAS']
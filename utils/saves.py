@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+SAVES.PY - Serviço de saves do RoOt 3voluti0n
+Ponto único de gravação dos saves (menu, capítulos e mercado):
+- só grava quando algum campo de jogo mudou desde a última gravação/leitura
+  (metadados de acesso, como 'last_seen', vão só para o índice);
+- JSON compacto escrito em arquivo temporário + os.replace (nunca deixa
+  o save pela metade se o jogo cair durante a escrita);
+- rajadas de gravações dividem um único fsync no fim da janela.
+"""
+
+import os
+import json
+import time
+import atexit
+import threading
+
+from utils.indice_saves import IndiceSaves
+
+
+# Campos que mudam a cada acesso sem alterar o estado do jogo
+CAMPOS_ACESSO = frozenset({'last_seen'})
+
+
+def _serializar(valor):
+    return json.dumps(valor, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+
+
+def _fsync_diretorio(diretorio):
+    """Garante que o rename chegou ao disco (onde o SO permitir)"""
+    try:
+        descritor = os.open(diretorio or '.', os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(descritor)
+    except OSError:
+        pass
+    finally:
+        os.close(descritor)
+
+
+class ServicoSaves:
+    """
+    Gravação atômica e sem repetições dos saves.
+
+    `salvar(arquivo, dados)` compara campo a campo com o último estado
+    conhecido do arquivo e não toca no disco se nada mudou. A primeira
+    gravação depois de um período calmo faz fsync na hora; as seguintes,
+    dentro de `janela_fsync` segundos, ficam pendentes e são sincronizadas
+    juntas ao fim da janela (ou na saída do programa).
+    """
+
+    # Extensão dos arquivos de save deste formato
+    extensao = '.json'
+
+    def __init__(self, indice=None, janela_fsync=0.5):
+        self.indice = indice
+        self.janela_fsync = janela_fsync
+        self._campos = {}
+        self._pendentes = set()
+        self._ultimo_fsync = None
+        self._timer = None
+        self._trava = threading.RLock()
+        self.gravacoes = 0
+        self.ignoradas = 0
+
+    # ========== ESTADO CONHECIDO ==========
+    @staticmethod
+    def _chave(arquivo):
+        return os.path.abspath(arquivo)
+
+    def _impressao(self, dados):
+        """Valores comparáveis de cada campo (o que decide se algo mudou)"""
+        return {campo: _serializar(valor) for campo, valor in dados.items()}
+
+    def campos_sujos(self, arquivo, dados):
+        """Campos de `dados` que diferem do último estado gravado/lido do arquivo"""
+        anteriores = self._campos.get(self._chave(arquivo))
+        atuais = self._impressao(dados)
+        if anteriores is None:
+            return set(atuais), atuais
+        sujos = {campo for campo, valor in atuais.items() if anteriores.get(campo) != valor}
+        sujos |= set(anteriores) - set(atuais)
+        return sujos - CAMPOS_ACESSO, atuais
+
+    def esquecer(self, arquivo):
+        """Descarta o estado conhecido (a próxima gravação é sempre feita)"""
+        self._campos.pop(self._chave(arquivo), None)
+
+    # ========== LEITURA ==========
+    def carregar(self, arquivo):
+        """Lê o save e memoriza o estado (para não regravar o que não mudou)"""
+        dados = self._ler(arquivo)
+        with self._trava:
+            self._campos[self._chave(arquivo)] = self._impressao(dados)
+        return dados
+
+    # ========== GRAVAÇÃO ==========
+    def salvar(self, arquivo, dados):
+        """Grava o save se algo mudou; retorna True se o disco foi tocado"""
+        with self._trava:
+            sujos, campos = self.campos_sujos(arquivo, dados)
+            if not sujos:
+                self.ignoradas += 1
+                # Só o acesso mudou: anotado no índice, o save fica intacto
+                if self.indice is not None and 'last_seen' in dados:
+                    self.indice.registrar_acesso(arquivo, dados)
+                return False
+
+            self._gravar(arquivo, self._documento(campos, dados), dados)
+
+            self._campos[self._chave(arquivo)] = campos
+            self.gravacoes += 1
+
+        if self.indice is not None:
+            self.indice.atualizar(arquivo, dados)
+        return True
+
+    # ========== ARMAZENAMENTO (JSON) ==========
+    def _documento(self, campos, dados):
+        """Monta o documento a partir dos campos já serializados"""
+        return '{' + ','.join(f"{_serializar(campo)}:{valor}" for campo, valor in campos.items()) + '}'
+
+    def _ler(self, arquivo):
+        with open(arquivo, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _gravar(self, arquivo, documento, dados):
+        """Escreve o documento (texto ou bytes) por arquivo temporário + os.replace"""
+        diretorio = os.path.dirname(arquivo)
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+
+        temporario = f"{arquivo}.{os.getpid()}.tmp"
+        sincronizar = self._sincronizar_agora()
+        try:
+            binario = isinstance(documento, bytes)
+            with open(temporario, 'wb' if binario else 'w', encoding=None if binario else 'utf-8') as f:
+                f.write(documento)
+                if sincronizar:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(temporario, arquivo)
+        except BaseException:
+            try:
+                os.remove(temporario)
+            except OSError:
+                pass
+            raise
+
+        if sincronizar:
+            _fsync_diretorio(diretorio)
+        else:
+            self._pendentes.add(arquivo)
+            self._agendar()
+
+    # ========== FSYNC AGRUPADO ==========
+    def _sincronizar_agora(self):
+        instante = time.monotonic()
+        if self._ultimo_fsync is None or instante - self._ultimo_fsync >= self.janela_fsync:
+            self._ultimo_fsync = instante
+            return True
+        return False
+
+    def _agendar(self):
+        if self._timer is None:
+            self._timer = threading.Timer(self.janela_fsync, self.sincronizar)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def sincronizar(self):
+        """Faz o fsync de todas as gravações pendentes"""
+        with self._trava:
+            pendentes, self._pendentes = self._pendentes, set()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._ultimo_fsync = time.monotonic()
+        diretorios = set()
+        for arquivo in pendentes:
+            try:
+                descritor = os.open(arquivo, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.fsync(descritor)
+            except OSError:
+                pass
+            finally:
+                os.close(descritor)
+            diretorios.add(os.path.dirname(arquivo))
+        for diretorio in diretorios:
+            _fsync_diretorio(diretorio)
+
+
+def criar_servico(backend=None, pasta="saves"):
+    """
+    Serviço de saves conforme ROOT_EVOLUTION_SAVES:
+    'json' (padrão, um arquivo por save), 'binario' (contêiner .r3v com
+    seções comprimidas) ou 'sqlite' (banco único em WAL). Os dois últimos
+    importam na primeira vez os JSONs já existentes na pasta.
+    """
+    backend = (backend or os.environ.get('ROOT_EVOLUTION_SAVES', 'json')).lower()
+    if backend == 'binario':
+        from utils.saves_binario import ServicoSavesBinario
+        return ServicoSavesBinario(pasta)
+    if backend == 'sqlite':
+        from utils.saves_sqlite import ArmazemSQLite
+        caminho = os.path.join(pasta, "saves.db")
+        novo = not os.path.exists(caminho)
+        return ArmazemSQLite(caminho, importar_de=pasta if novo else None)
+    return ServicoSaves(IndiceSaves(pasta))
+
+
+# Instância compartilhada pelo menu, capítulos e mercado
+servico_saves = criar_servico()
+atexit.register(servico_saves.sincronizar)
+
+
+__all__ = ['ServicoSaves', 'servico_saves', 'criar_servico']
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+SAVES_BINARIO.PY - Backend de saves no formato .r3v (RoOt 3voluti0n)
+Mesma interface do ServicoSaves, gravando o contêiner de utils.formato_save:
+o menu lista os saves lendo só os cabeçalhos, e carregar um jogo não
+descomprime seções (histórico, VFS...) que o capítulo não usar.
+Ativado com ROOT_EVOLUTION_SAVES=binario.
+"""
+
+import os
+import json
+
+from utils import formato_save
+from utils.formato_save import SaveBinario, CAMPOS_CABECALHO
+from utils.indice_saves import IndiceSaves
+from utils.saves import ServicoSaves, _serializar
+
+# Chaves das seções na impressão do save (não colidem com nomes de campo)
+_PREFIXO_SECAO = '\0secao:'
+
+
+class ServicoSavesBinario(ServicoSaves):
+    """
+    Saves .r3v. A comparação que evita regravações é feita por campo no
+    cabeçalho (assim 'last_seen' continua indo só para o índice) e por
+    seção no resto: seções não decodificadas nunca contam como alteradas.
+    """
+
+    extensao = formato_save.EXTENSAO
+
+    def __init__(self, pasta="saves", janela_fsync=0.5, importar=True):
+        super().__init__(IndiceSaves(pasta, self.extensao, formato_save.ler_cabecalho), janela_fsync)
+        self.pasta = pasta
+        if importar:
+            self.importar_pasta(pasta)
+
+    # ========== IMPRESSÃO / DOCUMENTO ==========
+    def _impressao(self, dados):
+        cabecalho, secoes = formato_save.separar(dados)
+        impressao = {campo: _serializar(valor) for campo, valor in cabecalho.items()}
+        for secao in secoes:
+            impressao[_PREFIXO_SECAO + secao.nome] = secao
+        return impressao
+
+    def _documento(self, campos, dados):
+        cabecalho = {campo: dados[campo] for campo in CAMPOS_CABECALHO if campo in dados}
+        secoes = [valor for chave, valor in campos.items() if chave.startswith(_PREFIXO_SECAO)]
+        return formato_save.codificar(cabecalho, secoes)
+
+    # ========== ARMAZENAMENTO ==========
+    def _ler(self, arquivo):
+        with open(arquivo, 'rb') as f:
+            return formato_save.decodificar(f.read())
+
+    # ========== MIGRAÇÃO ==========
+    def importar_pasta(self, pasta="saves"):
+        """
+        Converte os saves JSON da pasta que ainda não têm um .r3v ao lado
+        (aplicando antes os eventos pendentes do diário de cada um).
+        """
+        from utils.diario import diario_de
+
+        importados = 0
+        try:
+            nomes = sorted(os.listdir(pasta))
+        except OSError:
+            return 0
+        for nome in nomes:
+            if not nome.endswith('.json') or nome.startswith('.'):
+                continue
+            origem = os.path.join(pasta, nome)
+            destino = os.path.splitext(origem)[0] + self.extensao
+            if os.path.exists(destino):
+                continue
+            try:
+                with open(origem, 'r', encoding='utf-8') as f:
+                    dados = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if not isinstance(dados, dict) or 'player_name' not in dados or 'codiname' not in dados:
+                continue
+            self.salvar(destino, diario_de(origem).recuperar(dados))
+            importados += 1
+        return importados
+
+
+__all__ = ['ServicoSavesBinario', 'SaveBinario']
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+SAVES_SQLITE.PY - Backend SQLite dos saves do RoOt 3voluti0n
+Alternativa à pasta de JSONs para instalações compartilhadas (uma turma
+inteira no mesmo servidor): todos os saves num único banco em modo WAL,
+com colunas indexadas para codinome, capítulo e último acesso.
+
+Mesma interface do ServicoSaves (salvar/carregar/sincronizar) e do
+IndiceSaves (listar/registrar_acesso), então o menu, o diário e os
+capítulos não mudam. Ativado com ROOT_EVOLUTION_SAVES=sqlite.
+"""
+
+import os
+import json
+import sqlite3
+import threading
+from datetime import datetime
+
+from utils.saves import ServicoSaves
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS saves (
+    arquivo      TEXT PRIMARY KEY,
+    nome_jogador TEXT NOT NULL,
+    codinome     TEXT NOT NULL,
+    capitulo     INTEGER NOT NULL DEFAULT 1,
+    last_seen    TEXT,
+    bitcoin      REAL NOT NULL DEFAULT 0,
+    dados        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS saves_codinome ON saves (codinome);
+CREATE INDEX IF NOT EXISTS saves_capitulo ON saves (capitulo);
+CREATE INDEX IF NOT EXISTS saves_last_seen ON saves (last_seen);
+"""
+
+# Chaves de ordenação aceitas por listar() -> coluna
+COLUNAS_ORDEM = {
+    'data': 'last_seen',
+    'codinome': 'codinome',
+    'nome_jogador': 'nome_jogador',
+    'capitulo': 'capitulo',
+    'bitcoin': 'bitcoin',
+}
+
+
+class ArmazemSQLite(ServicoSaves):
+    """
+    Saves num banco SQLite.
+
+    Cada thread usa sua própria conexão; gravações abrem a transação com
+    BEGIN IMMEDIATE e esperam (busy_timeout) quando outra sessão está
+    escrevendo, em vez de falhar com "database is locked".
+    """
+
+    ESPERA_TRAVA_MS = 5000
+
+    def __init__(self, caminho=os.path.join("saves", "saves.db"), importar_de=None):
+        super().__init__(indice=None)
+        self.caminho = caminho
+        self._local = threading.local()
+        # O próprio armazém responde pelo índice (listar/registrar_acesso)
+        self.indice = self
+        self._conexao().executescript(ESQUEMA)
+        if importar_de:
+            self.importar_pasta(importar_de)
+
+    # ========== CONEXÃO ==========
+    def _conexao(self):
+        conexao = getattr(self._local, 'conexao', None)
+        if conexao is None:
+            diretorio = os.path.dirname(self.caminho)
+            if diretorio:
+                os.makedirs(diretorio, exist_ok=True)
+            conexao = sqlite3.connect(self.caminho, timeout=self.ESPERA_TRAVA_MS / 1000,
+                                      isolation_level=None)
+            conexao.execute("PRAGMA journal_mode=WAL")
+            conexao.execute("PRAGMA synchronous=NORMAL")
+            conexao.execute(f"PRAGMA busy_timeout={self.ESPERA_TRAVA_MS}")
+            self._local.conexao = conexao
+        return conexao
+
+    class _Transacao:
+        def __init__(self, conexao):
+            self.conexao = conexao
+
+        def __enter__(self):
+            self.conexao.execute("BEGIN IMMEDIATE")
+            return self.conexao
+
+        def __exit__(self, tipo, valor, rastro):
+            self.conexao.execute("COMMIT" if tipo is None else "ROLLBACK")
+            return False
+
+    def _transacao(self):
+        return self._Transacao(self._conexao())
+
+    def fechar(self):
+        """Fecha a conexão desta thread"""
+        conexao = getattr(self._local, 'conexao', None)
+        if conexao is not None:
+            conexao.close()
+            self._local.conexao = None
+
+    # ========== ARMAZENAMENTO ==========
+    def _ler(self, arquivo):
+        linha = self._conexao().execute(
+            "SELECT dados FROM saves WHERE arquivo = ?", (arquivo,)).fetchone()
+        if linha is None:
+            raise FileNotFoundError(f"{arquivo}: save não encontrado")
+        return json.loads(linha[0])
+
+    def _gravar(self, arquivo, documento, dados):
+        with self._transacao() as conexao:
+            conexao.execute(
+                """INSERT INTO saves (arquivo, nome_jogador, codinome, capitulo, last_seen, bitcoin, dados)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(arquivo) DO UPDATE SET
+                       nome_jogador = excluded.nome_jogador,
+                       codinome = excluded.codinome,
+                       capitulo = excluded.capitulo,
+                       last_seen = COALESCE(excluded.last_seen, saves.last_seen),
+                       bitcoin = excluded.bitcoin,
+                       dados = excluded.dados""",
+                (arquivo,
+                 dados.get('player_name', ''),
+                 dados.get('codiname', ''),
+                 dados.get('current_chapter', 1),
+                 dados.get('last_seen'),
+                 dados.get('bitcoin_wallet', 0),
+                 documento))
+
+    def sincronizar(self):
+        """Commits do SQLite já são duráveis; nada pendente"""
+
+    # ========== ÍNDICE ==========
+    def atualizar(self, arquivo, dados):
+        """As colunas do índice são gravadas junto com o save"""
+
+    def registrar_acesso(self, arquivo, dados, quando=None):
+        """Atualiza só a coluna last_seen"""
+        with self._transacao() as conexao:
+            conexao.execute("UPDATE saves SET last_seen = ? WHERE arquivo = ?",
+                            (quando or dados.get('last_seen'), arquivo))
+
+    def ultimo_acesso(self, arquivo):
+        linha = self._conexao().execute(
+            "SELECT last_seen FROM saves WHERE arquivo = ?", (arquivo,)).fetchone()
+        return linha[0] if linha else None
+
+    def remover(self, arquivo):
+        with self._transacao() as conexao:
+            conexao.execute("DELETE FROM saves WHERE arquivo = ?", (arquivo,))
+        self.esquecer(arquivo)
+
+    def listar(self, ordenar_por='data', decrescente=True, pagina=0, por_pagina=None):
+        """Resumos dos saves no mesmo formato do IndiceSaves, ordenados e paginados no banco"""
+        coluna = COLUNAS_ORDEM[ordenar_por]
+        sql = (f"SELECT arquivo, nome_jogador, codinome, capitulo, last_seen, bitcoin FROM saves "
+               f"ORDER BY {coluna} {'DESC' if decrescente else 'ASC'}, arquivo")
+        parametros = ()
+        if por_pagina is not None:
+            sql += " LIMIT ? OFFSET ?"
+            parametros = (por_pagina, pagina * por_pagina)
+        return [
+            {'arquivo': arquivo, 'nome_jogador': nome, 'codinome': codinome,
+             'capitulo': capitulo, 'data': data or '', 'bitcoin': bitcoin}
+            for arquivo, nome, codinome, capitulo, data, bitcoin
+            in self._conexao().execute(sql, parametros)
+        ]
+
+    def total(self):
+        return self._conexao().execute("SELECT COUNT(*) FROM saves").fetchone()[0]
+
+    # ========== MIGRAÇÃO ==========
+    def importar_pasta(self, pasta="saves"):
+        """Importa os saves JSON de uma pasta que ainda não estejam no banco"""
+        importados = 0
+        try:
+            nomes = sorted(os.listdir(pasta))
+        except OSError:
+            return 0
+        for nome in nomes:
+            if not nome.endswith('.json') or nome.startswith('.'):
+                continue
+            arquivo = os.path.join(pasta, nome)
+            if self.ultimo_acesso(arquivo) is not None:
+                continue
+            try:
+                with open(arquivo, 'r', encoding='utf-8') as f:
+                    dados = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if not isinstance(dados, dict) or 'player_name' not in dados or 'codiname' not in dados:
+                continue
+            dados.setdefault('last_seen', datetime.fromtimestamp(os.path.getmtime(arquivo)).isoformat())
+            self.salvar(arquivo, dados)
+            importados += 1
+        return importados
+
+
+__all__ = ['ArmazemSQLite', 'COLUNAS_ORDEM']
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+SESSAO_IO.PY - Entrada e saída por sessão do RoOt 3voluti0n
+Uma SessaoIO é o terminal de um jogador: escrita com buffer (por linha
+ou por bloco) e leitura de linhas, bloqueante (`ler`, como input()) ou
+em corrotina (`ler_async`). Os pontos de entrada (IntroMenu, TerminalKali,
+BitcoinSystem, ManualHacking e o `iniciar` dos capítulos) recebem a
+sessão no parâmetro `io`.
+
+Compatibilidade: enquanto um ponto de entrada roda, a sessão fica ligada
+à thread (`usar`), e sys.stdin/sys.stdout viram roteadores que mandam
+cada print()/input() antigo para a sessão da thread atual. Sem sessão
+nenhuma, vale `sessao_padrao`, que é o stdin/stdout de sempre (com
+readline, histórico e TAB).
+"""
+
+import sys
+import asyncio
+import functools
+import threading
+from contextlib import contextmanager
+
+# Escritas acumuladas antes de enviar mesmo sem fim de linha
+LIMITE_BUFFER = 4096
+
+
+# ========== SESSÃO ==========
+class SessaoIO:
+    """
+    Terminal de uma sessão sobre streams quaisquer (`entrada` com
+    readline(), `saida` com write()/flush()). `linha_a_linha=False`
+    acumula a saída até a próxima leitura, um flush explícito ou
+    `limite` caracteres.
+    """
+
+    encoding = 'utf-8'
+    errors = 'replace'
+
+    def __init__(self, entrada=None, saida=None, linha_a_linha=True, limite=LIMITE_BUFFER, interativo=False):
+        self.entrada = entrada
+        self.saida = saida
+        self.linha_a_linha = linha_a_linha
+        self.limite = limite
+        self.interativo = interativo
+        self._buffer = []
+        self._tamanho = 0
+        self._lock = threading.Lock()
+
+    # ========== SAÍDA ==========
+    def write(self, texto):
+        if not texto:
+            return 0
+        with self._lock:
+            self._buffer.append(texto)
+            self._tamanho += len(texto)
+            cheio = self._tamanho >= self.limite or (self.linha_a_linha and '\n' in texto)
+        if cheio:
+            self.flush()
+        return len(texto)
+
+    def flush(self):
+        with self._lock:
+            if not self._buffer:
+                return
+            texto = ''.join(self._buffer)
+            self._buffer = []
+            self._tamanho = 0
+        self._enviar(texto)
+
+    def _enviar(self, texto):
+        """Entrega um bloco de saída (subclasses mandam para sockets etc.)"""
+        if self.saida is not None:
+            self.saida.write(texto)
+            self.saida.flush()
+
+    def escrever(self, *valores, sep=' ', end='\n', flush=False):
+        """Como print(), na saída da sessão"""
+        self.write(sep.join(str(valor) for valor in valores) + end)
+        if flush:
+            self.flush()
+
+    # ========== ENTRADA ==========
+    def readline(self, limite=-1):
+        self.flush()
+        return self._ler_linha()
+
+    def _ler_linha(self):
+        """Próxima linha com '\\n' ('' no fim da entrada)"""
+        return self.entrada.readline() if self.entrada is not None else ''
+
+    def ler(self, prompt=''):
+        """Como input(): mostra o prompt e devolve a linha (EOFError no fim)"""
+        if prompt:
+            self.write(prompt)
+        linha = self.readline()
+        if not linha:
+            raise EOFError
+        return linha[:-1] if linha.endswith('\n') else linha
+
+    async def ler_async(self, prompt=''):
+        """`ler` sem bloquear o loop do asyncio (a leitura roda no executor)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.ler, prompt)
+
+    # ========== CAPACIDADES ==========
+    def isatty(self):
+        return self.interativo
+
+    def fileno(self):
+        raise OSError("sessão sem descritor de arquivo")
+    
+    def descritor_entrada(self):
+        """Descritor de arquivo da entrada, para esperar nela com selectors (None se não houver)"""
+        try:
+            return self.entrada.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+
+
+class SessaoPadrao(SessaoIO):
+    """
+    O terminal do processo: escreve direto no sys.stdout original (que já
+    tem buffer próprio) e lê com input(), preservando readline e o TAB.
+    """
+
+    def _saida(self):
+        return _original(sys.stdout)
+
+    def write(self, texto):
+        return self._saida().write(texto)
+
+    def flush(self):
+        self._saida().flush()
+
+    def _ler_linha(self):
+        return _original(sys.stdin).readline()
+
+    def ler(self, prompt=''):
+        if isinstance(sys.stdout, FluxoRoteado) or isinstance(sys.stdin, FluxoRoteado):
+            return super().ler(prompt)
+        return input(prompt)
+
+    def isatty(self):
+        try:
+            return bool(self._saida().isatty())
+        except (AttributeError, ValueError):
+            return False
+
+    def fileno(self):
+        return self._saida().fileno()
+    
+    def descritor_entrada(self):
+        try:
+            return _original(sys.stdin).fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+
+
+sessao_padrao = SessaoPadrao()
+
+
+# ========== SESSÃO DA THREAD ==========
+_local = threading.local()
+
+
+def sessao_atual():
+    """Sessão ligada à thread atual (ou a padrão)"""
+    return getattr(_local, 'sessao', None) or sessao_padrao
+
+
+@contextmanager
+def usar(sessao):
+    """Liga `sessao` à thread atual durante o bloco"""
+    if sessao is None or sessao is sessao_padrao:
+        yield sessao_atual()
+        return
+    instalar_roteamento()
+    anterior = getattr(_local, 'sessao', None)
+    _local.sessao = sessao
+    try:
+        yield sessao
+    finally:
+        sessao.flush()
+        _local.sessao = anterior
+
+
+def na_sessao(metodo):
+    """Decora um método de ponto de entrada: roda com `self.io` ligada à thread"""
+    @functools.wraps(metodo)
+    def chamada(self, *args, **kwargs):
+        with usar(getattr(self, 'io', None)):
+            return metodo(self, *args, **kwargs)
+    return chamada
+
+
+def com_sessao(funcao):
+    """Decora uma função de ponto de entrada: aceita `io=` e liga a sessão durante a chamada"""
+    @functools.wraps(funcao)
+    def chamada(*args, io=None, **kwargs):
+        with usar(io):
+            return funcao(*args, **kwargs)
+    return chamada
+
+
+# ========== ROTEAMENTO DE sys.stdin / sys.stdout ==========
+class FluxoRoteado:
+    """
+    Substituto de sys.stdin/sys.stdout: na thread com uma sessão ligada,
+    lê e escreve nela; nas demais, usa o stream original.
+    """
+
+    def __init__(self, original):
+        self._original = original
+
+    def _alvo(self):
+        sessao = getattr(_local, 'sessao', None)
+        return sessao if sessao is not None else self._original
+
+    def write(self, texto):
+        return self._alvo().write(texto)
+
+    def flush(self):
+        return self._alvo().flush()
+
+    def readline(self, *args):
+        return self._alvo().readline(*args)
+
+    def isatty(self):
+        return self._alvo().isatty()
+
+    def __getattr__(self, nome):
+        return getattr(self._alvo(), nome)
+
+
+def _original(stream):
+    return stream._original if isinstance(stream, FluxoRoteado) else stream
+
+
+def instalar_roteamento():
+    """Troca sys.stdin/sys.stdout pelos roteadores (uma vez por processo)"""
+    if not isinstance(sys.stdout, FluxoRoteado):
+        sys.stdout = FluxoRoteado(sys.stdout)
+    if not isinstance(sys.stdin, FluxoRoteado):
+        sys.stdin = FluxoRoteado(sys.stdin)
+
+
+__all__ = ['SessaoIO', 'SessaoPadrao', 'sessao_padrao', 'sessao_atual', 'usar',
+           'na_sessao', 'com_sessao', 'FluxoRoteado', 'instalar_roteamento', 'LIMITE_BUFFER']
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+SHELL.PY - Camada de shell do terminal simulado do RoOt 3voluti0n
+Interpreta a linha de comando com shlex e suporta pipes (|), redirecionamento
+para o VFS (>, >>, <) e listas de comandos (&&, ||, ;).
+
+Os comandos são estágios geradores: cada um recebe um iterador de linhas e
+produz linhas sob demanda, então saídas grandes (logs, dumps) passam pelo
+pipe sem nunca serem montadas inteiras na memória.
+"""
+
+import io
+import re
+import shlex
+import binascii
+import base64 as _base64
+from collections import deque
+
+from utils.capacidades import remover_ansi
+from utils.sessao_io import SessaoIO, usar
+from utils.vfs import ErroVFS, SistemaArquivos
+
+OPERADORES_LISTA = ('&&', '||', ';')
+REDIRECIONAMENTOS = ('>', '>>', '<')
+
+
+class ErroSintaxe(ValueError):
+    """Linha de comando mal formada"""
+
+
+class Comando:
+    """Um estágio de pipeline: argv e redirecionamentos"""
+
+    __slots__ = ('argv', 'saida', 'anexar', 'entrada')
+
+    def __init__(self):
+        self.argv = []
+        self.saida = None
+        self.anexar = False
+        self.entrada = None
+
+    def __repr__(self):
+        return f"<Comando {self.argv!r} > {self.saida!r} < {self.entrada!r}>"
+
+
+# ========== ANÁLISE ==========
+def tokenizar(linha):
+    """Divide a linha em palavras e operadores (respeitando aspas)"""
+    lexer = shlex.shlex(linha, posix=True, punctuation_chars='|&;<>')
+    lexer.whitespace_split = True
+    try:
+        return list(lexer)
+    except ValueError as e:
+        raise ErroSintaxe(f"syntax error: {e}")
+
+
+def analisar(linha):
+    """
+    Converte a linha em [(operador, pipeline), ...], onde operador é o
+    conector com o item anterior (None no primeiro) e pipeline é uma
+    lista de Comando.
+    """
+    resultado = []
+    operador = None
+    pipeline = [Comando()]
+    tokens = iter(tokenizar(linha))
+
+    def fechar_pipeline():
+        for comando in pipeline:
+            if not comando.argv:
+                raise ErroSintaxe("syntax error: missing command")
+        resultado.append((operador, list(pipeline)))
+
+    for token in tokens:
+        if token == '|':
+            if not pipeline[-1].argv:
+                raise ErroSintaxe("syntax error near unexpected token `|'")
+            pipeline.append(Comando())
+        elif token in REDIRECIONAMENTOS:
+            alvo = next(tokens, None)
+            if alvo is None or alvo in OPERADORES_LISTA or alvo in REDIRECIONAMENTOS or alvo == '|':
+                raise ErroSintaxe("syntax error near unexpected token `newline'")
+            if token == '<':
+                pipeline[-1].entrada = alvo
+            else:
+                pipeline[-1].saida = alvo
+                pipeline[-1].anexar = token == '>>'
+        elif token in OPERADORES_LISTA:
+            fechar_pipeline()
+            operador = token
+            pipeline = [Comando()]
+        elif set(token) <= set('|&;<>'):
+            raise ErroSintaxe(f"syntax error near unexpected token `{token}'")
+        else:
+            pipeline[-1].argv.append(token)
+
+    # ';' no final é permitido; linha vazia não gera nada
+    if pipeline[-1].argv or len(pipeline) > 1:
+        fechar_pipeline()
+    elif operador in ('&&', '||'):
+        raise ErroSintaxe("syntax error: unexpected end of file")
+    return resultado
+
+
+# ========== SHELL ==========
+class Shell:
+    """
+    Executor de linhas de comando sobre o VFS.
+
+    `comandos` são os comandos antigos do terminal (func(args) -> bool que
+    imprimem direto); quando entram num pipe a saída deles é capturada e
+    vira linhas. `estagios` são os comandos geradores nativos do shell.
+    """
+
+    def __init__(self, vfs=None, cwd=None, comandos=None, ao_erro=None):
+        self.vfs = vfs if vfs is not None else SistemaArquivos()
+        self._cwd = cwd if cwd is not None else (lambda: self.vfs.home)
+        self.comandos = comandos if comandos is not None else {}
+        self._ao_erro = ao_erro
+        self.encerrado = False
+        self.estagios = {
+            'echo': self._echo,
+            'cat': self._cat,
+            'base64': self._base64,
+            'grep': self._grep,
+            'head': self._head,
+            'tail': self._tail,
+            'wc': self._wc,
+            'sort': self._sort,
+            'uniq': self._uniq,
+        }
+
+    def registrar(self, nome, estagio):
+        """Registra um estágio gerador: estagio(args, entrada) -> iterador de linhas"""
+        self.estagios[nome] = estagio
+
+    def erro(self, mensagem):
+        if self._ao_erro is not None:
+            self._ao_erro(mensagem, "erro")
+        else:
+            print(mensagem)
+
+    # ========== EXECUÇÃO ==========
+    def executar(self, linha, destino=None, coletar=False):
+        """
+        Executa a linha. As linhas de saída final vão para `destino(linha)`
+        (padrão: print); comandos antigos no fim do pipe imprimem direto,
+        a menos que `coletar` peça a saída deles também como linhas.
+        Retorna o status do último pipeline executado.
+        """
+        try:
+            itens = analisar(linha)
+        except ErroSintaxe as e:
+            self.erro(f"bash: {e}")
+            return 2
+
+        status = 0
+        for operador, pipeline in itens:
+            if operador == '&&' and status != 0:
+                continue
+            if operador == '||' and status == 0:
+                continue
+            status = self._executar_pipeline(pipeline, destino, coletar)
+            if self.encerrado:
+                break
+        return status
+
+    def capturar(self, linha):
+        """Executa a linha e retorna (status, linhas de saída)"""
+        linhas = []
+        status = self.executar(linha, destino=linhas.append, coletar=True)
+        return status, linhas
+
+    def _executar_pipeline(self, pipeline, destino, coletar):
+        statuses = [0] * len(pipeline)
+        fluxo = iter(())
+
+        for indice, comando in enumerate(pipeline):
+            if comando.entrada is not None:
+                arquivo = self._ler(comando.entrada)
+                if arquivo is None:
+                    return 1
+                fluxo = arquivo
+            capturar = coletar or indice < len(pipeline) - 1 or comando.saida is not None
+            fluxo = self._com_status(self._estagio(comando, fluxo, capturar), statuses, indice)
+
+        ultimo = pipeline[-1]
+        if ultimo.saida is not None:
+            # O arquivo só é montado aqui, no fim do pipe
+            conteudo = ''.join(f"{linha}\n" for linha in fluxo)
+            try:
+                self.vfs.escrever(ultimo.saida, conteudo, self._cwd(), anexar=ultimo.anexar)
+            except ErroVFS as e:
+                self.erro(f"bash: {e}")
+                return 1
+        else:
+            saida = destino if destino is not None else print
+            for linha in fluxo:
+                saida(linha)
+        return statuses[-1]
+
+    @staticmethod
+    def _com_status(gerador, statuses, indice):
+        """Repassa as linhas e guarda o status (valor de retorno do gerador)"""
+        status = yield from gerador
+        statuses[indice] = status or 0
+
+    def _estagio(self, comando, entrada, capturar):
+        nome, args = comando.argv[0], comando.argv[1:]
+        if nome in self.estagios:
+            return self.estagios[nome](args, entrada)
+        if nome in self.comandos:
+            return self._legado(nome, args, capturar)
+        return self._nao_encontrado(nome)
+
+    def _nao_encontrado(self, nome):
+        self.erro(f"{nome}: command not found")
+        return 127
+        yield  # gerador
+
+    def _legado(self, nome, args, capturar):
+        """Adapta um comando antigo (que imprime) para estágio de pipe"""
+        funcao = self.comandos[nome]
+        if not capturar:
+            continuar = funcao(args)
+        else:
+            # Sessão temporária só desta thread: o sys.stdout do processo não muda
+            buffer = io.StringIO()
+            with usar(SessaoIO(None, buffer)):
+                continuar = funcao(args)
+            buffer.seek(0)
+            for linha in buffer:
+                yield remover_ansi(linha.rstrip('\n'))
+
+        if nome == 'exit' and continuar is False:
+            self.encerrado = True
+        return 0 if continuar is not False else 1
+
+    def _ler(self, caminho, programa='bash'):
+        """Iterador de linhas de um arquivo do VFS (None se não existir); erros levam o nome do programa"""
+        inode = self.vfs.buscar(caminho, self._cwd())
+        if inode is None:
+            self.erro(f"{programa}: {caminho}: No such file or directory")
+            return None
+        if inode.eh_diretorio:
+            self.erro(f"{programa}: {caminho}: Is a directory")
+            return None
+        return (linha.rstrip('\n') for linha in io.StringIO(inode.conteudo))
+
+    # ========== ESTÁGIOS NATIVOS ==========
+    def _echo(self, args, entrada):
+        yield ' '.join(args)
+        return 0
+
+    def _cat(self, args, entrada):
+        if not args:
+            yield from entrada
+            return 0
+        status = 0
+        for caminho in args:
+            if caminho == '-':
+                yield from entrada
+                continue
+            linhas = self._ler(caminho, 'cat')
+            if linhas is None:
+                status = 1
+                continue
+            yield from linhas
+        return status
+
+    def _base64(self, args, entrada):
+        dados = '\n'.join(entrada)
+        if '-d' in args or '--decode' in args:
+            try:
+                decodificado = _base64.b64decode(''.join(dados.split()), validate=True)
+                texto = decodificado.decode('utf-8', errors='replace')
+            except (binascii.Error, ValueError):
+                self.erro("base64: invalid input")
+                return 1
+            yield from texto.splitlines()
+        else:
+            codificado = _base64.b64encode((dados + '\n').encode('utf-8')).decode('ascii')
+            for inicio in range(0, len(codificado), 76):
+                yield codificado[inicio:inicio + 76]
+        return 0
+
+    def _grep(self, args, entrada):
+        opcoes = {a for a in args if a.startswith('-') and len(a) > 1}
+        resto = [a for a in args if a not in opcoes]
+        if not resto:
+            self.erro("grep: missing pattern")
+            return 2
+        padrao, arquivos = resto[0], resto[1:]
+        flags = re.IGNORECASE if '-i' in opcoes else 0
+        try:
+            regex = re.compile(padrao, flags)
+        except re.error:
+            regex = re.compile(re.escape(padrao), flags)
+        inverter = '-v' in opcoes
+        numerar = '-n' in opcoes
+
+        fontes = [entrada] if not arquivos else [self._ler(a, 'grep') or iter(()) for a in arquivos]
+        achou = False
+        for fonte in fontes:
+            for numero, linha in enumerate(fonte, 1):
+                if bool(regex.search(linha)) != inverter:
+                    achou = True
+                    yield f"{numero}:{linha}" if numerar else linha
+        return 0 if achou else 1
+
+    def _quantidade(self, programa, args, padrao=10):
+        """Lê -n N ou -N; N inválido (não inteiro ou negativo) vira erro e None"""
+        for indice, arg in enumerate(args):
+            if arg == '-n' and indice + 1 < len(args):
+                valor, resto = args[indice + 1], args[:indice] + args[indice + 2:]
+                break
+            if arg.startswith('-') and arg[1:].isdigit():
+                return int(arg[1:]), args[:indice] + args[indice + 1:]
+        else:
+            return padrao, args
+        if not valor.isdigit():
+            self.erro(f"{programa}: invalid number of lines: '{valor}'")
+            return None, resto
+        return int(valor), resto
+    
+    def _head(self, args, entrada):
+        quantidade, arquivos = self._quantidade('head', args)
+        if quantidade is None:
+            return 1
+        fonte = self._ler(arquivos[0], 'head') if arquivos else entrada
+        if fonte is None:
+            return 1
+        for indice, linha in enumerate(fonte):
+            if indice >= quantidade:
+                break
+            yield linha
+        return 0
+
+    def _tail(self, args, entrada):
+        quantidade, arquivos = self._quantidade('tail', args)
+        if quantidade is None:
+            return 1
+        fonte = self._ler(arquivos[0], 'tail') if arquivos else entrada
+        if fonte is None:
+            return 1
+        yield from deque(fonte, maxlen=quantidade)
+        return 0
+
+    def _wc(self, args, entrada):
+        linhas = palavras = caracteres = 0
+        for linha in entrada:
+            linhas += 1
+            palavras += len(linha.split())
+            caracteres += len(linha) + 1
+        if '-l' in args:
+            yield str(linhas)
+        elif '-w' in args:
+            yield str(palavras)
+        elif '-c' in args:
+            yield str(caracteres)
+        else:
+            yield f"{linhas:>7} {palavras:>7} {caracteres:>7}"
+        return 0
+
+    def _sort(self, args, entrada):
+        yield from sorted(entrada, reverse='-r' in args)
+        return 0
+
+    def _uniq(self, args, entrada):
+        contar = '-c' in args
+        anterior, repeticoes = None, 0
+        for linha in entrada:
+            if linha == anterior:
+                repeticoes += 1
+                continue
+            if anterior is not None:
+                yield f"{repeticoes:>7} {anterior}" if contar else anterior
+            anterior, repeticoes = linha, 1
+        if anterior is not None:
+            yield f"{repeticoes:>7} {anterior}" if contar else anterior
+        return 0
+
+
+__all__ = ['Shell', 'Comando', 'ErroSintaxe', 'analisar', 'tokenizar']
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+TECLADO.PY - Leitura do teclado sem bloquear, quadro a quadro
+Substitui a thread presa em input() que esperava o ENTER para pular a
+introdução: o descritor da entrada fica registrado num seletor e cada
+quadro da animação pergunta, sem esperar, se chegou uma linha. A espera
+entre quadros também pode ser feita no seletor (`esperar`), e um ENTER
+acorda a animação na hora em vez de no fim da pausa.
+
+O terminal continua no modo canônico (com eco e edição de linha), então
+o seletor só acusa leitura quando uma linha inteira está pronta, e a
+leitura é de um byte por vez até o '\\n': o que foi digitado sem ENTER
+continua no terminal para o próximo input(). Fora do bloco `with`
+nenhum byte é lido.
+"""
+
+import os
+import selectors
+
+from utils.relogio import relogio, dormir
+
+try:
+    import msvcrt  # Windows: o console não funciona com selectors
+except ImportError:
+    msvcrt = None
+
+
+def _descritor(io):
+    try:
+        return io.descritor_entrada()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+class Teclado:
+    """
+    Leitor de ENTER sem bloqueio sobre a entrada de uma sessão (`io`) ou
+    um descritor de arquivo. Sem descritor (sessões de rede, StringIO)
+    fica indisponível e nunca acusa tecla.
+    """
+
+    def __init__(self, io=None, descritor=None):
+        self.descritor = descritor if descritor is not None else _descritor(io)
+        self._seletor = None
+        self._fim = False
+
+    # ========== CICLO DE VIDA ==========
+    def abrir(self):
+        if self.descritor is None or self._seletor is not None or msvcrt is not None:
+            return self
+        seletor = selectors.DefaultSelector()
+        try:
+            seletor.register(self.descritor, selectors.EVENT_READ)
+        except (ValueError, OSError, PermissionError):
+            # Arquivo comum ou descritor inválido: não dá para esperar nele
+            seletor.close()
+            self.descritor = None
+            return self
+        self._seletor = seletor
+        return self
+
+    def fechar(self):
+        if self._seletor is not None:
+            self._seletor.close()
+            self._seletor = None
+
+    def __enter__(self):
+        return self.abrir()
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    @property
+    def disponivel(self):
+        return self._seletor is not None or (msvcrt is not None and self.descritor is not None)
+
+    # ========== LEITURA ==========
+    def _pronto(self, timeout):
+        return bool(self._seletor.select(timeout))
+
+    def _consumir_linha(self):
+        """Lê (byte a byte) a linha disponível; True ao achar '\\n' ou o fim da entrada"""
+        while self._pronto(0):
+            try:
+                byte = os.read(self.descritor, 1)
+            except (BlockingIOError, InterruptedError):
+                return False
+            if not byte:
+                # Fim da entrada (Ctrl+D): conta como ENTER, como o input() da thread antiga
+                self._fim = True
+                self.fechar()
+                return True
+            if byte == b'\n':
+                return True
+        return False
+
+    def _enter_windows(self):
+        while msvcrt.kbhit():
+            if msvcrt.getwch() in '\r\n':
+                return True
+        return False
+
+    def enter_pressionado(self):
+        """True se chegou um ENTER desde a última consulta (não bloqueia)"""
+        if self._fim:
+            return True
+        if msvcrt is not None and self.descritor is not None:
+            return self._enter_windows()
+        if self._seletor is None:
+            return False
+        return self._consumir_linha()
+
+    def esperar(self, segundos):
+        """
+        Pausa de `segundos` (no tempo do jogo) que termina antes se o
+        ENTER chegar. Devolve True se ele chegou.
+        """
+        if self.enter_pressionado():
+            return True
+        if self._seletor is None or relogio.acelerado:
+            dormir(segundos)
+            return self.enter_pressionado()
+        if self._pronto(segundos * relogio.escala):
+            return self._consumir_linha()
+        return False
+
+
+__all__ = ['Teclado']
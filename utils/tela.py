@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+TELA.PY - Renderizador de tela do RoOt 3voluti0n
+Limpa a tela com sequências ANSI (sem criar processos `clear`/`cls`) e
+redesenha menus enviando apenas as linhas que mudaram desde o último quadro.
+"""
+
+import os
+import sys
+import shutil
+
+from utils.capacidades import interativo
+
+# ========== SEQUÊNCIAS ANSI ==========
+CSI = '\033['
+CURSOR_INICIO = CSI + 'H'
+LIMPAR_TELA = CSI + '2J'
+LIMPAR_ROLAGEM = CSI + '3J'
+LIMPAR_ATE_FIM_LINHA = CSI + 'K'
+LIMPAR_ATE_FIM_TELA = CSI + 'J'
+
+
+def posicionar(linha, coluna=1):
+    """Sequência para mover o cursor (linha/coluna começam em 1)"""
+    return f"{CSI}{linha};{coluna}H"
+
+
+def _habilitar_ansi_windows():
+    """Ativa o processamento de sequências VT no console do Windows 10+"""
+    if os.name != 'nt':
+        return
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        modo = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(modo)):
+            kernel32.SetConsoleMode(handle, modo.value | 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except Exception:
+        pass
+
+
+class Tela:
+    """
+    Renderizador com memória do último quadro.
+
+    `limpar()` apaga a tela e esquece o quadro anterior.
+    `renderizar(linhas)` compara com o quadro anterior e reescreve só as
+    linhas alteradas, tudo em uma única escrita. O cursor termina logo
+    abaixo do quadro, pronto para o `input()` do menu.
+    """
+
+    def __init__(self, stream=None):
+        self._stream = stream
+        self._anterior = []
+        _habilitar_ansi_windows()
+
+    def _saida(self):
+        # Resolvido a cada chamada para respeitar redirecionamentos de sys.stdout
+        return self._stream if self._stream is not None else sys.stdout
+
+    def _altura(self):
+        try:
+            return shutil.get_terminal_size().lines
+        except Exception:
+            return 24
+
+    # ========== OPERAÇÕES ==========
+    def invalidar(self):
+        """Esquece o quadro anterior (o próximo renderizar redesenha tudo)"""
+        self._anterior = []
+
+    def limpar(self):
+        """Limpa a tela e o buffer de rolagem sem criar subprocessos"""
+        saida = self._saida()
+        if interativo(saida):
+            saida.write(CURSOR_INICIO + LIMPAR_TELA + LIMPAR_ROLAGEM + CURSOR_INICIO)
+        else:
+            # Em logs, só uma quebra de linha separa as telas
+            saida.write('\n')
+        saida.flush()
+        self._anterior = []
+
+    def renderizar(self, linhas):
+        """Desenha o quadro `linhas`, enviando apenas o que mudou"""
+        if isinstance(linhas, str):
+            linhas = linhas.split('\n')
+        linhas = list(linhas)
+        saida = self._saida()
+
+        # Sem terminal não há cursor endereçável: escreve o quadro inteiro
+        if not interativo(saida):
+            saida.write('\n'.join(linhas) + '\n')
+            saida.flush()
+            self._anterior = []
+            return
+
+        # Quadro maior que a tela rola o terminal e invalida as posições
+        if len(linhas) + 1 >= self._altura():
+            self._anterior = []
+
+        partes = []
+        if not self._anterior:
+            partes.append(CURSOR_INICIO + LIMPAR_TELA + LIMPAR_ROLAGEM + CURSOR_INICIO)
+            partes.append(''.join(linha + LIMPAR_ATE_FIM_LINHA + '\n' for linha in linhas))
+        else:
+            for numero, linha in enumerate(linhas):
+                if numero >= len(self._anterior) or self._anterior[numero] != linha:
+                    partes.append(posicionar(numero + 1) + linha + LIMPAR_ATE_FIM_LINHA)
+            partes.append(posicionar(len(linhas) + 1))
+
+        # Remove sobras do quadro anterior, do prompt e de mensagens de erro
+        partes.append(LIMPAR_ATE_FIM_TELA)
+
+        saida.write(''.join(partes))
+        saida.flush()
+        self._anterior = linhas
+
+
+# Instância compartilhada pelo menu, terminal e capítulos
+tela = Tela()
+
+
+def limpar_tela():
+    """Limpa a tela do terminal (ANSI, sem os.system)"""
+    tela.limpar()
+
+
+__all__ = ['Tela', 'tela', 'limpar_tela', 'posicionar']
@@ -6,7 +6,6 @@ Versão corrigida com função digitar e compatibilidade completa
 
 import os
 import sys
-import time
 import random
 import readline
 import subprocess
@@ -14,6 +13,15 @@ from datetime import datetime
 
 # ========== PALETA DE CORES (importada de utils.colors) ==========
 from utils.colors import C, Cores
+from utils.typewriter import typewriter
+from utils.relogio import dormir
+from utils.tela import tela
+from utils.efeitos import TabelasGlitch
+from utils.capacidades import interativo
+from utils.vfs import SistemaArquivos
+from utils.shell import Shell
+from utils.completador import Completador
+from utils.sessao_io import sessao_atual, na_sessao
 
 # Constantes de status para compatibilidade
 SUCESSO = C.KALI_VERDE + C.NEGRITO
@@ -46,27 +54,12 @@ def digitar(texto, delay=None, velocidade=None, cor=None, fim='\n', pausa_final=
     if pausa_final is None:
         pausa_final = 0.5
 
-    sys.stdout.write(cor)
+    # Escrita agrupada por quadro (um flush por quadro), com reset de cor no final
+    typewriter.digitar(texto, delay=delay, cor=cor, fim=C.RESET + fim, glitch=efeito_sonoro)
+    dormir(pausa_final)
 
-    for caractere in texto:
-        sys.stdout.write(caractere)
-        sys.stdout.flush()
-
-        # Efeito de teclado aleatório (opcional)
-        if efeito_sonoro and caractere not in [' ', '\n', '\t']:
-            if random.random() > 0.7:
-                time.sleep(delay * 0.5)
-                sys.stdout.write('\b')
-                time.sleep(delay * 0.3)
-                sys.stdout.write(caractere)
-                sys.stdout.flush()
-
-        time.sleep(delay)
-
-    # Reset de cor e fim de linha compatível
-    sys.stdout.write(C.RESET + fim)
-    sys.stdout.flush()
-    time.sleep(pausa_final)
+# Ruído pré-calculado para TerminalKali.efeito_glitch
+_glitch_kali = TabelasGlitch("01█▓▒░║╔╗╚╝═╬╩╦╠╣╞╡│┤╢╟╨╧╥╙╘╒╓╫╪┘┌")
 
 # ========== CONFIGURAÇÃO DO TERMINAL ==========
 class TerminalKali:
@@ -74,11 +67,11 @@ class TerminalKali:
     Terminal Kali Linux simulado para o jogo
     """
     
-    def __init__(self, username="root", hostname="kali"):
-        """Inicializa o terminal Kali"""
+    def __init__(self, username="root", hostname="kali", io=None):
+        """Inicializa o terminal Kali (io: sessão de E/S do jogador)"""
         self.username = username
         self.hostname = hostname
-        self.cwd = "~"
+        self.io = io if io is not None else sessao_atual()
         self.historico = []
         self.max_historico = 100
         self.effects_enabled = True
@@ -108,8 +101,29 @@ class TerminalKali:
             'exit': self._cmd_exit,
         }
         
-        # Sistema de arquivos simulado
-        self.filesystem = self._criar_filesystem_simulado()
+        # Sistema de arquivos simulado (VFS com inodes e cache de caminhos)
+        home = "/root" if username == "root" else f"/home/{username}"
+        self.vfs = SistemaArquivos(home)
+        self.vfs.montar(self._criar_filesystem_simulado()['~'], home)
+        self.diretorio_atual = self.vfs.home
+        
+        # Shell com pipes e redirecionamento sobre o VFS
+        self.shell = Shell(self.vfs, lambda: self.diretorio_atual,
+                           self.commands_simulated, self.mostrar_saida)
+        
+        # TAB completa comandos e caminhos (o índice do VFS acompanha cada montagem)
+        self.completador = Completador(self.vfs, lambda: self.diretorio_atual,
+                                       list(self.commands_simulated) + list(self.shell.estagios))
+        self.completador.instalar()
+    
+    @property
+    def cwd(self):
+        """Diretório atual para exibição (home abreviado como '~')"""
+        return self.vfs.exibir(self.diretorio_atual)
+    
+    @cwd.setter
+    def cwd(self, caminho):
+        self.diretorio_atual = self.vfs.normalizar(caminho, self.diretorio_atual)
     
     # ========== SISTEMA DE ARQUIVOS SIMULADO ==========
     def _criar_filesystem_simulado(self):
@@ -171,25 +185,8 @@ class TerminalKali:
     # ========== EFEITOS VISUAIS ==========
     def digitar(self, texto, delay=0.03, cor=C.KALI_BRANCO, efeito_teclado=True):
         """Efeito de digitação com sons de teclado opcionais"""
-        sys.stdout.write(cor)
-        
-        for i, char in enumerate(texto):
-            sys.stdout.write(char)
-            sys.stdout.flush()
-            
-            # Efeito de teclado aleatório
-            if efeito_teclado and self.effects_enabled and char not in ' \t\n':
-                if random.random() > 0.7:
-                    # Pequeno glitch
-                    time.sleep(delay * 0.5)
-                    sys.stdout.write('\b')
-                    time.sleep(delay * 0.3)
-                    sys.stdout.write(char)
-                    sys.stdout.flush()
-            
-            time.sleep(delay)
-        
-        sys.stdout.write(C.RESET)
+        glitch = efeito_teclado and self.effects_enabled
+        typewriter.digitar(texto, delay=delay, cor=cor, fim=C.RESET, glitch=glitch)
     
     def digitar_linha(self, texto, delay=0.03, cor=C.KALI_BRANCO):
         """Digita uma linha completa"""
@@ -199,20 +196,16 @@ class TerminalKali:
     def efeito_glitch(self, texto, repeticoes=2, duracao=0.1):
         """Efeito de glitch hacker"""
         for _ in range(repeticoes):
-            # Texto glitchado
-            chars_glitch = "01█▓▒░║╔╗╚╝═╬╩╦╠╣╞╡│┤╢╟╨╧╥╙╘╒╓╫╪┘┌"
-            glitch_text = ''.join(
-                random.choice(chars_glitch) if random.random() > 0.3 else char 
-                for char in texto
-            )
+            # Texto glitchado (mistura com um quadro do anel de ruído)
+            glitch_text = _glitch_kali.misturar(texto, intensidade=0.7)
             
             sys.stdout.write(f"\r{C.KALI_VERMELHO}{glitch_text}{C.RESET}")
             sys.stdout.flush()
-            time.sleep(duracao * 0.5)
+            dormir(duracao * 0.5)
             
             sys.stdout.write(f"\r{C.KALI_CIANO}{texto}{C.RESET}")
             sys.stdout.flush()
-            time.sleep(duracao * 0.3)
+            dormir(duracao * 0.3)
         
         sys.stdout.write(f"\r{texto}")
         sys.stdout.flush()
@@ -238,23 +231,17 @@ class TerminalKali:
     # ========== COMANDOS SIMULADOS ==========
     def _cmd_ls(self, args):
         """Simula o comando ls"""
-        # Se nenhum argumento, listar diretório atual (~)
+        # Se nenhum argumento, listar diretório atual
         raw = args[0] if args else "."
-        if raw in ['.', './']:
-            path = '~'
-        else:
-            path = self._resolve_path(raw)
-
-        # Usar _find_file para navegar no filesystem simulado
-        contents = self._find_file(path)
+        contents = self._find_file(self._resolve_path(raw))
 
         if contents is None:
-            self.mostrar_saida(f"ls: cannot access '{args[0] if args else '.'}': No such file or directory", "erro")
+            self.mostrar_saida(f"ls: cannot access '{raw}': No such file or directory", "erro")
             return True
 
-        if isinstance(contents, dict):
+        if contents.eh_diretorio:
             # Listar diretório
-            items = sorted(contents.keys())
+            items = self.vfs.listar(contents)
             if not items:
                 return True
 
@@ -267,36 +254,30 @@ class TerminalKali:
                 for j in range(cols):
                     if i + j < len(items):
                         item = items[i + j]
-                        val = contents[item]
-                        cor = C.KALI_CINZA if item.startswith('.') else (C.KALI_AZUL if isinstance(val, dict) else C.KALI_BRANCO)
-                        display = f"{item}/" if isinstance(val, dict) else item
+                        eh_dir = contents.filhos[item].eh_diretorio
+                        cor = C.KALI_CINZA if item.startswith('.') else (C.KALI_AZUL if eh_dir else C.KALI_BRANCO)
+                        display = f"{item}/" if eh_dir else item
                         linha += f"{cor}{display:<{max_len}}{C.RESET}"
                 print(linha)
         else:
             # Arquivo - imprimir conteúdo
-            print(f"{C.KALI_BRANCO}{contents}{C.RESET}")
+            print(f"{C.KALI_BRANCO}{contents.conteudo}{C.RESET}")
         
         return True
     
     def _cmd_cd(self, args):
         """Simula o comando cd"""
-        if not args:
-            self.cwd = "~"
-        else:
-            path = args[0]
-            if path == "..":
-                if self.cwd != "~":
-                    self.cwd = "/".join(self.cwd.split("/")[:-1]) or "~"
-            elif path.startswith("/") or path.startswith("~"):
-                self.cwd = path
-            else:
-                self.cwd = f"{self.cwd}/{path}" if self.cwd != "~" else f"~/{path}"
+        alvo = args[0] if args else "~"
+        destino = self._find_file(self._resolve_path(alvo))
         
-        # Normalizar caminho: apenas colapsar barras duplicadas
-        self.cwd = self.cwd.replace("//", "/").rstrip("/")
-        if not self.cwd:
-            self.cwd = "~"
+        if destino is None:
+            self.mostrar_saida(f"cd: {alvo}: No such file or directory", "erro")
+            return True
+        if not destino.eh_diretorio:
+            self.mostrar_saida(f"cd: {alvo}: Not a directory", "erro")
+            return True
         
+        self.diretorio_atual = self.vfs.caminho_de(destino)
         return True
     
     def _cmd_pwd(self, args):
@@ -311,7 +292,7 @@ class TerminalKali:
     
     def _cmd_clear(self, args):
         """Simula o comando clear"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        tela.limpar()
         return True
     
     def _cmd_cat(self, args):
@@ -327,10 +308,10 @@ class TerminalKali:
         file_content = self._find_file(path)
         
         if file_content:
-            if isinstance(file_content, dict):
+            if file_content.eh_diretorio:
                 self.mostrar_saida(f"cat: {filename}: Is a directory", "erro")
             else:
-                print(f"{C.KALI_BRANCO}{file_content}{C.RESET}")
+                print(f"{C.KALI_BRANCO}{file_content.conteudo}{C.RESET}")
         else:
             self.mostrar_saida(f"cat: {filename}: No such file or directory", "erro")
         
@@ -347,7 +328,7 @@ class TerminalKali:
         print(f"{C.KALI_CINZA}[ Press Ctrl+X to exit ]{C.RESET}")
         
         # Simular edição
-        time.sleep(1)
+        dormir(1)
         print(f"\n{C.KALI_VERDE}File saved successfully.{C.RESET}")
         
         return True
@@ -360,7 +341,7 @@ class TerminalKali:
         
         target = args[0]
         print(f"{C.KALI_CIANO}Connecting to {target} via SSH...{C.RESET}")
-        time.sleep(1)
+        dormir(1)
         
         if "@backup-cloud" in target or "@192.168" in target:
             print(f"{C.KALI_VERDE}Connected to {target}{C.RESET}")
@@ -387,14 +368,19 @@ class TerminalKali:
             return False
 
         print(f"{C.KALI_CIANO}Copying {source} to {dest}...{C.RESET}")
-        time.sleep(0.3)
+        dormir(0.3)
+
+        # Efeito de progresso (sem terminal, só o resultado final)
+        if not interativo():
+            print(f"[{'█' * 10}] 100%")
+            print(f"{C.KALI_VERDE}Transfer completed successfully.{C.RESET}")
+            return True
 
-        # Efeito de progresso
         for i in range(10):
             progress = "█" * (i + 1) + "░" * (9 - i)
             sys.stdout.write(f"\r[{progress}] {((i+1)*10)}%")
             sys.stdout.flush()
-            time.sleep(0.08)
+            dormir(0.08)
 
         print(f"\n{C.KALI_VERDE}Transfer completed successfully.{C.RESET}")
         return True
@@ -407,7 +393,7 @@ class TerminalKali:
         
         target = args[0]
         print(f"{C.KALI_CIANO}Starting Nmap 7.91 scan on {target}{C.RESET}")
-        time.sleep(0.5)
+        dormir(0.5)
         
         # Resultado simulado
         print(f"{C.KALI_BRANCO}Nmap scan report for {target}{C.RESET}")
@@ -423,7 +409,7 @@ class TerminalKali:
     def _cmd_sqlmap(self, args):
         """Simula SQLMap"""
         print(f"{C.KALI_CIANO}Starting sqlmap 1.5.11{C.RESET}")
-        time.sleep(0.5)
+        dormir(0.5)
         
         if "--help" in args or "-h" in args:
             print(f"{C.KALI_BRANCO}Usage: sqlmap [options]{C.RESET}")
@@ -459,7 +445,7 @@ class TerminalKali:
         print(f"{C.KALI_CIANO}PING {target} (8.8.8.8) 56(84) bytes of data.{C.RESET}")
         
         for i in range(4):
-            time.sleep(0.3)
+            dormir(0.3)
             print(f"{C.KALI_BRANCO}64 bytes from {target}: icmp_seq={i+1} ttl=56 time={random.uniform(10, 50):.1f} ms{C.RESET}")
         
         print(f"{C.KALI_CINZA}--- {target} ping statistics ---{C.RESET}")
@@ -473,6 +459,9 @@ class TerminalKali:
         print(f"{C.KALI_CINZA}  ls, cd, pwd, whoami, clear, cat, nano{C.RESET}")
         print(f"{C.KALI_CINZA}  ssh, scp, nmap, sqlmap, ifconfig, ping{C.RESET}")
         print(f"{C.KALI_CINZA}  help, manual, history, exit{C.RESET}")
+        print(f"{C.KALI_BRANCO}Pipe utilities:{C.RESET}")
+        print(f"{C.KALI_CINZA}  echo, base64 [-d], grep [-i -v -n], head, tail, wc, sort, uniq{C.RESET}")
+        print(f"{C.KALI_CINZA}  cmd | cmd, cmd > file, cmd >> file, cmd < file, &&, ||, ;{C.RESET}")
         return True
     
     def _cmd_manual(self, args):
@@ -494,30 +483,12 @@ class TerminalKali:
     
     # ========== UTILIDADES ==========
     def _resolve_path(self, path):
-        """Resolve um caminho relativo para absoluto"""
-        if path.startswith("~"):
-            return path
-        elif path.startswith("/"):
-            return path
-        elif self.cwd == "~":
-            return f"~/{path}"
-        else:
-            return f"{self.cwd}/{path}"
+        """Resolve um caminho relativo para absoluto (normalizado)"""
+        return self.vfs.normalizar(path, self.diretorio_atual)
     
     def _find_file(self, path):
-        """Encontra um arquivo no sistema simulado"""
-        parts = path.strip("/").split("/")
-        
-        current = self.filesystem
-        for part in parts:
-            if part == "~" or part == "":
-                current = self.filesystem.get("~", {})
-            elif part in current:
-                current = current[part]
-            else:
-                return None
-        
-        return current
+        """Encontra um arquivo ou diretório no sistema simulado (Inode ou None)"""
+        return self.vfs.buscar(path, self.diretorio_atual)
     
     def executar_comando(self, comando):
         """Executa um comando no terminal simulado"""
@@ -526,22 +497,18 @@ class TerminalKali:
         if len(self.historico) > self.max_historico:
             self.historico.pop(0)
         
-        # Parse do comando
-        partes = comando.strip().split()
-        if not partes:
-            return True
-        
-        cmd = partes[0]
-        args = partes[1:]
+        # Pipes, redirecionamento e listas (&&, ||, ;) ficam a cargo do shell
+        self.shell.encerrado = False
+        self.shell.executar(comando, self._imprimir_linha)
         
-        # Verificar se é um comando simulado
-        if cmd in self.commands_simulated:
-            return self.commands_simulated[cmd](args)
-        else:
-            # Comando não reconhecido
-            self.mostrar_saida(f"{cmd}: command not found", "erro")
-            return True
+        # Só o exit encerra a sessão
+        return not self.shell.encerrado
     
+    def _imprimir_linha(self, linha):
+        """Saída final de um pipeline"""
+        print(f"{C.KALI_BRANCO}{linha}{C.RESET}")
+    
+    @na_sessao
     def sessao_interativa(self):
         """Inicia uma sessão interativa do terminal"""
         print(f"{C.KALI_AZUL}Kali Linux Terminal v2.0 - Type 'exit' to quit{C.RESET}")
@@ -551,7 +518,7 @@ class TerminalKali:
         while continuar:
             try:
                 # Mostrar prompt e obter comando
-                comando = input(self.prompt()).strip()
+                comando = self.io.ler(self.prompt()).strip()
                 
                 if comando:
                     continuar = self.executar_comando(comando)
@@ -567,7 +534,7 @@ class TerminalKali:
 # ========== FUNÇÕES PÚBLICAS ==========
 def limpar_tela():
     """Limpa a tela do terminal"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    tela.limpar()
 
 def mover_cursor(linha, coluna):
     """Move o cursor para posição específica"""
@@ -629,11 +596,8 @@ def header_kali_v2(titulo="ROOT EVOLUTION", subtitulo=""):
     """
     Exibe um cabeçalho estilizado do Kali Linux v2
     """
-    import os
-    import time
-    
     # Limpar tela
-    os.system('cls' if os.name == 'nt' else 'clear')
+    tela.limpar()
     
     # Cores (usa variável module-level `C`)
     
@@ -667,7 +631,7 @@ def header_kali_v2(titulo="ROOT EVOLUTION", subtitulo=""):
     """
     
     print(header)
-    time.sleep(0.5)
+    dormir(0.5)
 
 
 def prompt_kali(username="root", hostname="kali"):
@@ -683,7 +647,7 @@ def mostrar_banner():
 
 if __name__ == "__main__":
     print(f"{C.KALI_CIANO}Testing Kali Linux Terminal...{C.RESET}")
-    time.sleep(0.5)
+    dormir(0.5)
     
     # Testar função digitar
     digitar("Testando função digitar... ", velocidade=0.05, cor=C.KALI_VERDE)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+TYPEWRITER.PY - Motor de digitação por quadros para RoOt 3voluti0n
+Agrupa os caracteres em uma escrita por quadro (60 fps por padrão), com um
+único flush por quadro, mantendo o mesmo ritmo visual da digitação antiga.
+"""
+
+import sys
+import random
+
+from utils.relogio import agora, dormir
+from utils.capacidades import interativo
+
+FPS_PADRAO = 60
+
+
+class Typewriter:
+    """
+    Efeito de digitação baseado em quadros.
+
+    Em vez de write + flush + sleep por caractere, o texto vira uma linha do
+    tempo (instante, trecho). Tudo que cai dentro do mesmo quadro é escrito
+    de uma vez, e o motor só dorme até o início do próximo quadro.
+    """
+
+    def __init__(self, fps=FPS_PADRAO, stream=None):
+        self.fps = fps
+        self.stream = stream
+
+    def _saida(self):
+        """Stream de saída (resolvido na hora para respeitar redirecionamentos)"""
+        return self.stream if self.stream is not None else sys.stdout
+
+    # ========== LINHA DO TEMPO ==========
+    def linha_do_tempo(self, texto, delay, glitch=False):
+        """
+        Gera eventos (instante, trecho) para o texto.
+
+        O último evento é sempre ('', total) e marca o fim da digitação.
+        Com `glitch`, ~30% dos caracteres visíveis recebem o "erro de teclado"
+        (backspace + reescrita) 0.8 * delay depois de aparecerem.
+        """
+        instante = 0.0
+        for caractere in texto:
+            yield instante, caractere
+
+            # Efeito de teclado aleatório
+            if glitch and caractere not in ' \t\n' and random.random() > 0.7:
+                instante += delay * 0.8
+                yield instante, '\b' + caractere
+
+            instante += delay
+
+        yield instante, ''
+
+    # ========== REPRODUÇÃO ==========
+    def reproduzir(self, eventos, prefixo='', sufixo=''):
+        """Reproduz uma linha do tempo agrupando os trechos por quadro"""
+        saida = self._saida()
+        quadro = 1.0 / self.fps
+        inicio = agora()
+
+        pendente = [prefixo]
+        fim_quadro = quadro
+        ultimo = 0.0
+
+        for instante, trecho in eventos:
+            if instante >= fim_quadro:
+                # Fecha o quadro atual e espera o próximo evento
+                self._descarregar(saida, pendente)
+                self._esperar_ate(inicio + instante)
+                fim_quadro = instante + quadro
+            pendente.append(trecho)
+            ultimo = instante
+
+        # Textos curtos cabem em um quadro: ainda assim respeitar a duração total
+        if agora() < inicio + ultimo:
+            self._descarregar(saida, pendente)
+            self._esperar_ate(inicio + ultimo)
+
+        pendente.append(sufixo)
+        self._descarregar(saida, pendente)
+
+    def digitar(self, texto, delay=0.03, cor='', fim='', glitch=False):
+        """Digita `texto` com a cor e o final indicados"""
+        saida = self._saida()
+        if delay <= 0 or not interativo(saida):
+            # Sem atraso ou sem terminal: uma única escrita
+            saida.write(f"{cor}{texto}{fim}")
+            saida.flush()
+            return
+
+        self.reproduzir(self.linha_do_tempo(texto, delay, glitch), prefixo=cor, sufixo=fim)
+
+    # ========== UTILIDADES ==========
+    @staticmethod
+    def _descarregar(saida, pendente):
+        """Escreve o quadro acumulado com um único flush"""
+        if pendente:
+            saida.write(''.join(pendente))
+            pendente.clear()
+        saida.flush()
+
+    @staticmethod
+    def _esperar_ate(instante):
+        """Dorme até o instante do relógio do jogo (sem acumular deriva)"""
+        restante = instante - agora()
+        if restante > 0:
+            dormir(restante)
+
+
+# Instância compartilhada usada pelas funções de digitação
+typewriter = Typewriter()
+
+__all__ = ['Typewriter', 'typewriter', 'FPS_PADRAO']
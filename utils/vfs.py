@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+VFS.PY - Sistema de arquivos virtual do RoOt 3voluti0n
+Árvore de diretórios indexada por componente (trie), com tabela de inodes,
+ponteiros para o pai, normalização real de caminhos ('.', '..', '~', '//')
+e cache de buscas por caminho absoluto.
+"""
+
+from bisect import bisect_left, insort
+
+# ========== INODES ==========
+class Inode:
+    """Entrada do sistema de arquivos: diretório (filhos) ou arquivo (conteúdo)"""
+
+    __slots__ = ('numero', 'nome', 'pai', 'filhos', 'nomes', 'conteudo')
+
+    def __init__(self, numero, nome, pai, diretorio, conteudo=''):
+        self.numero = numero
+        self.nome = nome
+        self.pai = pai
+        self.filhos = {} if diretorio else None
+        # Nomes dos filhos em ordem, mantidos a cada inserção (listagem e completar)
+        self.nomes = [] if diretorio else None
+        self.conteudo = None if diretorio else conteudo
+
+    @property
+    def eh_diretorio(self):
+        return self.filhos is not None
+
+    def __repr__(self):
+        tipo = 'dir' if self.eh_diretorio else 'arquivo'
+        return f"<Inode {self.numero} {tipo} {self.nome!r}>"
+
+
+class ErroVFS(Exception):
+    """Erro de operação no sistema de arquivos virtual (mensagem no estilo do shell)"""
+
+
+class SistemaArquivos:
+    """
+    Sistema de arquivos virtual.
+
+    Caminhos absolutos normalizados (ex: '/root/Private') são a chave do
+    cache de buscas; a exibição usa '~' para o diretório home.
+    """
+
+    def __init__(self, home='/root'):
+        self._inodes = []
+        self._cache = {}
+        self.raiz = self._novo_inode('/', None, diretorio=True)
+        self.raiz.pai = self.raiz
+        self.home = self.normalizar(home)
+        self.criar_diretorio(self.home)
+
+    def _novo_inode(self, nome, pai, diretorio, conteudo=''):
+        inode = Inode(len(self._inodes), nome, pai, diretorio, conteudo)
+        self._inodes.append(inode)
+        return inode
+
+    def inode(self, numero):
+        """Inode pelo número"""
+        return self._inodes[numero]
+
+    def __len__(self):
+        return len(self._inodes)
+
+    # ========== CAMINHOS ==========
+    def normalizar(self, caminho, cwd='/'):
+        """Caminho absoluto normalizado ('~' expandido, '.' e '..' resolvidos)"""
+        if caminho == '~' or caminho.startswith('~/'):
+            caminho = self.home + caminho[1:]
+        elif not caminho.startswith('/'):
+            caminho = f"{cwd}/{caminho}"
+
+        partes = []
+        for parte in caminho.split('/'):
+            if parte in ('', '.'):
+                continue
+            if parte == '..':
+                if partes:
+                    partes.pop()
+                continue
+            partes.append(parte)
+        return '/' + '/'.join(partes)
+
+    def caminho_de(self, inode):
+        """Caminho absoluto de um inode (subindo pelos pais)"""
+        partes = []
+        while inode is not self.raiz:
+            partes.append(inode.nome)
+            inode = inode.pai
+        return '/' + '/'.join(reversed(partes))
+
+    def exibir(self, caminho):
+        """Caminho para exibição, com o home abreviado como '~'"""
+        if caminho == self.home:
+            return '~'
+        if caminho.startswith(self.home + '/'):
+            return '~' + caminho[len(self.home):]
+        return caminho
+
+    # ========== BUSCA ==========
+    def buscar(self, caminho, cwd='/'):
+        """Inode do caminho, ou None se não existir"""
+        absoluto = self.normalizar(caminho, cwd)
+        inode = self._cache.get(absoluto)
+        if inode is not None:
+            return inode
+
+        inode = self.raiz
+        for parte in absoluto.split('/'):
+            if not parte:
+                continue
+            if not inode.eh_diretorio:
+                return None
+            inode = inode.filhos.get(parte)
+            if inode is None:
+                return None
+
+        self._cache[absoluto] = inode
+        return inode
+
+    def listar(self, inode):
+        """Nomes das entradas de um diretório, em ordem"""
+        return list(inode.nomes) if inode.eh_diretorio else [inode.nome]
+
+    def com_prefixo(self, inode, prefixo):
+        """Nomes das entradas do diretório que começam com `prefixo` (busca binária)"""
+        if not inode.eh_diretorio:
+            return []
+        nomes = inode.nomes
+        resultado = []
+        for indice in range(bisect_left(nomes, prefixo), len(nomes)):
+            if not nomes[indice].startswith(prefixo):
+                break
+            resultado.append(nomes[indice])
+        return resultado
+
+    # ========== ESCRITA ==========
+    def _filho(self, pai, nome, diretorio, conteudo=''):
+        existente = pai.filhos.get(nome)
+        if existente is not None:
+            return existente
+        inode = self._novo_inode(nome, pai, diretorio, conteudo)
+        pai.filhos[nome] = inode
+        insort(pai.nomes, nome)
+        return inode
+
+    def criar_diretorio(self, caminho, cwd='/'):
+        """Cria o diretório e os pais que faltarem (mkdir -p)"""
+        absoluto = self.normalizar(caminho, cwd)
+        inode = self.raiz
+        for parte in absoluto.split('/'):
+            if not parte:
+                continue
+            inode = self._filho(inode, parte, diretorio=True)
+            if not inode.eh_diretorio:
+                raise ErroVFS(f"{caminho}: Not a directory")
+        return inode
+
+    def escrever(self, caminho, conteudo, cwd='/', anexar=False):
+        """Cria ou sobrescreve (ou anexa a) um arquivo; o diretório pai deve existir"""
+        absoluto = self.normalizar(caminho, cwd)
+        diretorio, _, nome = absoluto.rpartition('/')
+        pai = self.buscar(diretorio or '/')
+        if pai is None or not pai.eh_diretorio:
+            raise ErroVFS(f"{caminho}: No such file or directory")
+        if not nome:
+            raise ErroVFS(f"{caminho}: Is a directory")
+
+        inode = pai.filhos.get(nome)
+        if inode is None:
+            inode = self._filho(pai, nome, diretorio=False, conteudo=conteudo)
+        elif inode.eh_diretorio:
+            raise ErroVFS(f"{caminho}: Is a directory")
+        elif anexar:
+            inode.conteudo += conteudo
+        else:
+            inode.conteudo = conteudo
+        return inode
+
+    def remover(self, caminho, cwd='/'):
+        """Remove um arquivo ou diretório (com tudo dentro)"""
+        inode = self.buscar(caminho, cwd)
+        if inode is None or inode is self.raiz:
+            raise ErroVFS(f"{caminho}: No such file or directory")
+        del inode.pai.filhos[inode.nome]
+        inode.pai.nomes.remove(inode.nome)
+        # Caminhos em cache podem apontar para a subárvore removida
+        self._cache.clear()
+
+    def montar(self, arvore, destino='/', cwd='/'):
+        """
+        Importa uma árvore aninhada {nome: dict (diretório) | str (arquivo)}
+        sob `destino`. Iterativo, para aguentar árvores com milhares de arquivos.
+        """
+        base = self.criar_diretorio(destino, cwd)
+        pendentes = [(base, arvore)]
+        while pendentes:
+            pai, conteudo = pendentes.pop()
+            for nome, valor in conteudo.items():
+                if isinstance(valor, dict):
+                    filho = self._filho(pai, nome, diretorio=True)
+                    if not filho.eh_diretorio:
+                        raise ErroVFS(f"{self.caminho_de(filho)}: Not a directory")
+                    pendentes.append((filho, valor))
+                else:
+                    inode = self._filho(pai, nome, diretorio=False, conteudo=str(valor))
+                    if not inode.eh_diretorio:
+                        inode.conteudo = str(valor)
+        return base
+
+
+__all__ = ['Inode', 'SistemaArquivos', 'ErroVFS']